@@ -0,0 +1,132 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import io
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (핸들러 모듈, 첫 요청 이벤트) - 검증 오류 경로가 있는 핸들러는 그 경로로 호출
+HANDLERS = [
+    ('placeholder_hotplace.get_hotplace_all_gu', {'queryStringParameters': {}}),
+    ('placeholder_hotplace.get_hotplace_all_gu_batch', {'queryStringParameters': {}}),
+    ('placeholder_hotplace.get_hotplace_gu_cafe', {'queryStringParameters': {}}),
+    ('placeholder_hotplace.get_hotplace_gu_enter', {'queryStringParameters': {'gu': '강남구'}}),
+    ('placeholder_hotplace.get_hotplace_gu_restaurant', {'queryStringParameters': {'gu': '강남구'}}),
+    ('placeholder_hotplace.get_hotplace_detail', {'queryStringParameters': {'hotplacePartitionKey': '강남구', 'hotplaceSortKey': '1'}}),
+    ('placeholder_hotplace.get_hotplace_parkinglot', {'queryStringParameters': {}}),
+    ('placeholder_hotplace.get_hotplace_congestion_history', {'queryStringParameters': {}}),
+    ('placeholder_member.get_member_info', {'queryStringParameters': {'memberId': '1'}}),
+    ('placeholder_member.post_member_start', {'queryStringParameters': {}}),
+    ('placeholder_member.get_member_course_id', {'queryStringParameters': {'memberId': '1'}}),
+    ('placeholder_member.get_member_course_history', {'queryStringParameters': {}}),
+    ('placeholder_member.get_member_course_detail', {'queryStringParameters': {'memberId': '1'}}),
+    ('placeholder_member.get_member_course_realtime', {'queryStringParameters': {}}),
+    ('placeholder_course.stop_course', {'queryStringParameters': {'memberId': '1'}}),
+    ('placeholder_course.create_course', {'body': '{}'}),
+    ('placeholder_course.create_course_id', {'body': '{}'}),
+    ('placeholder_common.router', {'resource': '/course/write/membercourse/pause', 'httpMethod': 'POST', 'queryStringParameters': {}}),
+]
+
+# 새 프로세스(= 콜드 스타트)에서 import부터 첫 응답까지 시간을 잼
+# warm-up을 켜면 import 뒤 {"warmup": true} 호출을 먼저 하고, 첫 실제 요청 시간(request)만 따로 잼
+CHILD = '''
+import importlib, json, sys, time
+start = time.perf_counter()
+module = importlib.import_module(sys.argv[1])
+imported = time.perf_counter()
+warmed = imported
+if sys.argv[3] == '1':
+    module.handler({'warmup': True}, None)
+    warmed = time.perf_counter()
+response = module.handler(json.loads(sys.argv[2]), None)
+done = time.perf_counter()
+status = response.get('statusCode') if isinstance(response, dict) else None
+print(json.dumps({'import': imported - start, 'warmup': warmed - imported, 'request': done - warmed, 'first_response': done - start, 'status': status}))
+'''
+
+def child_env():
+    env = dict(os.environ)
+    env.update({
+        'AWS_DEFAULT_REGION': 'ap-northeast-2',
+        'AWS_ACCESS_KEY_ID': 'benchmark',
+        'AWS_SECRET_ACCESS_KEY': 'benchmark',
+        'AWS_EC2_METADATA_DISABLED': 'true',
+        # AWS 호출은 닫힌 로컬 포트로 보내 한 번에 실패하게 함 (네트워크 시간 제외)
+        'AWS_ENDPOINT_URL': 'http://127.0.0.1:9',
+        'AWS_MAX_ATTEMPTS': '1',
+        'AWS_RETRY_MODE': 'standard',
+        'GOOGLE_API_KEY': 'benchmark',
+        'KAKAO_API_KEY': 'benchmark',
+        'PYTHONDONTWRITEBYTECODE': '1',
+    })
+    return env
+
+def measure(root, module, event, runs, warmup=False):
+    if not os.path.exists(os.path.join(root, *module.split('.')) + '.py'):
+        return None
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-c', CHILD, module, json.dumps(event), '1' if warmup else '0'],
+            cwd=root, env=child_env(), capture_output=True, text=True, timeout=120
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f'{module} failed:\n{result.stderr}')
+        samples.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    return {
+        'import': statistics.median(s['import'] for s in samples) * 1000,
+        'warmup': statistics.median(s['warmup'] for s in samples) * 1000,
+        'request': statistics.median(s['request'] for s in samples) * 1000,
+        'first_response': statistics.median(s['first_response'] for s in samples) * 1000,
+        'status': samples[-1]['status'],
+    }
+
+def export_ref(ref, target):
+    archive = subprocess.run(['git', 'archive', ref], cwd=ROOT, capture_output=True, check=True).stdout
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(target)
+
+def fmt(result):
+    if result is None:
+        return f"{'-':>9} {'-':>9}"
+    return f"{result['import']:>9.1f} {result['first_response']:>9.1f}"
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure import-to-first-response time of every handler in a fresh interpreter.')
+    parser.add_argument('--runs', type=int, default=5, help='cold starts per handler (median is reported)')
+    parser.add_argument('--compare', metavar='REF', help='git ref to measure as "before" (e.g. a commit before the lazy runtime)')
+    parser.add_argument('--warmup', action='store_true', help='compare the first real request without and with a preceding {"warmup": true} invocation')
+    args = parser.parse_args()
+    if args.warmup and args.compare:
+        parser.error('--warmup and --compare cannot be combined')
+
+    if args.warmup:
+        # 콜드 경로 중 warm-up으로 실제 요청에서 빠지는 시간 (request 차이)
+        print(f"{'handler':<48} {'no warm-up':>9}   {'with warm-up':>19}")
+        print(f"{'':<48} {'request':>9}   {'warmup':>9} {'request':>9}  (ms)")
+        for module, event in HANDLERS:
+            cold = measure(ROOT, module, event, args.runs)
+            warm = measure(ROOT, module, event, args.runs, warmup=True)
+            if cold is None:
+                continue
+            print(f"{module:<48} {cold['request']:>9.1f}   {warm['warmup']:>9.1f} {warm['request']:>9.1f}  status={warm['status']}")
+        return
+
+    with tempfile.TemporaryDirectory() as before_root:
+        if args.compare:
+            export_ref(args.compare, before_root)
+
+        print(f"{'handler':<48} {'before':>19}   {'after':>19}")
+        print(f"{'':<48} {'import':>9} {'first':>9}   {'import':>9} {'first':>9}  (ms)")
+        for module, event in HANDLERS:
+            before = measure(before_root, module, event, args.runs) if args.compare else None
+            after = measure(ROOT, module, event, args.runs)
+            print(f"{module:<48} {fmt(before)}   {fmt(after)}  status={after['status'] if after else '-'}")
+
+if __name__ == '__main__':
+    main()
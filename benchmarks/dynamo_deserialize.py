@@ -0,0 +1,78 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from boto3.dynamodb.types import TypeDeserializer
+from placeholder_common import dynamo
+from placeholder_hotplace.get_hotplace_gu_cafe import PLACE_ATTRIBUTES
+
+def wire_items(count, seed=0):
+    # query 응답의 Items와 같은 저수준 형식 (핸들러가 쓰지 않는 속성 포함)
+    rng = random.Random(seed)
+    return [
+        {
+            'hotplace_partition_key': {'S': '강남구'},
+            'hotplace_sort_key': {'S': f'Place#{rng.randint(10000000, 2000000000)}'},
+            'name': {'S': f'강남 장소 {i}'},
+            'area_cd': {'S': f'POI{rng.randint(1, 120):03d}'},
+            'mapx': {'N': f'127.{rng.randint(0, 99999999):08d}'},
+            'mapy': {'N': f'37.{rng.randint(0, 99999999):08d}'},
+            'category_group_name': {'S': '카페'},
+            'address_name': {'S': f'서울 강남구 역삼동 {rng.randint(1, 999)}'},
+            'rating': {'N': f'{rng.randint(10, 50) / 10}'},
+            'imageurl': {'S': f'https://img1.kakaocdn.net/cthumb/local/{i}.jpg'},
+            'placeurl': {'S': f'http://place.map.kakao.com/{i}'},
+            'menu': {'L': [{'S': f'메뉴 {j}'} for j in range(rng.randint(0, 6))]},
+            'keyword': {'L': [{'S': f'키워드{j}'} for j in range(rng.randint(0, 4))]},
+            'phone': {'S': '02-000-0000'},
+            'review_count': {'N': str(rng.randint(0, 3000))},
+            'opening_hours': {'M': {d: {'S': '10:00-22:00'} for d in ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')}},
+        }
+        for i in range(count)
+    ]
+
+def resource_path(items):
+    # Table 리소스: 모든 속성을 Decimal로 변환한 뒤 핸들러가 str()로 다시 바꿈
+    deserializer = TypeDeserializer()
+    rows = [{k: deserializer.deserialize(v) for k, v in item.items()} for item in items]
+    return [dict(row, mapx=str(row['mapx']), mapy=str(row['mapy']), rating=str(row['rating'])) for row in rows]
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+def main():
+    parser = argparse.ArgumentParser(description='Deserialization cost per 1,000 DynamoDB items: Table resource vs placeholder_common.dynamo.')
+    parser.add_argument('--items', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=30)
+    args = parser.parse_args()
+
+    items = wire_items(args.items)
+    before = resource_path(items)
+    after = [dynamo.deserialize_item(item, PLACE_ATTRIBUTES, number=str) for item in items]
+    # 핸들러가 쓰는 속성 값은 같아야 함
+    assert all(a == {k: b[k] for k in PLACE_ATTRIBUTES} for a, b in zip(after, before))
+
+    cases = [
+        ('TypeDeserializer + str(Decimal) (before)', lambda: resource_path(items)),
+        ('dynamo, all attributes, int/float', lambda: [dynamo.deserialize_item(item) for item in items]),
+        ('dynamo, PLACE_ATTRIBUTES, number=str', lambda: [dynamo.deserialize_item(item, PLACE_ATTRIBUTES, number=str) for item in items]),
+    ]
+    print(f'{args.items} items, median of {args.repeat}, ms per 1,000 items')
+    baseline = None
+    for name, fn in cases:
+        ms = timed(fn, args.repeat) * 1000 / args.items
+        baseline = baseline or ms
+        print(f'{name:<44} {ms:>8.2f} ms  {baseline / ms:>5.1f}x')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,229 @@
+import argparse
+import concurrent.futures
+import copy
+import importlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from placeholder_hotplace.get_hotplace_all_gu_batch import SEOUL_GU
+
+EVENTS_DIR = os.path.join(ROOT, 'events')
+
+# (이름, 핸들러 모듈, 메서드, 경로, events/ 템플릿) - 경로는 template.yaml과 같음
+ENDPOINTS = [
+    ('hotplace_all', 'placeholder_hotplace.get_hotplace_all_gu', 'GET', '/hotplace/read/all', 'gu.json'),
+    ('hotplace_all_batch', 'placeholder_hotplace.get_hotplace_all_gu_batch', 'GET', '/hotplace/read/all/batch', 'gu_batch.json'),
+    ('hotplace_restaurant', 'placeholder_hotplace.get_hotplace_gu_restaurant', 'GET', '/hotplace/read/restaurant', 'gu.json'),
+    ('hotplace_cafe', 'placeholder_hotplace.get_hotplace_gu_cafe', 'GET', '/hotplace/read/cafe', 'gu.json'),
+    ('hotplace_enter', 'placeholder_hotplace.get_hotplace_gu_enter', 'GET', '/hotplace/read/enter', 'gu.json'),
+    ('hotplace_parkinglot', 'placeholder_hotplace.get_hotplace_parkinglot', 'GET', '/hotplace/read/parkinglot/', 'gu.json'),
+    ('hotplace_detail', 'placeholder_hotplace.get_hotplace_detail', 'GET', '/hotplace/read/detail', 'detail.json'),
+    ('hotplace_congestion_history', 'placeholder_hotplace.get_hotplace_congestion_history', 'GET', '/hotplace/read/congestion/history', 'congestion_history.json'),
+    ('member_info', 'placeholder_member.get_member_info', 'GET', '/course/read/member', 'member.json'),
+    ('member_start', 'placeholder_member.post_member_start', 'POST', '/course/write/member/location', 'member_start.json'),
+    ('member_course_all', 'placeholder_member.get_member_course_id', 'GET', '/course/read/membercourse/all', 'member.json'),
+    ('member_course_history', 'placeholder_member.get_member_course_history', 'GET', '/course/read/membercourse/history', 'member.json'),
+    ('member_course_detail', 'placeholder_member.get_member_course_detail', 'GET', '/course/read/membercourse/detail', 'member.json'),
+    ('member_course_realtime', 'placeholder_member.get_member_course_realtime', 'GET', '/course/read/membercourse/realtime', 'member.json'),
+    ('course_pause', 'placeholder_course.stop_course', 'POST', '/course/write/membercourse/pause', 'member.json'),
+    ('course_create', 'placeholder_course.create_course', 'POST', '/course/write/membercourse/write', 'course_create.json'),
+    ('course_create_id', 'placeholder_course.create_course_id', 'POST', '/course/write/membercourse/', 'course_create_id.json'),
+]
+ADDRESSES = [
+    '서울특별시 서초구 서초동 반포대로22길 17',
+    '서울특별시 강남구 역삼동 테헤란로 152',
+    '서울특별시 마포구 서교동 양화로 160',
+    '서울특별시 종로구 세종로 세종대로 175',
+    '서울특별시 송파구 잠실동 올림픽로 240'
+]
+
+def load_templates():
+    templates = {}
+    for name in {endpoint[4] for endpoint in ENDPOINTS}:
+        with open(os.path.join(EVENTS_DIR, name), encoding='utf-8') as f:
+            templates[name] = json.load(f)
+    return templates
+
+def fill(values, pools, rng):
+    # 템플릿 값 중 gu, 회원, 장소 id, 주소를 무작위 값으로 바꿈
+    places = rng.sample(pools['placeId'], min(5, len(pools['placeId'])))
+    for key in values:
+        if key in ('gu', 'hotplacePartitionKey'):
+            # 배치 템플릿의 'all'은 그대로 둠
+            if values[key] != 'all':
+                values[key] = rng.choice(pools['gu'])
+        elif key == 'memberId':
+            values[key] = rng.choice(pools['memberId'])
+        elif key == 'hotplaceSortKey':
+            values[key] = rng.choice(pools['placeId'])
+        elif key.startswith('course') and key[6:].isdigit():
+            values[key] = places[(int(key[6:]) - 1) % len(places)]
+        elif key == 'address':
+            values[key] = rng.choice(pools['address'])
+    return values
+
+def build_event(endpoint, templates, pools, rng):
+    name, _, method, path, template = endpoint
+    event = copy.deepcopy(templates[template])
+    event['httpMethod'] = method
+    event['path'] = path
+    event['resource'] = path
+    event['requestContext'] = {'httpMethod': method, 'path': path, 'requestId': f'load-{rng.getrandbits(64):016x}'}
+    if event.get('queryStringParameters'):
+        fill(event['queryStringParameters'], pools, rng)
+    if event.get('body'):
+        event['body'] = json.dumps(fill(json.loads(event['body']), pools, rng), ensure_ascii=False)
+    return event
+
+# 워커 상태 (스레드 풀은 공유, 프로세스 풀은 프로세스마다 하나)
+_worker = {}
+
+def init_worker(target, seed_fakes, via_router=False):
+    # 핸들러 로그(EMF 줄 등)는 결과 출력과 섞이지 않게 버림
+    sys.stdout = open(os.devnull, 'w')
+    if target == 'inprocess':
+        from tests import fakes
+        backend = fakes.OfflineBackend(**seed_fakes)
+        backend.__enter__()
+        _worker['backend'] = backend
+        _worker['modules'] = {endpoint[0]: importlib.import_module(endpoint[1]) for endpoint in ENDPOINTS}
+        if via_router:
+            # 라우터 프로필: 모든 요청을 placeholder_common.router로 보냄
+            from placeholder_common import router
+            _worker['modules'] = {endpoint[0]: router for endpoint in ENDPOINTS}
+    else:
+        import requests
+        _worker['session'] = threading.local()
+        _worker['requests'] = requests
+
+def http_session():
+    local = _worker['session']
+    if not hasattr(local, 'session'):
+        local.session = _worker['requests'].Session()
+    return local.session
+
+def run_one(target, name, event):
+    start = time.perf_counter()
+    try:
+        if target == 'inprocess':
+            response = _worker['modules'][name].handler(event, None)
+            status = response.get('statusCode')
+        else:
+            response = http_session().request(
+                event['httpMethod'], target.rstrip('/') + event['path'],
+                params=event.get('queryStringParameters'), data=(event.get('body') or '').encode('utf-8') or None,
+                headers=event.get('headers'), timeout=150
+            )
+            status = response.status_code
+    except Exception:
+        status = None
+    return name, status, (time.perf_counter() - start) * 1000
+
+def in_process_pools(seed):
+    from tests import fakes
+    _, _, _, place_ids = fakes.seed_items(seed)
+    return {
+        'gu': [fakes.GU],
+        'memberId': [fakes.READER_ID, fakes.WRITER_ID, fakes.STARTER_ID],
+        'placeId': place_ids,
+        'address': ADDRESSES
+    }
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def report(results, wall):
+    by_endpoint = {}
+    for name, status, ms in results:
+        by_endpoint.setdefault(name, []).append((status, ms))
+    print(f"{'endpoint':<24} {'count':>6} {'2xx':>5} {'4xx':>5} {'err':>5} {'rps':>8} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}  (ms)")
+    rows = list(by_endpoint.items()) + [('total', [(s, ms) for _, s, ms in results])]
+    for name, samples in rows:
+        latencies = [ms for _, ms in samples]
+        ok = sum(1 for s, _ in samples if s is not None and s < 400)
+        client = sum(1 for s, _ in samples if s is not None and 400 <= s < 500)
+        errors = len(samples) - ok - client
+        print(f"{name:<24} {len(samples):>6} {ok:>5} {client:>5} {errors:>5} {len(samples) / wall:>8.1f} "
+              f"{percentile(latencies, 50):>8.1f} {percentile(latencies, 90):>8.1f} {percentile(latencies, 99):>8.1f} {max(latencies):>8.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay events/ templates against the handlers in-process or against sam local start-api.')
+    parser.add_argument('--target', default='inprocess', help="'inprocess' (offline fakes) or a base URL such as http://127.0.0.1:3000")
+    parser.add_argument('--requests', type=int, default=300, help='total requests, spread over the selected endpoints')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--pool', choices=('thread', 'process'), default='thread')
+    parser.add_argument('--endpoints', nargs='*', help='endpoint names to include (default: all)')
+    parser.add_argument('--gu', nargs='*', help='gu values to pick from (default: seeded gu in-process, all of Seoul over HTTP)')
+    parser.add_argument('--member-id', nargs='*', help='member ids to pick from')
+    parser.add_argument('--place-id', nargs='*', help='place ids to pick from')
+    parser.add_argument('--bedrock-latency-ms', type=float, default=50)
+    parser.add_argument('--google-latency-ms', type=float, default=5)
+    parser.add_argument('--kakao-latency-ms', type=float, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--via-router', action='store_true', help='in-process only: dispatch every request through placeholder_common.router')
+    args = parser.parse_args()
+
+    endpoints = [e for e in ENDPOINTS if not args.endpoints or e[0] in args.endpoints]
+    if not endpoints:
+        parser.error('no endpoints selected')
+    if args.target == 'inprocess':
+        pools = in_process_pools(args.seed)
+    else:
+        templates = load_templates()
+        pools = {
+            'gu': SEOUL_GU,
+            'memberId': sorted({templates[t]['queryStringParameters']['memberId'] for t in ('member.json', 'member_start.json')}),
+            'placeId': [templates['detail.json']['queryStringParameters']['hotplaceSortKey']]
+                       + [v for k, v in json.loads(templates['course_create_id.json']['body']).items() if k.startswith('course')],
+            'address': ADDRESSES
+        }
+    for key, override in (('gu', args.gu), ('memberId', args.member_id), ('placeId', args.place_id)):
+        if override:
+            pools[key] = override
+
+    rng = random.Random(args.seed)
+    templates = load_templates()
+    plan = []
+    for i in range(args.requests):
+        endpoint = endpoints[i % len(endpoints)]
+        plan.append((endpoint[0], build_event(endpoint, templates, pools, rng)))
+    rng.shuffle(plan)
+
+    fake_latency = {
+        'bedrock_latency_ms': args.bedrock_latency_ms,
+        'google_latency_ms': args.google_latency_ms,
+        'kakao_latency_ms': args.kakao_latency_ms,
+        'seed': args.seed
+    }
+    stdout = sys.stdout
+    if args.pool == 'process':
+        executor = concurrent.futures.ProcessPoolExecutor(args.concurrency, initializer=init_worker, initargs=(args.target, fake_latency, args.via_router))
+    else:
+        init_worker(args.target, fake_latency, args.via_router)
+        executor = concurrent.futures.ThreadPoolExecutor(args.concurrency)
+    try:
+        with executor:
+            # 워커 준비(프로세스 풀의 가짜 백엔드 시드 등)는 측정에서 뺌
+            list(executor.map(run_one, [args.target] * args.concurrency, *zip(*plan[:args.concurrency])))
+            start = time.perf_counter()
+            results = list(executor.map(run_one, [args.target] * len(plan), *zip(*plan)))
+            wall = time.perf_counter() - start
+    finally:
+        sys.stdout = stdout
+        if 'backend' in _worker:
+            _worker.pop('backend').__exit__(None, None, None)
+
+    print(f'{len(results)} requests, {args.concurrency} {args.pool} workers, target={args.target}, {wall:.2f} s')
+    report(results, wall)
+
+if __name__ == '__main__':
+    main()
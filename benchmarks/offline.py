@@ -0,0 +1,276 @@
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests import fakes
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'offline_baseline.json')
+LATENCY_TOLERANCE = 0.5  # p95가 기준보다 50% 넘게 느려지면 회귀
+LATENCY_FLOOR_MS = 15.0  # 아주 빠른 핸들러의 잡음은 무시 (수 ms 핸들러는 GC/스케줄링만으로 두 배가 됨)
+RCU_TOLERANCE = 0.1
+STATUS_TOLERANCE = 0.05  # 상태 코드 비율 차이 허용치
+
+# (이름, 핸들러 모듈, 이벤트) - 쓰기 핸들러는 조회용 회원과 다른 회원을 씀
+SCENARIOS = [
+    ('hotplace_all_gu', 'placeholder_hotplace.get_hotplace_all_gu', {'queryStringParameters': {'gu': fakes.GU}}),
+    ('hotplace_all_gu_batch', 'placeholder_hotplace.get_hotplace_all_gu_batch', {'queryStringParameters': {'gu': 'all'}}),
+    ('hotplace_gu_cafe', 'placeholder_hotplace.get_hotplace_gu_cafe', {'queryStringParameters': {'gu': fakes.GU}}),
+    ('hotplace_gu_enter', 'placeholder_hotplace.get_hotplace_gu_enter', {'queryStringParameters': {'gu': fakes.GU}}),
+    ('hotplace_gu_restaurant', 'placeholder_hotplace.get_hotplace_gu_restaurant', {'queryStringParameters': {'gu': fakes.GU}}),
+    ('hotplace_detail', 'placeholder_hotplace.get_hotplace_detail', None),
+    ('hotplace_parkinglot', 'placeholder_hotplace.get_hotplace_parkinglot', {'queryStringParameters': {'gu': fakes.GU}}),
+    ('record_congestion_history', 'placeholder_hotplace.record_congestion_history', {'gu': [fakes.GU]}),
+    ('hotplace_congestion_history', 'placeholder_hotplace.get_hotplace_congestion_history', {'queryStringParameters': {'gu': fakes.GU, 'areaCd': 'POI001', 'view': 'typical'}}),
+    ('member_info', 'placeholder_member.get_member_info', {'queryStringParameters': {'memberId': fakes.READER_ID}}),
+    ('member_start', 'placeholder_member.post_member_start', {'queryStringParameters': {'memberId': fakes.STARTER_ID, 'address': '서울특별시 서초구 서초동 반포대로22길 17'}}),
+    ('member_course_id', 'placeholder_member.get_member_course_id', {'queryStringParameters': {'memberId': fakes.READER_ID}}),
+    ('member_course_history', 'placeholder_member.get_member_course_history', {'queryStringParameters': {'memberId': fakes.READER_ID}}),
+    ('member_course_detail', 'placeholder_member.get_member_course_detail', {'queryStringParameters': {'memberId': fakes.READER_ID}}),
+    ('member_course_realtime', 'placeholder_member.get_member_course_realtime', {'queryStringParameters': {'memberId': fakes.READER_ID}}),
+    ('create_course', 'placeholder_course.create_course', {'body': json.dumps({
+        'memberId': fakes.READER_ID, 'gu': fakes.GU,
+        'parameter1': 'SNS 자랑하기 좋은', 'parameter2': '대화하기 좋은', 'parameter3': '다이어트 실패 하기 좋은'
+    }, ensure_ascii=False)}),
+    # 미리 계산된 추천이 없을 때 (Bedrock 호출 경로)
+    ('create_course_miss', 'placeholder_course.create_course', {'body': json.dumps({
+        'memberId': fakes.READER_ID, 'gu': fakes.GU,
+        'parameter1': 'SNS 자랑하기 좋은', 'parameter2': '대화하기 좋은', 'parameter3': '다이어트 실패 하기 좋은'
+    }, ensure_ascii=False)}),
+    # 타임아웃 뒤 같은 Idempotency-Key로 다시 보낸 요청 (저장된 응답을 돌려줌)
+    ('create_course_retry', 'placeholder_course.create_course', {'headers': {'Idempotency-Key': 'offline-retry'}, 'body': json.dumps({
+        'memberId': fakes.READER_ID, 'gu': fakes.GU,
+        'parameter1': 'SNS 자랑하기 좋은', 'parameter2': '대화하기 좋은', 'parameter3': '다이어트 실패 하기 좋은'
+    }, ensure_ascii=False)}),
+    ('precompute_courses', 'placeholder_course.precompute_courses', {'gu': [fakes.GU]}),
+    ('create_course_id', 'placeholder_course.create_course_id', None),
+    ('stop_course', 'placeholder_course.stop_course', {'queryStringParameters': {'memberId': fakes.WRITER_ID}}),
+]
+
+def scenario_event(name, event, backend):
+    # 시드 데이터에 따라 정해지는 이벤트
+    if name == 'hotplace_detail':
+        return {'queryStringParameters': {'hotplacePartitionKey': fakes.GU, 'hotplaceSortKey': backend.place_ids[0]}}
+    if name == 'create_course_id':
+        body = {'memberId': fakes.WRITER_ID, 'gu': fakes.GU}
+        body.update({f'course{i}': backend.place_ids[i] for i in range(1, 6)})
+        return {'body': json.dumps(body, ensure_ascii=False)}
+    return event
+
+def start_writer_course(backend):
+    # stop_course가 매번 멈출 코스가 있도록 쓰기용 회원에게 새 코스를 만듦
+    from placeholder_course import create_course_id
+    create_course_id.handler(scenario_event('create_course_id', None, backend), None)
+
+def precompute_recommendations(backend):
+    # create_course가 미리 계산된 추천을 쓰도록 함
+    from placeholder_course import precompute_courses
+    precompute_courses.handler({'gu': [fakes.GU]}, None)
+
+def clear_recommendations(backend):
+    from placeholder_course import precompute_courses
+    precompute_courses.hotplace_table.delete_item(Key=precompute_courses.recommendation_key(fakes.GU))
+    precompute_courses._recommendations.clear()
+
+def complete_first_attempt(backend):
+    # 첫 요청이 끝까지 처리되어 응답이 저장된 상태 (이미 저장되어 있으면 그대로 재생됨)
+    from placeholder_course import create_course
+    precompute_recommendations(backend)
+    create_course.handler(next(event for name, _, event in SCENARIOS if name == 'create_course_retry'), None)
+
+PREPARE = {
+    'stop_course': start_writer_course,
+    'create_course': precompute_recommendations,
+    'create_course_miss': clear_recommendations,
+    'create_course_retry': complete_first_attempt
+}
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def add_counters(total, before, after):
+    for field in ('s3', 'rcu', 'wcu', 'bedrock'):
+        total[field] = total.get(field, 0) + after[field] - before[field]
+    for field in ('dynamodb', 'http'):
+        bucket = total.setdefault(field, {})
+        for key, value in after[field].items():
+            bucket[key] = bucket.get(key, 0) + value - before[field].get(key, 0)
+
+def run_scenario(backend, module_name, event, iterations, warmup, cold, prepare=None):
+    module = importlib.import_module(module_name)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            if prepare:
+                prepare(backend)
+            module.handler(event, None)
+    samples, statuses, totals = [], {}, {}
+    for _ in range(iterations):
+        # 준비 단계의 호출은 세지 않음
+        with contextlib.redirect_stdout(io.StringIO()):
+            if prepare:
+                prepare(backend)
+            if cold:
+                reset_caches()
+            before = backend.counters()
+            start = time.perf_counter()
+            response = module.handler(event, None)
+            samples.append((time.perf_counter() - start) * 1000)
+            add_counters(totals, before, backend.counters())
+        status = str(response.get('statusCode'))
+        statuses[status] = statuses.get(status, 0) + 1
+    return {
+        'p50_ms': round(percentile(samples, 50), 2),
+        'p95_ms': round(percentile(samples, 95), 2),
+        'p99_ms': round(percentile(samples, 99), 2),
+        'max_ms': round(max(samples), 2),
+        'status': statuses,
+        # 아래 값은 호출 1회 평균
+        'dynamodb_calls': round(sum(totals['dynamodb'].values()) / iterations, 2),
+        'dynamodb_ops': {op: round(n / iterations, 2) for op, n in sorted(totals['dynamodb'].items()) if n},
+        'rcu': round(totals['rcu'] / iterations, 2),
+        'wcu': round(totals['wcu'] / iterations, 2),
+        's3_calls': round(totals['s3'] / iterations, 2),
+        'bedrock_calls': round(totals['bedrock'] / iterations, 2),
+        'http_calls': round(sum(totals['http'].values()) / iterations, 2),
+    }
+
+def reset_caches():
+    # 컨테이너 메모리 캐시를 비워 매번 새 컨테이너처럼 실행 (DynamoDB에 저장된 캐시는 유지)
+    from placeholder_common import directions, upstream_guard
+    with directions._lock:
+        directions._cache.clear()
+    upstream_guard.reset()
+    module = sys.modules.get('placeholder_member.post_member_start')
+    if module is not None:
+        module.geocode_cache.clear()
+    module = sys.modules.get('placeholder_course.create_course')
+    if module is not None:
+        module._places.clear()
+    module = sys.modules.get('placeholder_course.precompute_courses')
+    if module is not None:
+        module._recommendations.clear()
+
+def baseline_key(name, cold):
+    # 캐시를 비우고 돈 결과는 호출 수가 다르므로 따로 저장
+    return f'{name}@cold' if cold else name
+
+def combine(runs):
+    # 같은 시나리오를 여러 번 돈 결과: 지연 시간과 호출 수는 중앙값, 상태 코드는 합계
+    # (한 번 튄 실행 때문에 회귀로 잡지 않게 함)
+    result = dict(runs[0])
+    for field, value in runs[0].items():
+        if isinstance(value, (int, float)):
+            result[field] = round(statistics.median(run[field] for run in runs), 2)
+    statuses = {}
+    for run in runs:
+        for status, count in run['status'].items():
+            statuses[status] = statuses.get(status, 0) + count
+    result['status'] = statuses
+    return result
+
+def status_ratios(statuses):
+    # 반복 횟수와 상관없이 비교할 수 있도록 상태 코드별 비율로 바꿈
+    total = sum(statuses.values()) or 1
+    return {status: count / total for status, count in statuses.items()}
+
+def regressions(name, result, baseline, settings):
+    found = []
+    for field in ('dynamodb_calls', 's3_calls', 'bedrock_calls', 'http_calls'):
+        if result[field] > baseline.get(field, 0) + 0.01:
+            found.append(f'{name}: {field} {baseline.get(field, 0)} -> {result[field]}')
+    if result['rcu'] > baseline.get('rcu', 0) * (1 + RCU_TOLERANCE) + 0.01:
+        found.append(f"{name}: rcu {baseline.get('rcu', 0)} -> {result['rcu']}")
+    if 'status' in baseline:
+        expected, actual = status_ratios(baseline['status']), status_ratios(result['status'])
+        if set(expected) != set(actual) or any(abs(expected[s] - actual[s]) > STATUS_TOLERANCE for s in expected):
+            found.append(f"{name}: status {baseline['status']} -> {result['status']}")
+    # 지연 시간은 같은 주입 지연 설정으로 만든 기준과만 비교
+    if settings == baseline.get('settings', settings):
+        limit = max(baseline['p95_ms'] * (1 + LATENCY_TOLERANCE), baseline['p95_ms'] + LATENCY_FLOOR_MS)
+        if result['p95_ms'] > limit:
+            found.append(f"{name}: p95 {baseline['p95_ms']} ms -> {result['p95_ms']} ms")
+    return found
+
+def main():
+    parser = argparse.ArgumentParser(description='Run every handler against in-process fakes and compare with the stored baseline.')
+    parser.add_argument('--iterations', type=int, default=10)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=3, help='run each scenario this many times and compare the median')
+    parser.add_argument('--bedrock-latency-ms', type=float, default=50)
+    parser.add_argument('--google-latency-ms', type=float, default=5)
+    parser.add_argument('--kakao-latency-ms', type=float, default=5)
+    parser.add_argument('--cold', action='store_true', help='clear in-memory caches before every invocation')
+    parser.add_argument('--only', nargs='*', help='scenario names to run')
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--update-baseline', action='store_true', help='write the results as the new baseline instead of comparing')
+    parser.add_argument('--json', action='store_true', help='print the raw results as JSON')
+    args = parser.parse_args()
+
+    settings = {
+        'iterations': args.iterations,
+        'bedrock_latency_ms': args.bedrock_latency_ms,
+        'google_latency_ms': args.google_latency_ms,
+        'kakao_latency_ms': args.kakao_latency_ms,
+        'cold': args.cold,
+    }
+    results = {}
+    with fakes.OfflineBackend(args.bedrock_latency_ms, args.google_latency_ms, args.kakao_latency_ms) as backend:
+        for name, module_name, event in SCENARIOS:
+            if args.only and name not in args.only:
+                continue
+            event = scenario_event(name, event, backend)
+            results[name] = combine([
+                run_scenario(backend, module_name, event, args.iterations, args.warmup, args.cold, PREPARE.get(name))
+                for _ in range(max(1, args.repeat))
+            ])
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        print(f"{'scenario':<24} {'p50':>8} {'p95':>8} {'p99':>8} {'ddb':>6} {'rcu':>7} {'wcu':>6} {'s3':>4} {'llm':>4} {'http':>5}  status")
+        for name, r in results.items():
+            print(f"{name:<24} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['dynamodb_calls']:>6} {r['rcu']:>7} {r['wcu']:>6} "
+                  f"{r['s3_calls']:>4} {r['bedrock_calls']:>4} {r['http_calls']:>5}  {r['status']}")
+
+    if args.update_baseline:
+        stored = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding='utf-8') as f:
+                stored = json.load(f)
+        for name, r in results.items():
+            stored[baseline_key(name, args.cold)] = dict(r, settings=settings)
+        with open(args.baseline, 'w', encoding='utf-8', newline='\r\n') as f:
+            json.dump(stored, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f'baseline written to {args.baseline}')
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print('no baseline; run with --update-baseline first')
+        return 0
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    found = []
+    for name, r in results.items():
+        key = baseline_key(name, args.cold)
+        if key in baseline:
+            found.extend(regressions(name, r, baseline[key], settings))
+    if found:
+        print('\nregressions:')
+        for line in found:
+            print(f'  {line}')
+        return 1
+    print('\nno regressions against baseline')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
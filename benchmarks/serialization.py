@@ -0,0 +1,79 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from placeholder_common import serialization
+
+# 기존 핸들러마다 있던 인코더 (비교 기준)
+class DecimalEncoder(json.JSONEncoder):
+    def default(self, o):
+        if isinstance(o, Decimal):
+            return float(o)
+        return super(DecimalEncoder, self).default(o)
+
+CATEGORIES = ['음식점', '카페', '놀거리']
+
+def hotplace_rows(count, seed=0):
+    # get_hotplace_gu_* 응답과 같은 모양의 강남구 크기 목록
+    rng = random.Random(seed)
+    return [
+        {
+            'hotplacePartitionKey': '강남구',
+            'hotplaceSortKey': f'Place#{rng.randint(10000000, 2000000000)}',
+            'name': f'강남 장소 {i}',
+            'areaCd': f'POI{rng.randint(1, 120):03d}',
+            'mapX': Decimal(f'127.{rng.randint(0, 99999999):08d}'),
+            'mapY': Decimal(f'37.{rng.randint(0, 99999999):08d}'),
+            'category': rng.choice(CATEGORIES),
+            'address': f'서울 강남구 역삼동 {rng.randint(1, 999)}-{rng.randint(1, 99)}',
+            'rating': Decimal(f'{rng.randint(10, 50) / 10}'),
+            'imageUrl': f'https://img1.kakaocdn.net/cthumb/local/{i}.jpg',
+            'placeUrl': f'http://place.map.kakao.com/{i}',
+            'menus': [f'메뉴 {j}' for j in range(rng.randint(0, 6))],
+            'keywords': [f'키워드{j}' for j in range(rng.randint(0, 4))]
+        }
+        for i in range(count)
+    ]
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the old per-module DecimalEncoder with placeholder_common.serialization.')
+    parser.add_argument('--rows', type=int, default=1500, help='hotplace rows per payload')
+    parser.add_argument('--repeat', type=int, default=30)
+    args = parser.parse_args()
+
+    rows = hotplace_rows(args.rows)
+    legacy = json.dumps(rows, cls=DecimalEncoder, ensure_ascii=False, indent=4)
+    current = serialization.dumps(rows)
+    # 공백만 다르고 값은 같아야 함
+    assert json.loads(legacy) == json.loads(current)
+    assert serialization.dumps(rows, indent=4) == legacy
+
+    cases = [
+        ('DecimalEncoder, indent=4 (before)', lambda: json.dumps(rows, cls=DecimalEncoder, ensure_ascii=False, indent=4), legacy),
+        ('serialization.dumps (after)', lambda: serialization.dumps(rows), current),
+        ('serialization.dumps, indent=4', lambda: serialization.dumps(rows, indent=4), legacy),
+    ]
+    print(f'{args.rows} rows, median of {args.repeat}')
+    baseline = None
+    for name, fn, output in cases:
+        ms = timed(fn, args.repeat)
+        baseline = baseline or ms
+        print(f'{name:<36} {ms:>8.2f} ms  {baseline / ms:>5.1f}x  {len(output.encode("utf-8")) / 1024:>8.1f} KiB')
+
+if __name__ == '__main__':
+    main()
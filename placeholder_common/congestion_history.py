@@ -0,0 +1,190 @@
+import array
+import datetime
+import random
+import sys
+import time
+from placeholder_common import dynamo
+
+# 핫플레이스 혼잡도 이력 (시계열) 저장소
+# - 지역(area_cd)마다 하루에 항목 하나: pk History#{gu}#{area_cd}, sk Day#YYYYMMDD (한국 시간 기준)
+# - series 속성 하나에 10분 단위 슬롯 144개를 바이너리로 묶어 저장 (하루 432바이트, 1KB 미만이라 쓰기 1 WCU)
+#   앞 144바이트: 혼잡도 코드 (0 기록 없음, 1 여유, 2 보통, 3 약간 붐빔, 4 붐빔)
+#   뒤 288바이트: 인구 (빅엔디언 uint16, 10명 단위 + 1, 0 기록 없음)
+# - "최근 N시간"은 Query 한 번, "같은 요일 평소 곡선"은 BatchGetItem 한 번으로 읽음 (읽는 항목 수는 날짜 수에 비례)
+TABLE_NAME = 'HOTPLACE'
+KST = datetime.timezone(datetime.timedelta(hours=9))
+SLOT_MINUTES = 10
+SLOTS = 24 * 60 // SLOT_MINUTES
+LEVELS = ['여유', '보통', '약간 붐빔', '붐빔']
+POPULATION_UNIT = 10
+RETENTION_DAYS = 400  # 테이블에 TTL(expires_at)이 켜져 있으면 이 기간이 지난 항목은 지워짐
+MAX_HOURS = 24 * 7
+BATCH_GET_MAX_RETRIES = 5
+MAX_WEEKS = 12
+MAX_RETRIES = 3
+
+def history_key(gu, area_cd, day):
+    return {
+        'hotplace_partition_key': {'S': f'History#{gu}#{area_cd}'},
+        'hotplace_sort_key': {'S': f'Day#{day:%Y%m%d}'}
+    }
+
+def day_of(sort_key):
+    return datetime.datetime.strptime(sort_key.split('#', 1)[1], '%Y%m%d').date()
+
+def slot_of(at):
+    local = at.astimezone(KST)
+    return (local.hour * 60 + local.minute) // SLOT_MINUTES
+
+def slot_time(day, slot):
+    start = datetime.datetime(day.year, day.month, day.day, tzinfo=KST)
+    return start + datetime.timedelta(minutes=slot * SLOT_MINUTES)
+
+def encode_level(level):
+    return LEVELS.index(level) + 1 if level in LEVELS else 0
+
+def encode_population(population):
+    if population is None or population == '':
+        return 0
+    return min(0xFFFF, int(float(population)) // POPULATION_UNIT + 1)
+
+def decode_population(value):
+    return None if value == 0 else (value - 1) * POPULATION_UNIT
+
+def pack(levels, populations):
+    values = array.array('H', populations)
+    if sys.byteorder != 'big':
+        values.byteswap()
+    return bytes(levels) + values.tobytes()
+
+def unpack(series):
+    # 기록이 없는 날은 빈 시계열
+    if not series:
+        return bytearray(SLOTS), array.array('H', bytes(2 * SLOTS))
+    levels = bytearray(series[:SLOTS])
+    populations = array.array('H')
+    populations.frombytes(bytes(series[SLOTS:SLOTS * 3]))
+    if sys.byteorder != 'big':
+        populations.byteswap()
+    return levels, populations
+
+def record(gu, area_cd, level, population=None, at=None):
+    """현재(또는 at) 시각 슬롯에 혼잡도/인구를 기록. 같은 항목을 동시에 쓰면 version 조건으로 다시 시도"""
+    at = at or datetime.datetime.now(KST)
+    day = at.astimezone(KST).date()
+    key = history_key(gu, area_cd, day)
+    slot = slot_of(at)
+    for _ in range(MAX_RETRIES):
+        item = dynamo.client.get_item(TableName=TABLE_NAME, Key=key, ConsistentRead=True).get('Item')
+        levels, populations = unpack(item['series']['B'] if item else None)
+        levels[slot] = encode_level(level)
+        populations[slot] = encode_population(population)
+        version = int(item['version']['N']) if item else 0
+        params = {
+            'TableName': TABLE_NAME,
+            'Item': dict(
+                key,
+                series={'B': pack(levels, populations)},
+                version={'N': str(version + 1)},
+                expires_at={'N': str(int(time.time()) + RETENTION_DAYS * 86400)}
+            )
+        }
+        if item:
+            params['ConditionExpression'] = '#v = :v'
+            params['ExpressionAttributeNames'] = {'#v': 'version'}
+            params['ExpressionAttributeValues'] = {':v': {'N': str(version)}}
+        else:
+            params['ConditionExpression'] = 'attribute_not_exists(hotplace_partition_key)'
+        try:
+            dynamo.client.put_item(**params)
+            return
+        except dynamo.client.exceptions.ConditionalCheckFailedException:
+            continue
+    raise RuntimeError(f'Could not record congestion for {gu} {area_cd}: concurrent updates')
+
+def readings(day, series, start=None, end=None):
+    levels, populations = unpack(series)
+    result = []
+    for slot in range(SLOTS):
+        if not levels[slot]:
+            continue
+        at = slot_time(day, slot)
+        if (start and at < start) or (end and at > end):
+            continue
+        result.append({
+            'time': at.isoformat(timespec='minutes'),
+            'congestion': LEVELS[levels[slot] - 1],
+            'population': decode_population(populations[slot])
+        })
+    return result
+
+def last_hours(gu, area_cd, hours, now=None):
+    """최근 hours시간의 기록 (시간순). 걸친 날짜 수만큼의 항목을 Query 한 번으로 읽음"""
+    end = (now or datetime.datetime.now(KST)).astimezone(KST)
+    start = end - datetime.timedelta(hours=hours)
+    items = dynamo.query(
+        TABLE_NAME,
+        'hotplace_partition_key = :pk AND hotplace_sort_key BETWEEN :start AND :end',
+        {
+            ':pk': f'History#{gu}#{area_cd}',
+            ':start': f'Day#{start.date():%Y%m%d}',
+            ':end': f'Day#{end.date():%Y%m%d}'
+        },
+        attributes=['hotplace_sort_key', 'series']
+    )
+    result = []
+    for item in items:
+        result.extend(readings(day_of(item['hotplace_sort_key']), item.get('series'), start, end))
+    return result
+
+def weekday_days(weekday, weeks, now=None):
+    # 오늘을 빼고 가장 가까운 해당 요일부터 weeks주 전까지
+    today = (now or datetime.datetime.now(KST)).astimezone(KST).date()
+    latest = today - datetime.timedelta(days=(today.weekday() - weekday - 1) % 7 + 1)
+    return [latest - datetime.timedelta(weeks=i) for i in range(weeks)]
+
+def batch_get_series(keys):
+    series = {}
+    request = {TABLE_NAME: {'Keys': keys, 'ProjectionExpression': 'hotplace_sort_key, series'}}
+    for attempt in range(BATCH_GET_MAX_RETRIES):
+        response = dynamo.client.batch_get_item(RequestItems=request)
+        for item in response.get('Responses', {}).get(TABLE_NAME, []):
+            series[item['hotplace_sort_key']['S']] = item['series']['B']
+        request = response.get('UnprocessedKeys')
+        if not request:
+            break
+        # 처리되지 않은 키는 지터를 준 지수 백오프 뒤 재시도 (동시에 스로틀링된 요청이 한꺼번에 몰리지 않게)
+        time.sleep(random.uniform(0, 0.05 * (2 ** attempt)))
+    else:
+        raise RuntimeError('Could not resolve all congestion history')
+    return series
+
+def median(values):
+    ordered = sorted(values)
+    return ordered[len(ordered) // 2]
+
+def typical_curve(gu, area_cd, weekday=None, weeks=4, now=None):
+    """같은 요일 weeks주치 기록으로 슬롯별 평소 혼잡도(중앙값)와 인구(중앙값)를 계산"""
+    if weekday is None:
+        weekday = (now or datetime.datetime.now(KST)).astimezone(KST).weekday()
+    days = weekday_days(weekday, weeks, now)
+    stored = batch_get_series([history_key(gu, area_cd, day) for day in days])
+    unpacked = [unpack(series) for series in stored.values()]
+
+    curve = []
+    for slot in range(SLOTS):
+        levels = [levels[slot] for levels, _ in unpacked if levels[slot]]
+        if not levels:
+            continue
+        populations = [p[slot] for _, p in unpacked if p[slot]]
+        curve.append({
+            'time': f'{slot * SLOT_MINUTES // 60:02d}:{slot * SLOT_MINUTES % 60:02d}',
+            'congestion': LEVELS[median(levels) - 1],
+            'population': decode_population(median(populations)) if populations else None,
+            'samples': len(levels)
+        })
+    return {
+        'weekday': weekday,
+        'days': [f'{day:%Y-%m-%d}' for day in days if f'Day#{day:%Y%m%d}' in stored],
+        'curve': curve
+    }
@@ -0,0 +1,90 @@
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from boto3.dynamodb.conditions import Attr, Key
+from placeholder_common import runtime
+
+# 회원 코스 id (정렬 키 COURSE#{id})
+# - 새 코스: ULID (48비트 밀리초 타임스탬프 + 80비트 난수를 Crockford base32 26자로 인코딩)
+#   사전순 정렬이 생성 시각 순서와 같고, 첫 글자는 항상 '0'이라 이전 6자리 숫자 id와 구분됨
+# - 이전 코스: 6자리 숫자 id (생성 시각을 알 수 없음)
+table = runtime.lazy_table('MEMBER')
+
+CROCKFORD_BASE32 = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+NEW_COURSE_PREFIX = 'COURSE#0'  # 시간순 id(ULID)는 항상 '0'으로 시작
+LEGACY_COURSE_START, LEGACY_COURSE_END = 'COURSE#1', 'COURSE#9~'  # 이전 6자리 숫자 id 범위
+ULID_LENGTH = 26
+MAX_LATEST = 100
+KST = timezone(timedelta(hours=9))
+
+def new_course_id():
+    value = (int(time.time() * 1000) << 80) | int.from_bytes(os.urandom(10), 'big')
+    return ''.join(CROCKFORD_BASE32[(value >> shift) & 31] for shift in range(125, -1, -5))
+
+def encode_time(millis):
+    # ULID 앞 10자리(48비트 타임스탬프)와 같은 인코딩
+    return ''.join(CROCKFORD_BASE32[(millis >> shift) & 31] for shift in range(45, -1, -5))
+
+def is_ulid(course_id):
+    return (
+        isinstance(course_id, str) and len(course_id) == ULID_LENGTH and course_id.startswith('0')
+        and all(char in CROCKFORD_BASE32 for char in course_id)
+    )
+
+def decode_time(course_id):
+    millis = 0
+    for char in course_id[:10]:
+        index = CROCKFORD_BASE32.find(char)
+        if index < 0:
+            raise ValueError(f'Invalid course id: {course_id}')
+        millis = (millis << 5) | index
+    return millis
+
+def created_at(course_id):
+    # 이전 숫자 id나 ULID 형식이 아닌 id는 생성 시각을 알 수 없음
+    if not is_ulid(course_id):
+        return None
+    try:
+        return datetime.fromtimestamp(decode_time(course_id) / 1000, KST).isoformat()
+    except (OverflowError, OSError, ValueError):
+        return None
+
+def parse_latest(query_params):
+    latest = query_params.get('latest')
+    if latest is None:
+        return None
+    if not latest.isdigit() or not 1 <= int(latest) <= MAX_LATEST:
+        raise ValueError(f"latest must be an integer between 1 and {MAX_LATEST}")
+    return int(latest)
+
+def legacy_active_course_keys(memberId):
+    # INFO 항목에 active_course 포인터가 생기기 전에 now=TRUE로 남은 코스들
+    response = table.query(
+        KeyConditionExpression=Key('member_partition_key').eq(f'MEMBER#{memberId}') & Key('member_sort_key').begins_with('COURSE#'),
+        FilterExpression=Attr('now').eq('TRUE'),
+        ProjectionExpression='member_sort_key'
+    )
+    return [item['member_sort_key'] for item in response.get('Items', [])]
+
+def query_member_courses(memberId, latest=None):
+    partition = Key('member_partition_key').eq(f'MEMBER#{memberId}')
+    if latest is None:
+        response = table.query(
+            KeyConditionExpression=partition & Key('member_sort_key').begins_with('COURSE#')
+        )
+        return response.get('Items', [])
+
+    # 시간순 id는 정렬 키 역순으로 필요한 개수만 읽음
+    items = table.query(
+        KeyConditionExpression=partition & Key('member_sort_key').begins_with(NEW_COURSE_PREFIX),
+        ScanIndexForward=False,
+        Limit=latest
+    ).get('Items', [])
+    if len(items) < latest:
+        # 부족하면 생성 시각을 알 수 없는 이전 숫자 id 코스로 채움
+        items += table.query(
+            KeyConditionExpression=partition & Key('member_sort_key').between(LEGACY_COURSE_START, LEGACY_COURSE_END),
+            ScanIndexForward=False,
+            Limit=latest - len(items)
+        ).get('Items', [])
+    return items
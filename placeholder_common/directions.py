@@ -0,0 +1,72 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from placeholder_common import http_client, tracing
+from placeholder_common.upstream_guard import UpstreamUnavailable
+
+DIRECTIONS_URL = "https://maps.googleapis.com/maps/api/directions/json"
+FRESH_TTL = 10 * 60  # 이 시간 안의 값은 API를 다시 부르지 않고 그대로 사용
+STALE_TTL = 6 * 60 * 60  # API가 막혔을 때는 이 시간까지의 값을 대신 돌려줌
+CACHE_SIZE = 2048
+
+# 컨테이너 단위 LRU 캐시: (출발 좌표, 도착 좌표) -> (분, 저장 시각)
+_lock = threading.Lock()
+_cache = OrderedDict()
+
+def cache_key(startX, startY, endX, endY):
+    # 약 10m 단위로 반올림해 같은 지점끼리 캐시를 공유
+    return tuple(round(float(v), 4) for v in (startX, startY, endX, endY))
+
+def cached_duration(key, max_age):
+    with _lock:
+        entry = _cache.get(key)
+        if entry is None or time.time() - entry[1] > max_age:
+            return None
+        _cache.move_to_end(key)
+        return entry[0]
+
+def remember_duration(key, minutes):
+    with _lock:
+        _cache[key] = (minutes, time.time())
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+
+def get_duration(startX, startY, endX, endY):
+    if None in (startX, startY, endX, endY):
+        return None
+    key = cache_key(startX, startY, endX, endY)
+    minutes = cached_duration(key, FRESH_TTL)
+    tracing.cache('directions', minutes is not None)
+    if minutes is not None:
+        return minutes
+
+    params = {
+        'origin': f"{startY},{startX}",
+        'destination': f"{endY},{endX}",
+        'mode': 'transit',
+        'key': os.environ['GOOGLE_API_KEY']  # 없으면 key=None으로 호출하지 않고 바로 KeyError
+    }
+    try:
+        response = http_client.get('google_directions', DIRECTIONS_URL, params=params)
+    except UpstreamUnavailable:
+        # 서킷이 열렸거나 쿼터를 넘었으면 기다리지 않고 이전 값(없으면 None)을 돌려줌
+        return cached_duration(key, STALE_TTL)
+    except Exception as e:
+        print(e)
+        return cached_duration(key, STALE_TTL)
+    if response.status_code != 200:
+        return cached_duration(key, STALE_TTL)
+    try:
+        data = response.json()
+    except ValueError:
+        # JSON이 아닌 응답(프록시 오류 페이지 등)도 다른 실패처럼 이전 값으로 대신함
+        return cached_duration(key, STALE_TTL)
+    try:
+        duration_text = data['routes'][0]['legs'][0]['duration']['text']
+        duration_minutes = duration_text.split()[0]
+    except (IndexError, KeyError, TypeError):
+        return None
+    remember_duration(key, duration_minutes)
+    return duration_minutes
@@ -0,0 +1,91 @@
+from placeholder_common import runtime
+
+# 저수준 DynamoDB 클라이언트를 쓰는 얇은 조회 계층
+# - Table 리소스는 모든 숫자를 Decimal로 만들고 핸들러가 다시 str/float로 바꾸므로
+#   여기서는 N 속성을 바로 int/float(또는 원래 문자열)로 바꿈
+# - attributes를 주면 ProjectionExpression으로 가져오는 속성을 줄이고,
+#   응답에 섞여 온 나머지 속성은 변환하지 않고 건너뜀
+# - SS/NS/BS 집합은 JSON으로 바로 내보낼 수 있게 list로 바꿈
+
+client = runtime.lazy_client('dynamodb')
+
+def to_number(text):
+    # 소수점/지수가 없으면 int, 있으면 float
+    if '.' in text or 'e' in text or 'E' in text:
+        return float(text)
+    return int(text)
+
+def deserialize_value(value, number=to_number):
+    (tag, data), = value.items()
+    if tag == 'S':
+        return data
+    if tag == 'N':
+        return number(data)
+    if tag == 'BOOL':
+        return data
+    if tag == 'NULL':
+        return None
+    if tag == 'L':
+        return [deserialize_value(v, number) for v in data]
+    if tag == 'M':
+        return {k: deserialize_value(v, number) for k, v in data.items()}
+    if tag == 'SS':
+        return list(data)
+    if tag == 'NS':
+        return [number(v) for v in data]
+    if tag in ('B', 'BS'):
+        return data
+    raise TypeError(f'Unknown DynamoDB type: {tag}')
+
+def deserialize_item(item, attributes=None, number=to_number):
+    if attributes is None:
+        return {k: deserialize_value(v, number) for k, v in item.items()}
+    return {k: deserialize_value(item[k], number) for k in attributes if k in item}
+
+def serialize_value(value):
+    # 키 조건/필터에 쓰는 값만 다룸 (문자열, 숫자, bool, None)
+    if value is None:
+        return {'NULL': True}
+    if isinstance(value, bool):
+        return {'BOOL': value}
+    if isinstance(value, str):
+        return {'S': value}
+    if isinstance(value, (int, float)):
+        return {'N': str(value)}
+    raise TypeError(f'Unsupported value type: {value.__class__.__name__}')
+
+def projection(attributes, names):
+    # name 같은 예약어도 쓸 수 있게 모두 #p0, #p1 ... 로 바꿔 씀
+    placeholders = []
+    for i, attribute in enumerate(attributes):
+        placeholder = f'#p{i}'
+        names[placeholder] = attribute
+        placeholders.append(placeholder)
+    return ', '.join(placeholders)
+
+def query(table_name, key_condition, values, names=None, filter_expression=None, attributes=None, number=to_number, limit=None, forward=True):
+    """KeyConditionExpression 문자열로 조회하고 모든 페이지를 변환된 dict 목록으로 돌려줌"""
+    params = {
+        'TableName': table_name,
+        'KeyConditionExpression': key_condition,
+        'ExpressionAttributeValues': {k: serialize_value(v) for k, v in values.items()},
+        'ScanIndexForward': forward
+    }
+    names = dict(names or {})
+    if attributes:
+        params['ProjectionExpression'] = projection(attributes, names)
+    if filter_expression:
+        params['FilterExpression'] = filter_expression
+    if names:
+        params['ExpressionAttributeNames'] = names
+
+    items = []
+    while True:
+        if limit is not None:
+            params['Limit'] = limit - len(items)
+        response = client.query(**params)
+        items.extend(deserialize_item(item, attributes, number) for item in response.get('Items', []))
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key or (limit is not None and len(items) >= limit):
+            return items
+        params['ExclusiveStartKey'] = last_key
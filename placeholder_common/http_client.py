@@ -0,0 +1,105 @@
+import random
+import threading
+import time
+from placeholder_common import tracing, upstream_guard
+
+# 컨테이너 수명 동안 재사용하는 외부 API(Google, Kakao)용 HTTP 클라이언트
+# - Session + HTTPAdapter 커넥션 풀로 TLS 핸드셰이크를 호출마다 반복하지 않음
+# - 호출마다 (connect, read) 타임아웃을 걸어 Lambda 전체 시간을 잡아먹지 않게 함
+# - 5xx/429와 연결 오류는 지터가 있는 지수 백오프로 제한된 횟수만 재시도
+# - upstream별 지연 시간 히스토그램을 기록
+# - upstream_guard의 서킷 브레이커/레이트 리미터를 거치며, 막히면 UpstreamUnavailable을 던짐
+DEFAULT_TIMEOUT = (3, 5)  # (connect, read) 초
+DEFAULT_RETRIES = 2
+BACKOFF_BASE = 0.2
+BACKOFF_MAX = 2.0
+POOL_MAXSIZE = 10
+RETRY_STATUS = {429, 500, 502, 503, 504}
+LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_lock = threading.Lock()
+_session = None
+_histograms = {}
+
+def get_session():
+    global _session
+    with _lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE, max_retries=0)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+        return _session
+
+def set_session(session):
+    # 테스트/벤치마크에서 가짜 세션을 주입할 때 사용 (None이면 다음 호출에서 새로 만듦)
+    global _session
+    with _lock:
+        _session = session
+
+def backoff(attempt):
+    # full jitter: 0 ~ min(최대, 기본 * 2^attempt)
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+def retry_delay(response, attempt):
+    # 429/503의 Retry-After(초)가 있으면 따르되 최대 대기 시간은 넘지 않음
+    if response is not None and response.headers.get('Retry-After', '').isdigit():
+        return min(BACKOFF_MAX, float(response.headers['Retry-After']))
+    return backoff(attempt)
+
+def record(upstream, elapsed_ms, status, retries):
+    with _lock:
+        histogram = _histograms.setdefault(upstream, {
+            'count': 0,
+            'errors': 0,
+            'retries': 0,
+            'sum_ms': 0.0,
+            'max_ms': 0.0,
+            'buckets': [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        })
+        histogram['count'] += 1
+        histogram['retries'] += retries
+        histogram['sum_ms'] += elapsed_ms
+        histogram['max_ms'] = max(histogram['max_ms'], elapsed_ms)
+        if status is None or status >= 500 or status == 429:
+            histogram['errors'] += 1
+        index = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if elapsed_ms <= bound), len(LATENCY_BUCKETS_MS))
+        histogram['buckets'][index] += 1
+
+def histograms():
+    with _lock:
+        return {upstream: dict(h, buckets=list(h['buckets'])) for upstream, h in _histograms.items()}
+
+def reset_histograms():
+    with _lock:
+        _histograms.clear()
+
+def get(upstream, url, params=None, headers=None, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES):
+    import requests
+    upstream_guard.before_call(upstream)
+    session = get_session()
+    start = time.perf_counter()
+    attempt = 0
+    response = None
+    try:
+        while True:
+            try:
+                response = session.get(url, params=params, headers=headers, timeout=timeout)
+                if response.status_code not in RETRY_STATUS or attempt >= retries:
+                    return response
+            except (requests.ConnectionError, requests.Timeout):
+                response = None
+                if attempt >= retries:
+                    raise
+            time.sleep(retry_delay(response, attempt))
+            attempt += 1
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        status = response.status_code if response is not None else None
+        record(upstream, elapsed_ms, status, attempt)
+        size = len(response.content) if response is not None else 0
+        tracing.record(upstream, elapsed_ms, size=size, retries=attempt, error=status is None or status in RETRY_STATUS)
+        upstream_guard.after_call(upstream, status is not None and status not in RETRY_STATUS, elapsed_ms)
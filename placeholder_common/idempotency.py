@@ -0,0 +1,173 @@
+import functools
+import hashlib
+import json
+import time
+import uuid
+from placeholder_common import runtime, tracing
+
+# Idempotency-Key 헤더로 쓰기 요청의 중복 실행을 막음
+# - API Gateway가 29초에 끊어 클라이언트가 같은 요청을 다시 보내도 코스 생성(Bedrock + Directions)을 한 번만 실행
+# - 캐시 테이블(runtime.CACHE_TABLE, expires_at TTL)에 (함수, 키)마다 항목 하나: 처음 들어온 요청이 IN_PROGRESS로 선점하고, 끝나면 응답과 함께 COMPLETED로 바꿈
+# - 같은 키로 다시 들어온 요청은 처리 중이면 끝날 때까지 기다렸다가, 끝났으면 바로 저장된 응답을 돌려줌
+# - 같은 키에 다른 요청 내용이면 422, 기다려도 끝나지 않으면 409 (Retry-After)
+# - 5xx 응답은 저장하지 않고 항목을 지워 재시도가 다시 실행되게 함
+# - 헤더가 없는 요청은 예전처럼 그대로 처리
+table = runtime.lazy_cache_table()
+HEADER = 'idempotency-key'
+MAX_KEY_LENGTH = 255
+IN_PROGRESS = 'IN_PROGRESS'
+COMPLETED = 'COMPLETED'
+IN_PROGRESS_TTL = 150  # 컨텍스트가 없을 때 선점 유지 시간 (create_course 제한 시간 120초보다 길게)
+COMPLETED_TTL = 24 * 60 * 60  # 완료된 응답 보관 시간 (지난 항목은 DynamoDB TTL이 지움)
+WAIT_SECONDS = 25  # 중복 요청이 기다리는 최대 시간 (API Gateway 29초 안에 응답)
+POLL_INTERVAL = 0.5
+RETRY_AFTER = 5
+HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET,POST,OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,Idempotency-Key'
+}
+
+def idempotency_key(event):
+    # 헤더 이름은 대소문자를 구분하지 않음 (REST API는 보낸 그대로, HTTP API는 소문자로 전달)
+    for name, value in (event.get('headers') or {}).items():
+        if name.lower() == HEADER and value:
+            return value.strip()
+    return None
+
+def record_key(function_name, key):
+    return runtime.cache_key(f'IDEMPOTENCY#{function_name}#{key}', 'IDEMPOTENCY')
+
+def request_hash(event):
+    # 같은 키로 다른 요청을 보낸 경우를 가려내기 위한 요청 내용(본문 + 쿼리 파라미터) 해시
+    payload = json.dumps([event.get('body'), event.get('queryStringParameters') or {}], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def remaining_seconds(context, default):
+    remaining = getattr(context, 'get_remaining_time_in_millis', None)
+    return remaining() / 1000 if callable(remaining) else default
+
+def claim(function_name, key, fingerprint, context):
+    """키를 선점하면 (토큰, None), 이미 유효한 항목이 있으면 (None, 항목), 그 사이 지워졌으면 (None, None)"""
+    token = uuid.uuid4().hex
+    now = int(time.time())
+    # 핸들러가 제한 시간으로 끝나 완료를 기록하지 못해도 그 뒤에는 다시 선점할 수 있게 함
+    expires_at = now + int(remaining_seconds(context, IN_PROGRESS_TTL)) + 1
+    try:
+        table.put_item(
+            Item=dict(record_key(function_name, key), status=IN_PROGRESS, request_hash=fingerprint, token=token, expires_at=expires_at),
+            ConditionExpression="attribute_not_exists(cache_partition_key) OR expires_at < :now",
+            ExpressionAttributeValues={':now': now}
+        )
+        return token, None
+    except table.meta.client.exceptions.ConditionalCheckFailedException:
+        pass
+    return None, table.get_item(Key=record_key(function_name, key), ConsistentRead=True).get('Item')
+
+def release(function_name, key, token):
+    # 이 요청이 선점한 항목일 때만 지움 (선점이 만료되어 다른 요청이 다시 선점했으면 건드리지 않음)
+    try:
+        table.delete_item(
+            Key=record_key(function_name, key),
+            ConditionExpression="#token = :token",
+            ExpressionAttributeNames={'#token': 'token'},
+            ExpressionAttributeValues={':token': token}
+        )
+    except Exception as e:
+        print(e)
+
+def complete(function_name, key, token, response):
+    if not isinstance(response, dict) or response.get('statusCode', 500) >= 500:
+        release(function_name, key, token)
+        return
+    try:
+        table.update_item(
+            Key=record_key(function_name, key),
+            UpdateExpression="SET #status = :completed, #response = :response, expires_at = :expires_at",
+            ConditionExpression="#token = :token",
+            ExpressionAttributeNames={'#token': 'token', '#status': 'status', '#response': 'response'},
+            ExpressionAttributeValues={
+                ':token': token,
+                ':completed': COMPLETED,
+                ':response': json.dumps(response, ensure_ascii=False),
+                ':expires_at': int(time.time()) + COMPLETED_TTL
+            }
+        )
+    except Exception as e:
+        # 기록 실패는 이번 응답을 막지 않음 (다음 중복 요청은 선점이 만료된 뒤 다시 실행됨)
+        print(e)
+
+def wait_for(function_name, key, item, context):
+    # 처리 중인 요청이 끝날 때까지 강한 일관성 읽기로 확인
+    deadline = time.monotonic() + min(WAIT_SECONDS, remaining_seconds(context, WAIT_SECONDS) - 1)
+    while item is not None and item.get('status') == IN_PROGRESS and int(item.get('expires_at', 0)) >= time.time():
+        if time.monotonic() >= deadline:
+            return item
+        time.sleep(POLL_INTERVAL)
+        item = table.get_item(Key=record_key(function_name, key), ConsistentRead=True).get('Item')
+    return item
+
+def replay(item):
+    response = json.loads(item['response'])
+    response['headers'] = dict(response.get('headers') or HEADERS, **{'Idempotency-Replayed': 'true'})
+    return response
+
+def in_progress():
+    return {
+        'statusCode': 409,
+        'headers': dict(HEADERS, **{'Retry-After': str(RETRY_AFTER)}),
+        'body': json.dumps({'message': 'A request with this Idempotency-Key is still in progress'})
+    }
+
+def idempotent(handler):
+    """핸들러 데코레이터: Idempotency-Key 헤더가 있는 요청은 키마다 한 번만 처리 (@tracing.traced 안쪽에 씀)"""
+    function_name = handler.__module__.rsplit('.', 1)[-1]
+
+    @functools.wraps(handler)
+    def wrapper(event, context):
+        key = idempotency_key(event) if isinstance(event, dict) else None
+        if key is None:
+            return handler(event, context)
+        if len(key) > MAX_KEY_LENGTH:
+            return {
+                'statusCode': 400,
+                'headers': HEADERS,
+                'body': json.dumps({'message': f'Idempotency-Key must be at most {MAX_KEY_LENGTH} characters'})
+            }
+
+        fingerprint = request_hash(event)
+        for _ in range(2):
+            try:
+                token, item = claim(function_name, key, fingerprint, context)
+            except Exception as e:
+                # 저장소를 쓸 수 없으면 중복 방지 없이 처리
+                print(e)
+                return handler(event, context)
+            if token is not None:
+                try:
+                    response = handler(event, context)
+                except Exception:
+                    release(function_name, key, token)
+                    raise
+                complete(function_name, key, token, response)
+                return response
+            if item is None:
+                continue
+
+            if item.get('request_hash') != fingerprint:
+                tracing.count('idempotency.mismatch')
+                return {
+                    'statusCode': 422,
+                    'headers': HEADERS,
+                    'body': json.dumps({'message': 'Idempotency-Key was already used with a different request'})
+                }
+            item = wait_for(function_name, key, item, context)
+            if item is not None and item.get('status') == COMPLETED:
+                tracing.count('idempotency.replayed')
+                return replay(item)
+            if item is not None and int(item.get('expires_at', 0)) >= time.time():
+                tracing.count('idempotency.in_progress')
+                return in_progress()
+            # 처리하던 요청이 5xx로 끝났거나 선점이 만료되었으면 이 요청이 다시 선점
+        return in_progress()
+    return wrapper
@@ -0,0 +1,81 @@
+import importlib
+import json
+import threading
+from placeholder_common import tracing, warmup
+
+# 하나의 Lambda 함수로 여러 API 경로를 처리하는 라우터 (template-router.yaml 프로필에서 사용)
+# - 따뜻한 컨테이너, HTTP 커넥션 풀, 캐시를 모든 경로가 함께 씀
+# - 핸들러 모듈은 해당 경로가 처음 호출될 때 import
+# 경로는 template.yaml의 API 이벤트와 같게 유지 (tools/render_templates.py가 template-router.yaml을 만들 때 확인)
+ROUTES = {
+    ('GET', '/hotplace/read/all'): 'placeholder_hotplace.get_hotplace_all_gu',
+    ('GET', '/hotplace/read/all/batch'): 'placeholder_hotplace.get_hotplace_all_gu_batch',
+    ('GET', '/hotplace/read/restaurant'): 'placeholder_hotplace.get_hotplace_gu_restaurant',
+    ('GET', '/hotplace/read/cafe'): 'placeholder_hotplace.get_hotplace_gu_cafe',
+    ('GET', '/hotplace/read/enter'): 'placeholder_hotplace.get_hotplace_gu_enter',
+    ('GET', '/hotplace/read/detail'): 'placeholder_hotplace.get_hotplace_detail',
+    ('GET', '/hotplace/read/parkinglot'): 'placeholder_hotplace.get_hotplace_parkinglot',
+    ('GET', '/hotplace/read/congestion/history'): 'placeholder_hotplace.get_hotplace_congestion_history',
+    ('GET', '/course/read/member'): 'placeholder_member.get_member_info',
+    ('POST', '/course/write/member/location'): 'placeholder_member.post_member_start',
+    ('GET', '/course/read/membercourse/all'): 'placeholder_member.get_member_course_id',
+    ('GET', '/course/read/membercourse/history'): 'placeholder_member.get_member_course_history',
+    ('GET', '/course/read/membercourse/detail'): 'placeholder_member.get_member_course_detail',
+    ('GET', '/course/read/membercourse/realtime'): 'placeholder_member.get_member_course_realtime',
+    ('POST', '/course/write/membercourse/pause'): 'placeholder_course.stop_course',
+    ('POST', '/course/write/membercourse/write'): 'placeholder_course.create_course',
+    ('POST', '/course/write/membercourse'): 'placeholder_course.create_course_id',
+}
+
+_lock = threading.Lock()
+_handlers = {}
+
+def normalize_path(path):
+    return '/' + path.strip('/') if path else '/'
+
+def route_of(event):
+    # REST API(프록시 통합)는 resource/httpMethod, HTTP API(v2)는 routeKey를 씀
+    route_key = event.get('routeKey')
+    if route_key and ' ' in route_key:
+        method, path = route_key.split(' ', 1)
+        return method.upper(), normalize_path(path)
+    method = event.get('httpMethod') or event.get('requestContext', {}).get('http', {}).get('method', '')
+    return method.upper(), normalize_path(event.get('resource') or event.get('path') or event.get('rawPath'))
+
+def get_handler(module_name):
+    with _lock:
+        if module_name not in _handlers:
+            _handlers[module_name] = importlib.import_module(module_name).handler
+        return _handlers[module_name]
+
+def handler(event, context):
+    headers = {
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'GET,POST,OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token'
+    }
+
+    # warm-up 호출이면 모든 경로의 핸들러 모듈을 import하고 클라이언트/연결/캐시를 준비
+    if warmup.is_warmup(event):
+        names = sorted(set(ROUTES.values()))
+        for name in names:
+            get_handler(name)
+        modules = [importlib.import_module(name) for name in names]
+        return tracing.handle_warmup('router', modules)
+
+    method, path = route_of(event)
+    module_name = ROUTES.get((method, path))
+    if module_name is None:
+        allowed = sorted(m for m, p in ROUTES if p == path)
+        if allowed:
+            return {
+                'statusCode': 405,
+                'headers': dict(headers, Allow=','.join(allowed)),
+                'body': json.dumps({'message': f'Method {method} not allowed for {path}'})
+            }
+        return {
+            'statusCode': 404,
+            'headers': headers,
+            'body': json.dumps({'message': f'Route not found: {method} {path}'})
+        }
+    return get_handler(module_name)(event, context)
@@ -0,0 +1,89 @@
+import os
+import threading
+
+# 컨테이너 단위로 한 번만 만드는 boto3 세션과 클라이언트/리소스 캐시
+# 핸들러 모듈은 import 시점에 lazy_* 프록시만 만들고 실제 생성은 처음 사용할 때 함
+_lock = threading.RLock()
+_session = None
+_clients = {}
+_resources = {}
+_tables = {}
+
+# 수명이 짧은 조정/캐시 항목(멱등 키 등)을 두는 테이블 (template.yaml의 CacheTable, expires_at TTL)
+# 회원/장소 테이블과 나눠 만료 항목이 쌓이거나 회원 데이터 Scan/내보내기에 섞이지 않게 함
+CACHE_TABLE = os.environ.get('CACHE_TABLE', 'CACHE')
+
+def get_session():
+    global _session
+    with _lock:
+        if _session is None:
+            import boto3
+            from placeholder_common import tracing
+            _session = boto3.session.Session()
+            tracing.install(_session)
+        return _session
+
+def get_client(service_name, region_name=None):
+    key = (service_name, region_name)
+    with _lock:
+        if key not in _clients:
+            _clients[key] = get_session().client(service_name, region_name=region_name)
+        return _clients[key]
+
+def get_resource(service_name, region_name=None):
+    key = (service_name, region_name)
+    with _lock:
+        if key not in _resources:
+            _resources[key] = get_session().resource(service_name, region_name=region_name)
+        return _resources[key]
+
+def get_table(name):
+    with _lock:
+        if name not in _tables:
+            _tables[name] = get_resource('dynamodb').Table(name)
+        return _tables[name]
+
+def set_client(service_name, client, region_name=None):
+    # 테스트/벤치마크에서 가짜 클라이언트를 주입할 때 사용
+    with _lock:
+        _clients[(service_name, region_name)] = client
+
+def reset():
+    # 테스트/벤치마크에서 새 컨테이너처럼 다시 시작할 때 사용
+    global _session
+    with _lock:
+        _session = None
+        _clients.clear()
+        _resources.clear()
+        _tables.clear()
+
+class Lazy:
+    def __init__(self, factory, *args, **kwargs):
+        self._factory = factory
+        self._args = args
+        self._kwargs = kwargs
+
+    def resolve(self):
+        return self._factory(*self._args, **self._kwargs)
+
+    def spec(self):
+        # 무엇을 만드는지 (factory, args, kwargs) - warm-up처럼 대상 종류에 따라 다르게 다룰 때 씀
+        return self._factory, self._args, self._kwargs
+
+    def __getattr__(self, name):
+        return getattr(self.resolve(), name)
+
+def lazy_client(service_name, region_name=None):
+    return Lazy(get_client, service_name, region_name=region_name)
+
+def lazy_resource(service_name, region_name=None):
+    return Lazy(get_resource, service_name, region_name=region_name)
+
+def lazy_table(name):
+    return Lazy(get_table, name)
+
+def lazy_cache_table():
+    return lazy_table(CACHE_TABLE)
+
+def cache_key(partition_key, sort_key):
+    return {'cache_partition_key': partition_key, 'cache_sort_key': sort_key}
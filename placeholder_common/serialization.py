@@ -0,0 +1,18 @@
+import json
+from decimal import Decimal
+
+# 핸들러 공용 JSON 직렬화
+# DynamoDB 리소스가 돌려주는 Decimal은 기존 DecimalEncoder와 같이 float로 바꿈
+# indent 없이 C 인코더 경로를 타므로 indent=4 + JSONEncoder 서브클래스보다 몇 배 빠르고 응답도 작음
+
+def default(o):
+    if isinstance(o, Decimal):
+        return float(o)
+    raise TypeError(f'Object of type {o.__class__.__name__} is not JSON serializable')
+
+_encoder = json.JSONEncoder(default=default, ensure_ascii=False)
+
+def dumps(obj, indent=None):
+    if indent is None:
+        return _encoder.encode(obj)
+    return json.dumps(obj, default=default, ensure_ascii=False, indent=indent)
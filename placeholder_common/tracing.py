@@ -0,0 +1,225 @@
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+# 호출(invocation) 단위 외부 의존성 추적
+# - boto3(DynamoDB, S3, Bedrock) 호출은 botocore 이벤트 훅으로, Google/Kakao 호출은 http_client가 기록
+# - 의존성마다 호출 수, 시간, 주고받은 바이트, 재시도, 오류를 모아
+#   호출이 끝날 때 CloudWatch Embedded Metric Format(EMF) 로그 한 줄로 출력
+# - 기록은 perf_counter와 dict 갱신뿐이라 운영에서 켜 두어도 부담이 적음 (TRACING_ENABLED=0 이면 끔)
+NAMESPACE = os.environ.get('METRICS_NAMESPACE', 'Placeholder')
+ENABLED = os.environ.get('TRACING_ENABLED', '1') != '0'
+FIELDS = ('calls', 'ms', 'bytes', 'retries', 'errors')
+
+_lock = threading.Lock()
+_cold_start = True  # 컨테이너의 첫 호출(warm-up 포함) 전
+_first_request = True  # 컨테이너의 첫 실제 요청 전
+_dependencies = {}
+_operations = {}
+_caches = {}
+_counters = {}
+
+def reset():
+    with _lock:
+        _dependencies.clear()
+        _operations.clear()
+        _caches.clear()
+        _counters.clear()
+
+def record(dependency, elapsed_ms, size=0, retries=0, error=False, operation=None):
+    with _lock:
+        stats = _dependencies.get(dependency)
+        if stats is None:
+            stats = _dependencies[dependency] = dict.fromkeys(FIELDS, 0)
+        stats['calls'] += 1
+        stats['ms'] += elapsed_ms
+        stats['bytes'] += size
+        stats['retries'] += retries
+        stats['errors'] += 1 if error else 0
+        if operation:
+            key = f'{dependency}.{operation}'
+            _operations[key] = _operations.get(key, 0) + 1
+
+def cache(name, hit):
+    # 캐시 적중 여부 (directions, geocode 등)
+    with _lock:
+        counts = _caches.setdefault(name, [0, 0])
+        counts[0 if hit else 1] += 1
+
+def count(name, value=1):
+    # 그 밖의 횟수 지표 (모델 상위 단계로 넘긴 횟수 등)
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+def snapshot():
+    with _lock:
+        return {
+            'dependencies': {name: dict(stats) for name, stats in _dependencies.items()},
+            'operations': dict(_operations),
+            'caches': {name: {'hits': c[0], 'misses': c[1]} for name, c in _caches.items()},
+            'counters': dict(_counters)
+        }
+
+def install(session):
+    # runtime.get_session에서 세션을 만들 때 한 번 호출됨 (이후 만든 클라이언트에 모두 적용)
+    if not ENABLED:
+        return
+    session.events.register('before-call', before_call)
+    session.events.register('after-call', after_call)
+    session.events.register('after-call-error', after_call_error)
+
+def before_call(model, params, context, **kwargs):
+    body = params.get('body')
+    context['tracing_start'] = time.perf_counter()
+    context['tracing_bytes'] = len(body) if isinstance(body, (bytes, str)) else 0
+
+def after_call(http_response, parsed, model, context, **kwargs):
+    start = context.get('tracing_start')
+    if start is None:
+        return
+    # 스트리밍 응답(S3 GetObject 등)은 본문을 읽지 않고 Content-Length로만 셈
+    size = 0
+    if http_response is not None:
+        length = http_response.headers.get('content-length')
+        if length:
+            size = int(length)
+        elif not model.has_streaming_output:
+            size = len(http_response.content or b'')
+    metadata = parsed.get('ResponseMetadata', {}) if isinstance(parsed, dict) else {}
+    record(
+        model.service_model.service_name,
+        (time.perf_counter() - start) * 1000,
+        size=context.get('tracing_bytes', 0) + size,
+        retries=metadata.get('RetryAttempts', 0),
+        error=http_response is None or http_response.status_code >= 400,
+        operation=model.name
+    )
+
+def after_call_error(context, event_name, **kwargs):
+    # 연결 오류 등으로 응답이 없을 때 (이벤트 이름: after-call-error.<서비스>.<오퍼레이션>)
+    start = context.get('tracing_start')
+    if start is None:
+        return
+    _, service, operation = event_name.split('.', 2)
+    record(service, (time.perf_counter() - start) * 1000, size=context.get('tracing_bytes', 0), error=True, operation=operation)
+
+def metric_name(dependency, field):
+    return f'{dependency}.{field}'
+
+def emf_line(function_name, duration_ms, cold_start, status, trace, request_id=None, lambda_function=None, prewarmed=False):
+    metrics = [
+        {'Name': 'Duration', 'Unit': 'Milliseconds'},
+        {'Name': 'ColdStart', 'Unit': 'Count'},
+        {'Name': 'Prewarmed', 'Unit': 'Count'},
+        {'Name': 'Errors', 'Unit': 'Count'}
+    ]
+    line = {
+        'Function': function_name,
+        'Duration': round(duration_ms, 2),
+        'ColdStart': 1 if cold_start else 0,
+        # 첫 실제 요청을 warm-up으로 이미 준비된 컨테이너가 받았는지
+        'Prewarmed': 1 if prewarmed else 0,
+        'Errors': 1 if status is None or status >= 500 else 0,
+        'statusCode': status,
+        'operations': trace['operations'],
+        'caches': trace['caches']
+    }
+    if request_id:
+        line['requestId'] = request_id
+    if lambda_function and lambda_function != function_name:
+        line['lambdaFunction'] = lambda_function
+    units = {'calls': 'Count', 'ms': 'Milliseconds', 'bytes': 'Bytes', 'retries': 'Count', 'errors': 'Count'}
+    for dependency, stats in sorted(trace['dependencies'].items()):
+        for field in FIELDS:
+            name = metric_name(dependency, field)
+            metrics.append({'Name': name, 'Unit': units[field]})
+            line[name] = round(stats[field], 2) if field == 'ms' else stats[field]
+    for name, counts in sorted(trace['caches'].items()):
+        metrics.append({'Name': f'{name}.cacheHits', 'Unit': 'Count'})
+        metrics.append({'Name': f'{name}.cacheMisses', 'Unit': 'Count'})
+        line[f'{name}.cacheHits'] = counts['hits']
+        line[f'{name}.cacheMisses'] = counts['misses']
+    for name, value in sorted(trace.get('counters', {}).items()):
+        metrics.append({'Name': name, 'Unit': 'Count'})
+        line[name] = value
+    line['_aws'] = {
+        'Timestamp': int(time.time() * 1000),
+        'CloudWatchMetrics': [{'Namespace': NAMESPACE, 'Dimensions': [['Function']], 'Metrics': metrics}]
+    }
+    return json.dumps(line, ensure_ascii=False, separators=(',', ':'))
+
+def warmup_line(function_name, duration_ms, cold_start, warmed, failed, trace):
+    # warm-up 호출은 Duration/ColdStart 대신 별도 지표로 남겨 실제 요청 지표와 섞이지 않게 함
+    # WarmupColdStart=1인 호출의 WarmupDuration이 실제 요청에서 빠진 콜드 경로 시간
+    metrics = [
+        {'Name': 'WarmupDuration', 'Unit': 'Milliseconds'},
+        {'Name': 'WarmupColdStart', 'Unit': 'Count'},
+        {'Name': 'WarmupErrors', 'Unit': 'Count'}
+    ]
+    line = {
+        'Function': function_name,
+        'WarmupDuration': round(duration_ms, 2),
+        'WarmupColdStart': 1 if cold_start else 0,
+        'WarmupErrors': len(failed),
+        'warmed': warmed,
+        'failed': failed,
+        'operations': trace['operations'],
+        '_aws': {
+            'Timestamp': int(time.time() * 1000),
+            'CloudWatchMetrics': [{'Namespace': NAMESPACE, 'Dimensions': [['Function']], 'Metrics': metrics}]
+        }
+    }
+    return json.dumps(line, ensure_ascii=False, separators=(',', ':'))
+
+def handle_warmup(function_name, modules):
+    """warm-up 호출 처리: 클라이언트/연결/캐시를 준비하고 바로 돌아감 (라우터도 사용)"""
+    global _cold_start
+    from placeholder_common import warmup
+    reset()
+    cold_start, _cold_start = _cold_start, False
+    start = time.perf_counter()
+    warmed, failed = warmup.run(modules)
+    duration_ms = (time.perf_counter() - start) * 1000
+    if ENABLED:
+        try:
+            print(warmup_line(function_name, duration_ms, cold_start, warmed, failed, snapshot()))
+        except Exception as e:
+            print(e)
+    return {
+        'statusCode': 200,
+        'body': json.dumps({'warmup': True, 'coldStart': cold_start, 'ms': round(duration_ms, 2), 'warmed': warmed, 'failed': failed})
+    }
+
+def traced(handler):
+    """Lambda 핸들러 데코레이터: 호출마다 기록을 비우고 끝나면 EMF 한 줄을 출력"""
+    function_name = handler.__module__.rsplit('.', 1)[-1]
+
+    @functools.wraps(handler)
+    def wrapper(event, context):
+        global _cold_start, _first_request
+        if isinstance(event, dict) and event.get('warmup') is True:
+            return handle_warmup(function_name, [sys.modules[handler.__module__]])
+        if not ENABLED:
+            return handler(event, context)
+        reset()
+        cold_start, _cold_start = _cold_start, False
+        prewarmed = _first_request and not cold_start
+        _first_request = False
+        start = time.perf_counter()
+        response = None
+        try:
+            response = handler(event, context)
+            return response
+        finally:
+            status = response.get('statusCode') if isinstance(response, dict) else None
+            # Function 차원은 핸들러 모듈 이름으로 고정해 라우터 프로필에서도 경로별로 나뉘게 함
+            lambda_function = getattr(context, 'function_name', None)
+            request_id = getattr(context, 'aws_request_id', None)
+            try:
+                print(emf_line(function_name, (time.perf_counter() - start) * 1000, cold_start, status, snapshot(), request_id, lambda_function, prewarmed))
+            except Exception as e:
+                print(e)
+    return wrapper
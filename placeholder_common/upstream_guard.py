@@ -0,0 +1,204 @@
+import math
+import os
+import threading
+import time
+from decimal import Decimal
+
+# 외부 지도 API(Google Directions, Kakao)를 보호하는 서킷 브레이커와 토큰 버킷 레이트 리미터
+# - 서킷 브레이커는 컨테이너마다 따로 두고, 연속 실패나 지연이 쌓이면 열려서 바로 실패를 돌려줌
+# - 토큰 버킷 상태는 DynamoDB에 두어 동시에 떠 있는 컨테이너 전체가 API 쿼터를 나눠 씀
+#   (RATE_LIMIT_BACKEND=local 이면 프로세스 안의 버킷을 대신 사용)
+#   상태 항목은 캐시 테이블에 두고, 한동안 쓰지 않아 가득 찬 버킷 항목은 TTL로 지워짐 (항목이 없으면 가득 찬 버킷)
+UPSTREAMS = {
+    'google_directions': {
+        'rate': 40.0,  # 초당 토큰
+        'capacity': 80,
+        'failure_threshold': 5,
+        'slow_ms': 4000,
+        'reset_timeout': 30
+    },
+    'kakao_address': {
+        'rate': 10.0,
+        'capacity': 20,
+        'failure_threshold': 5,
+        'slow_ms': 3000,
+        'reset_timeout': 30
+    }
+}
+LEASE_SIZE = 5  # DynamoDB 왕복 한 번에 가져오는 토큰 수
+LEASE_TTL = 1.0  # 가져온 토큰을 컨테이너가 쥐고 있을 수 있는 시간(초)
+RATE_LIMIT_TABLE = os.environ.get('RATE_LIMIT_TABLE')  # 없으면 runtime.CACHE_TABLE
+RATE_LIMIT_IDLE_TTL = 60 * 60  # 마지막 사용 뒤 상태 항목을 남겨 두는 시간 (버킷이 다 차는 시간보다 훨씬 김)
+
+class UpstreamUnavailable(Exception):
+    pass
+
+class CircuitOpenError(UpstreamUnavailable):
+    pass
+
+class RateLimited(UpstreamUnavailable):
+    pass
+
+class CircuitBreaker:
+    def __init__(self, name, failure_threshold=5, slow_ms=4000, reset_timeout=30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_ms = slow_ms
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            # 한 번만 시험 호출을 보내 보고 결과에 따라 닫거나 다시 엶
+            # (시험 호출 결과가 기록되지 않으면 reset_timeout 뒤 다시 시험)
+            self.state = 'half_open'
+            self.opened_at = time.monotonic()
+            return True
+
+    def record(self, success, elapsed_ms):
+        with self._lock:
+            if success and elapsed_ms <= self.slow_ms:
+                self.state = 'closed'
+                self.failures = 0
+                return
+            self.failures += 1
+            if self.state == 'half_open' or self.failures >= self.failure_threshold:
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+
+class LocalTokenBucket:
+    def __init__(self, name, rate, capacity):
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+class DynamoTokenBucket:
+    def __init__(self, name, rate, capacity, table=None):
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self.table = table
+        self.leased = 0
+        self.leased_at = 0.0
+        self._lock = threading.Lock()
+
+    def key(self):
+        from placeholder_common import runtime
+        return runtime.cache_key(f'RATELIMIT#{self.name}', 'RATELIMIT')
+
+    def acquire(self):
+        with self._lock:
+            # 먼저 이 컨테이너가 빌려 둔 토큰을 씀
+            if self.leased > 0 and time.monotonic() - self.leased_at < LEASE_TTL:
+                self.leased -= 1
+                return True
+            granted = self.lease()
+            if granted < 1:
+                return False
+            self.leased = granted - 1
+            self.leased_at = time.monotonic()
+            return True
+
+    def lease(self):
+        if self.table is None:
+            from placeholder_common import runtime
+            self.table = runtime.get_table(RATE_LIMIT_TABLE or runtime.CACHE_TABLE)
+        for _ in range(3):
+            item = self.table.get_item(Key=self.key(), ConsistentRead=True).get('Item')
+            now = time.time()
+            if item:
+                elapsed = max(0.0, now - float(item['updated_at']))
+                tokens = min(self.capacity, float(item['tokens']) + elapsed * self.rate)
+                version = int(item['version'])
+            else:
+                tokens, version = float(self.capacity), 0
+            if tokens < 1:
+                return 0
+            granted = min(LEASE_SIZE, math.floor(tokens))
+            try:
+                # version이 그대로일 때만 반영하는 낙관적 동시성 제어
+                self.table.update_item(
+                    Key=self.key(),
+                    UpdateExpression="SET tokens = :tokens, updated_at = :now, version = :next, expires_at = :expires_at",
+                    ConditionExpression="attribute_not_exists(version) OR version = :version",
+                    ExpressionAttributeValues={
+                        ':tokens': Decimal(str(round(tokens - granted, 3))),
+                        ':now': Decimal(str(round(now, 3))),
+                        ':next': version + 1,
+                        ':version': version,
+                        ':expires_at': int(now) + RATE_LIMIT_IDLE_TTL
+                    }
+                )
+                return granted
+            except self.table.meta.client.exceptions.ConditionalCheckFailedException:
+                continue
+        return 0
+
+_lock = threading.Lock()
+_breakers = {}
+_limiters = {}
+
+def get_breaker(upstream):
+    with _lock:
+        if upstream not in _breakers:
+            config = UPSTREAMS.get(upstream, {})
+            _breakers[upstream] = CircuitBreaker(
+                upstream,
+                failure_threshold=config.get('failure_threshold', 5),
+                slow_ms=config.get('slow_ms', 4000),
+                reset_timeout=config.get('reset_timeout', 30)
+            )
+        return _breakers[upstream]
+
+def get_limiter(upstream):
+    with _lock:
+        if upstream not in _limiters:
+            config = UPSTREAMS.get(upstream)
+            if config is None:
+                _limiters[upstream] = None
+            elif os.environ.get('RATE_LIMIT_BACKEND', 'dynamodb') == 'local':
+                _limiters[upstream] = LocalTokenBucket(upstream, config['rate'], config['capacity'])
+            else:
+                _limiters[upstream] = DynamoTokenBucket(upstream, config['rate'], config['capacity'])
+        return _limiters[upstream]
+
+def reset():
+    with _lock:
+        _breakers.clear()
+        _limiters.clear()
+
+def before_call(upstream):
+    if not get_breaker(upstream).allow():
+        raise CircuitOpenError(f'{upstream} circuit is open')
+    limiter = get_limiter(upstream)
+    try:
+        allowed = limiter is None or limiter.acquire()
+    except Exception as e:
+        # 레이트 리미터 저장소 장애로 외부 호출까지 막지는 않음
+        print(e)
+        allowed = True
+    if not allowed:
+        raise RateLimited(f'{upstream} rate limit exceeded')
+
+def after_call(upstream, success, elapsed_ms):
+    get_breaker(upstream).record(success, elapsed_ms)
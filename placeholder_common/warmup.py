@@ -0,0 +1,95 @@
+import os
+import sys
+import types
+from placeholder_common import runtime
+
+# 예약 warm-up 호출 처리 (tools/render_templates.py로 만든 template-warm.yaml 프로필이 몇 분마다 {"warmup": true}로 각 함수를 호출)
+# - 핸들러 모듈과 그 모듈이 쓰는 다른 placeholder_* 모듈의 lazy 클라이언트/테이블을 만들고
+#   가벼운 요청 하나씩으로 커넥션 풀에 TLS 연결을 열어 둠 (이후 호출마다 연결도 유지됨)
+# - 모듈에 warm(gu)가 있으면 자주 요청되는 gu 데이터를 컨테이너 캐시에 미리 읽어 둠
+# - 실제 요청은 처리하지 않음
+# Bedrock은 가벼운 요청이 없어 클라이언트(서비스 모델 로드, 엔드포인트 해석)만 만들어 둠
+WARMUP_GU = [gu.strip() for gu in os.environ.get('WARMUP_GU', '강남구,마포구,송파구,종로구,중구').split(',') if gu.strip()]
+BUCKET = 'place-data-for-recording'
+WARMUP_KEY = 'WARMUP'
+KEY_NAMES = {
+    'MEMBER': ('member_partition_key', 'member_sort_key'),
+    'HOTPLACE': ('hotplace_partition_key', 'hotplace_sort_key'),
+    runtime.CACHE_TABLE: ('cache_partition_key', 'cache_sort_key'),
+}
+
+def is_warmup(event):
+    # EventBridge 기본 예약 이벤트는 precompute_courses 등 예약 작업이 쓰므로 명시적인 표시만 인정
+    return isinstance(event, dict) and event.get('warmup') is True
+
+def open_connection(lazy):
+    target = lazy.resolve()
+    factory, args, _ = lazy.spec()
+    if factory is runtime.get_table and args[0] in KEY_NAMES:
+        pk, sk = KEY_NAMES[args[0]]
+        target.get_item(Key={pk: WARMUP_KEY, sk: WARMUP_KEY})
+    elif factory is runtime.get_client and args[0] == 'dynamodb':
+        pk, sk = KEY_NAMES['HOTPLACE']
+        target.get_item(TableName='HOTPLACE', Key={pk: {'S': WARMUP_KEY}, sk: {'S': WARMUP_KEY}})
+    elif factory is runtime.get_client and args[0] == 's3':
+        target.head_bucket(Bucket=BUCKET)
+
+def imported_modules(module):
+    # 모듈이 import한 이 저장소의 다른 모듈 (모듈 자체 또는 그 모듈의 함수로 import한 경우 모두)
+    for value in vars(module).values():
+        if isinstance(value, types.ModuleType):
+            name = value.__name__
+        elif callable(value):
+            name = getattr(value, '__module__', None) or ''
+        else:
+            continue
+        if name.startswith('placeholder_') and name != module.__name__ and name in sys.modules:
+            yield sys.modules[name]
+
+def dependencies(modules):
+    # 핸들러 모듈과 그 모듈이 (간접적으로) 쓰는 모든 placeholder_* 모듈
+    found = {}
+    pending = list(modules)
+    while pending:
+        module = pending.pop()
+        if module.__name__ in found:
+            continue
+        found[module.__name__] = module
+        pending.extend(imported_modules(module))
+    return list(found.values())
+
+def run(modules, gu_list=None):
+    """modules의 클라이언트/연결/캐시를 준비하고 준비한 항목 이름과 실패 목록을 돌려줌 (예외를 던지지 않음)"""
+    from placeholder_common import http_client
+    warmed, failed = [], []
+    seen = set()
+    for module in dependencies(modules):
+        for name, value in vars(module).items():
+            if not isinstance(value, runtime.Lazy) or id(value) in seen:
+                continue
+            seen.add(id(value))
+            label = f'{module.__name__.rsplit(".", 1)[-1]}.{name}'
+            try:
+                open_connection(value)
+                warmed.append(label)
+            except Exception as e:
+                print(f'warmup {label}: {e}')
+                failed.append(label)
+        if module is http_client or 'http_client' in vars(module):
+            if 'http_client' not in seen:
+                seen.add('http_client')
+                http_client.get_session()
+                warmed.append('http_client.session')
+    for module in modules:
+        warm = getattr(module, 'warm', None)
+        if not callable(warm):
+            continue
+        for gu in gu_list or WARMUP_GU:
+            label = f'{module.__name__.rsplit(".", 1)[-1]}.warm:{gu}'
+            try:
+                warm(gu)
+                warmed.append(label)
+            except Exception as e:
+                print(f'warmup {label}: {e}')
+                failed.append(label)
+    return warmed, failed
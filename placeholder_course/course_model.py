@@ -0,0 +1,77 @@
+import json
+import os
+import time
+from placeholder_common import tracing
+from placeholder_course.precompute_courses import fits_keyword
+
+# 코스 생성 모델 단계: 빠르고 싼 모델로 먼저 만들고, 결과가 검증을 통과하지 못할 때만 큰 모델로 넘김
+# 응답은 키워드 3개 x id 3개의 짧은 JSON이라 max_tokens는 넉넉히 잡아도 수백 토큰이면 충분함
+MODEL_TIERS = [
+    ('fast', os.environ.get('COURSE_MODEL_FAST', 'anthropic.claude-3-haiku-20240307-v1:0'), 300),
+    ('large', os.environ.get('COURSE_MODEL_LARGE', 'anthropic.claude-3-sonnet-20240229-v1:0'), 512),
+]
+
+class CourseValidationError(ValueError):
+    pass
+
+def parse_courses(text):
+    try:
+        courses = json.loads(text).get('courses')
+    except (TypeError, ValueError, AttributeError):
+        raise CourseValidationError('response is not the requested JSON format')
+    if not isinstance(courses, dict):
+        raise CourseValidationError('response has no courses object')
+    return courses
+
+def validate_courses(courses, keywords, places):
+    """키워드마다 id 3개, 장소 파일에 있는 id, 키워드 카테고리 규칙을 확인 (places: id -> category_group_name)"""
+    for keyword in keywords:
+        course_ids = courses.get(keyword)
+        if not isinstance(course_ids, list) or len(course_ids) != 3:
+            raise CourseValidationError(f'{keyword}: expected 3 ids')
+        course_ids = [str(course_id) for course_id in course_ids]
+        if len(set(course_ids)) != 3:
+            raise CourseValidationError(f'{keyword}: duplicate ids')
+        unknown = [course_id for course_id in course_ids if course_id not in places]
+        if unknown:
+            raise CourseValidationError(f'{keyword}: unknown ids {unknown}')
+        if not fits_keyword(keyword, [places[course_id] for course_id in course_ids]):
+            raise CourseValidationError(f'{keyword}: category rule not met')
+
+def generate_courses(invoke, keywords, places):
+    """invoke(model_id, max_tokens) -> 응답 텍스트. 단계별로 호출해 처음 검증을 통과한 코스를 돌려줌
+
+    단계마다 model.<단계> 지표(호출 수, 시간, 검증 실패는 errors)를 남기고,
+    큰 모델로 넘어갈 때 course_model.escalations를 셈.
+    마지막 단계까지 검증에 실패하면 마지막 응답에서 검증을 통과한 키워드만 돌려주고,
+    통과한 키워드가 없으면 RuntimeError (핸들러에서 500).
+    """
+    last = None
+    for index, (tier, model_id, max_tokens) in enumerate(MODEL_TIERS):
+        if index:
+            tracing.count('course_model.escalations')
+        start = time.perf_counter()
+        error = None
+        try:
+            courses = parse_courses(invoke(model_id, max_tokens))
+            last = courses
+            validate_courses(courses, keywords, places)
+        except (CourseValidationError, RuntimeError) as e:
+            # 호출 실패(스로틀링 등)도 다음 단계로 넘김
+            error = e
+        tracing.record(f'model.{tier}', (time.perf_counter() - start) * 1000, error=error is not None)
+        if error is None:
+            return courses
+        print(f'{tier} model output rejected: {error}')
+    # 검증에 실패한 키워드는 버림 (create_course는 빈 코스로 자리만 남김)
+    valid = {}
+    for keyword in keywords if last else []:
+        try:
+            validate_courses(last, [keyword], places)
+            valid[keyword] = last[keyword]
+        except CourseValidationError:
+            pass
+    if not valid:
+        raise RuntimeError(f'Failed to generate courses: {error}')
+    tracing.count('course_model.dropped_keywords', len(keywords) - len(valid))
+    return valid
@@ -1,25 +1,119 @@
-import boto3
 import json
-from decimal import Decimal
-import os
-import random
 from boto3.dynamodb.conditions import Key
+from placeholder_common import idempotency, runtime, serialization, tracing
+from placeholder_common.course_ids import legacy_active_course_keys, new_course_id
 
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table('MEMBER')  # DynamoDB 테이블 이름 직접 설정
+table = runtime.lazy_table('MEMBER')  # DynamoDB 테이블 이름 직접 설정
 
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, o):
-        if isinstance(o, Decimal):
-            return float(o)
-        return super(DecimalEncoder, self).default(o)
+COURSE_ID_ATTEMPTS = 3  # id가 겹치거나 동시에 포인터가 바뀌었을 때 다시 읽고 시도하는 횟수
+TRANSACT_MAX_ITEMS = 100  # TransactWriteItems 한 번에 넣을 수 있는 최대 항목 수
 
+class MemberNotFound(Exception):
+    pass
+
+def member_info_key(memberId):
+    return {
+        'member_partition_key': f"MEMBER#{memberId}",
+        'member_sort_key': f"INFO#{memberId}"
+    }
+
+def get_member_info(memberId):
+    # 포인터를 옮기는 조건에 쓰므로 강한 일관성 읽기
+    return table.get_item(
+        Key=member_info_key(memberId),
+        ProjectionExpression='member_sort_key, active_course',
+        ConsistentRead=True
+    ).get('Item')
+
+def pause_item(memberId, course_key):
+    return {
+        'Update': {
+            'TableName': table.name,
+            'Key': {
+                'member_partition_key': f"MEMBER#{memberId}",
+                'member_sort_key': course_key
+            },
+            'UpdateExpression': "SET #now = :false",
+            # 없는 코스를 now만 있는 항목으로 새로 만들지 않음
+            'ConditionExpression': "attribute_exists(member_sort_key)",
+            'ExpressionAttributeNames': {
+                '#now': 'now'
+            },
+            'ExpressionAttributeValues': {
+                ':false': 'FALSE'
+            }
+        }
+    }
+
+def pause_legacy_overflow(memberId, legacy_keys):
+    # 새 코스 Put과 INFO Update를 뺀 자리보다 이전 코스가 많으면 넘치는 코스는 먼저 중지
+    # (어차피 이번 트랜잭션으로 중지될 코스라 먼저 반영되어도 활성 코스가 늘지는 않음)
+    capacity = TRANSACT_MAX_ITEMS - 2
+    overflow = legacy_keys[capacity:]
+    for i in range(0, len(overflow), TRANSACT_MAX_ITEMS):
+        table.meta.client.transact_write_items(
+            TransactItems=[pause_item(memberId, course_key) for course_key in overflow[i:i + TRANSACT_MAX_ITEMS]]
+        )
+    return legacy_keys[:capacity]
+
+def build_course_items(memberId, member_sort_key, gu, courses, member_info, legacy_keys=()):
+    """새 코스 저장, 이전 활성 코스 중지, INFO 항목의 active_course 포인터 이동을 하나의 트랜잭션으로 만듦
+
+    포인터가 읽은 값 그대로일 때만 반영되므로 회원마다 now=TRUE인 코스는 포인터가 가리키는 하나뿐임.
+    포인터가 아직 없는 회원은 now=TRUE로 남은 이전 코스(legacy_keys)를 함께 중지하고 포인터를 만듦.
+    """
+    course_item = {
+        'member_partition_key': f"MEMBER#{memberId}",
+        'member_sort_key': member_sort_key,
+        'gu': gu,
+        'now': "TRUE"
+    }
+    for i, course in enumerate(courses, start=1):
+        course_item[f'course{i}'] = course
+
+    info_update = {
+        'TableName': table.name,
+        'Key': member_info_key(memberId),
+        'UpdateExpression': "set active_course = :course",
+        'ExpressionAttributeValues': {
+            ':course': member_sort_key
+        }
+    }
+    if 'active_course' not in member_info:
+        # 처음 포인터를 만듦 (없는 회원이면 active_course만 있는 INFO 항목을 새로 만들지 않음)
+        info_update['ConditionExpression'] = "attribute_exists(member_partition_key) AND attribute_not_exists(active_course)"
+        paused = list(legacy_keys)
+    elif member_info['active_course']:
+        info_update['ConditionExpression'] = "active_course = :previous"
+        info_update['ExpressionAttributeValues'][':previous'] = member_info['active_course']
+        paused = [member_info['active_course']]
+    else:
+        # 중지되어 포인터가 비어 있음 (NULL)
+        info_update['ConditionExpression'] = "attribute_type(active_course, :null)"
+        info_update['ExpressionAttributeValues'][':null'] = 'NULL'
+        paused = []
+
+    return [
+        {
+            'Put': {
+                'TableName': table.name,
+                'Item': course_item,
+                'ConditionExpression': "attribute_not_exists(member_sort_key)"
+            }
+        },
+        {
+            'Update': info_update
+        }
+    ] + [pause_item(memberId, course_key) for course_key in paused]
+
+@tracing.traced
+@idempotency.idempotent
 def handler(event, context):
     try:
         headers = {
            'Access-Control-Allow-Origin': '*',
            'Access-Control-Allow-Methods': 'GET,POST,OPTIONS',
-           'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token'
+           'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,Idempotency-Key'
         }
 
         body = json.loads(event['body'])
@@ -30,14 +124,7 @@ def handler(event, context):
 
         memberId = body['memberId']
         gu = body['gu']
-        course1 = body['course1']
-        course2 = body['course2']
-        course3 = body['course3']
-        course4 = body['course4']
-        course5 = body['course5']
-
-        member_partition_key = f"MEMBER#{memberId}"
-        member_sort_key = f"COURSE#{random.randint(100000, 999999)}"
+        courses = [body[f'course{i}'] for i in range(1, 6)]
     except (KeyError, json.JSONDecodeError, ValueError) as e:
         return {
             'statusCode': 400,
@@ -46,32 +133,35 @@ def handler(event, context):
         }
 
     try:
-        # MEMBER 항목 업데이트
-        table.update_item(
-            Key={
-                'member_partition_key': member_partition_key,
-                'member_sort_key': member_sort_key
-            },
-            UpdateExpression="set gu = :g, course1 = :c1, course2 = :c2, course3 = :c3, course4 = :c4, course5 = :c5, #n = :now",
-            ExpressionAttributeValues={
-                ':g': gu,
-                ':c1': course1,
-                ':c2': course2,
-                ':c3': course3,
-                ':c4': course4,
-                ':c5': course5,
-                ':now': "TRUE"
-            },
-            ExpressionAttributeNames={
-                '#n': 'now'
-            },
-            ReturnValues="UPDATED_NEW"
-        )
+        for attempt in range(COURSE_ID_ATTEMPTS):
+            member_info = get_member_info(memberId)
+            if member_info is None:
+                raise MemberNotFound(memberId)
+            legacy_keys = []
+            if 'active_course' not in member_info:
+                legacy_keys = pause_legacy_overflow(memberId, legacy_active_course_keys(memberId))
+
+            member_sort_key = f"COURSE#{new_course_id()}"
+            try:
+                table.meta.client.transact_write_items(
+                    TransactItems=build_course_items(memberId, member_sort_key, gu, courses, member_info, legacy_keys)
+                )
+                break
+            except table.meta.client.exceptions.TransactionCanceledException:
+                # 같은 id가 이미 있거나 그 사이 다른 요청이 포인터를 옮겼으면 INFO를 다시 읽고 새 id로 시도
+                if attempt == COURSE_ID_ATTEMPTS - 1:
+                    raise
 
         return {
             'statusCode': 200,
             'headers': headers,
-            'body': json.dumps({'message': 'Member courses updated successfully'}, cls=DecimalEncoder, ensure_ascii=False, indent=4)
+            'body': serialization.dumps({'message': 'Member courses updated successfully', 'courseId': member_sort_key.split('#')[1]})
+        }
+    except MemberNotFound:
+        return {
+            'statusCode': 404,
+            'headers': headers,
+            'body': json.dumps({'message': 'Member not found'})
         }
     except Exception as e:
         print(e)
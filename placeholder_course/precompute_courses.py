@@ -0,0 +1,210 @@
+import itertools
+import json
+import time
+import urllib.parse
+import zlib
+from placeholder_common import runtime, tracing
+
+# 매일 갱신되는 places_{gu}.json으로 (gu, 키워드)마다 추천 코스 후보를 미리 계산해 HOTPLACE 테이블에 저장
+# create_course는 저장된 후보가 있으면 Bedrock을 부르지 않고 회원별 이동 시간만 계산함
+s3 = runtime.lazy_client('s3')
+hotplace_table = runtime.lazy_table('HOTPLACE')
+
+BUCKET = 'place-data-for-recording'
+PLACES_PREFIX = 'refine_json_for_bedrock/today/places_'
+RECOMMENDATION_SORT_KEY = 'Course#RECOMMEND'
+CANDIDATES_PER_KEYWORD = 5
+SERVE_TOP = 3  # 같은 코스로 모두 몰리지 않게 회원마다 상위 후보 중 하나를 골라 줌
+RECOMMENDATION_TTL = 36 * 60 * 60  # 하루 한 번 갱신이 빠져도 다음 날까지는 사용
+RECOMMENDATION_CACHE_TTL = 300  # 컨테이너 캐시 (항목은 하루 한 번 바뀜)
+TIMES = ('12:00', '15:00', '18:00')
+
+# create_course 프롬프트의 혼잡도 점수 기준과 같음 (점수가 낮을수록 좋음)
+CONGESTION_POINTS = {'여유': 10, '보통': 20, '약간 붐빔': 30, '붐빔': 40}
+ANY = None
+# 키워드별 코스 구성: 자리마다 허용하는 카테고리 (ANY는 아무 카테고리)
+KEYWORD_SLOTS = {
+    'SNS 자랑하기 좋은': [{'카페'}, {'놀거리'}, ANY],
+    '대화하기 좋은': [{'음식점'}, {'카페'}, ANY],
+    '다이어트 실패 하기 좋은': [{'음식점'}, {'음식점'}, {'카페', '놀거리'}],
+    '땡땡이 치기 좋은': [{'음식점'}, {'카페'}, {'놀거리'}],
+}
+
+def fits_keyword(keyword, categories):
+    # 코스의 카테고리 목록이 키워드 구성 규칙을 만족하는지 (규칙이 없는 키워드는 항상 True)
+    slots = KEYWORD_SLOTS.get(keyword)
+    if slots is None:
+        return True
+    if len(categories) != len(slots):
+        return False
+    return any(
+        all(allowed is ANY or category in allowed for allowed, category in zip(slots, order))
+        for order in itertools.permutations(categories)
+    )
+
+def recommendation_key(gu):
+    return {
+        'hotplace_partition_key': gu,
+        'hotplace_sort_key': RECOMMENDATION_SORT_KEY
+    }
+
+def value_at(value, at):
+    # 시간대별 dict이면 해당 시간 값, 아니면 값 그대로
+    return value.get(at) if isinstance(value, dict) else value
+
+def place_score(place, at):
+    congestion = CONGESTION_POINTS.get(value_at(place.get('congestion'), at), CONGESTION_POINTS['보통'])
+    min_pop = float(value_at(place.get('min_pop'), at) or 0)
+    rating = float(place.get('rating') or 5.0)
+    return congestion + min_pop / 1000 * 0.1 + (rating - 5.0)
+
+def slot_scores(place):
+    # 모든 시간대의 점수를 한 번에 계산 (TIMES 순서)
+    return [place_score(place, at) for at in TIMES]
+
+def score_places(places):
+    # (점수, 가장 한가한 시간, id, 카테고리) - 점수 오름차순
+    scored = []
+    for place in places:
+        if 'id' not in place:
+            continue
+        scores = slot_scores(place)
+        best = scores.index(min(scores))
+        scored.append((scores[best], best, str(place['id']), place.get('category_group_name')))
+    scored.sort()
+    return scored
+
+def build_candidates(scored, slots, count=CANDIDATES_PER_KEYWORD):
+    # 자리마다 아직 쓰지 않은 가장 좋은 장소를 골라 후보를 만듦 (후보끼리 장소가 겹치지 않게 해 다양성 확보)
+    used = set()
+    candidates = []
+    for _ in range(count):
+        course = []
+        for allowed in slots:
+            pick = next((p for p in scored if p[2] not in used and p not in course and (allowed is ANY or p[3] in allowed)), None)
+            if pick is None:
+                break
+            course.append(pick)
+        if len(course) < len(slots):
+            # 남은 장소로는 코스를 더 만들 수 없음 (지금까지 만든 후보는 아래에서 정렬)
+            break
+        used.update(p[2] for p in course)
+        # 코스 안에서는 각 장소가 가장 한가한 시간 순서로 방문
+        course.sort(key=lambda p: (p[1], p[0]))
+        candidates.append((sum(p[0] for p in course), [p[2] for p in course]))
+    candidates.sort(key=lambda c: c[0])
+    return candidates
+
+def scores_by_id(places):
+    # id -> 시간대별 점수 목록
+    return {str(place['id']): slot_scores(place) for place in places if 'id' in place}
+
+def best_slot(scores):
+    return scores.index(min(scores)) if scores else None
+
+def compute_recommendations(places):
+    scored = score_places(places)
+    scores = scores_by_id(places)
+    # 저장 형식: 키워드 -> ["id@12:00점수/15:00점수/18:00점수,...", ...] (순위 순)
+    return {
+        keyword: [
+            ','.join(f"{place_id}@{'/'.join(f'{v:.2f}' for v in scores[place_id])}" for place_id in ids)
+            for _, ids in build_candidates(scored, slots)
+        ]
+        for keyword, slots in KEYWORD_SLOTS.items()
+    }
+
+def parse_course(course):
+    # "id@점수/점수/점수,..." -> [(id, 시간대별 점수 목록), ...] (점수가 없는 예전 형식은 None)
+    parsed = []
+    for entry in course.split(','):
+        place_id, _, scores = entry.partition('@')
+        parsed.append((place_id, [float(v) for v in scores.split('/')] if '/' in scores else None))
+    return parsed
+
+def load_places(gu):
+    response = s3.get_object(Bucket=BUCKET, Key=f'{PLACES_PREFIX}{gu}.json')
+    return json.loads(response['Body'].read().decode('utf-8')), response.get('ETag', '').strip('"')
+
+def precompute(gu):
+    places, version = load_places(gu)
+    recommendations = compute_recommendations(places)
+    now = int(time.time())
+    hotplace_table.put_item(Item=dict(
+        recommendation_key(gu),
+        courses=recommendations,
+        data_version=version,
+        generated_at=now,
+        expires_at=now + RECOMMENDATION_TTL
+    ))
+    return {keyword: len(courses) for keyword, courses in recommendations.items()}
+
+def gu_from_key(key):
+    # refine_json_for_bedrock/today/places_강남구.json -> 강남구
+    # S3 이벤트의 키는 URL 인코딩되어 옴 (places_%EA%B0%95%EB%82%A8%EA%B5%AC.json)
+    key = urllib.parse.unquote_plus(key)
+    if not key.startswith(PLACES_PREFIX) or not key.endswith('.json'):
+        return None
+    return key[len(PLACES_PREFIX):-len('.json')]
+
+def list_gu():
+    gu_list = []
+    paginator = s3.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=BUCKET, Prefix=PLACES_PREFIX):
+        for obj in page.get('Contents', []):
+            gu = gu_from_key(obj['Key'])
+            if gu:
+                gu_list.append(gu)
+    return gu_list
+
+_recommendations = {}  # gu -> (읽은 시각, 만료 시각, 코스)
+
+def get_precomputed_courses(gu):
+    """create_course용: 유효한 저장 결과가 있으면 키워드 -> 순위별 코스([(id, 시간대별 점수), ...]) dict, 없으면 빈 dict"""
+    now = time.time()
+    cached = _recommendations.get(gu)
+    tracing.cache('recommendation_item', cached is not None and now - cached[0] < RECOMMENDATION_CACHE_TTL)
+    if cached is None or now - cached[0] >= RECOMMENDATION_CACHE_TTL:
+        try:
+            item = hotplace_table.get_item(Key=recommendation_key(gu)).get('Item') or {}
+        except Exception as e:
+            print(e)
+            return {}
+        courses = {keyword: [parse_course(course) for course in courses] for keyword, courses in item.get('courses', {}).items()}
+        cached = _recommendations[gu] = (now, int(item.get('expires_at', 0)), courses)
+    if cached[1] <= now:
+        return {}
+    return cached[2]
+
+def pick_course(candidates, memberId, keyword):
+    # 회원과 키워드로 상위 후보 중 하나를 고정적으로 고름 (같은 회원은 같은 결과)
+    top = candidates[:SERVE_TOP]
+    return top[zlib.crc32(f'{memberId}:{keyword}'.encode('utf-8')) % len(top)]
+
+@tracing.traced
+def handler(event, context):
+    # S3 ObjectCreated 이벤트면 바뀐 gu만, 스케줄/수동 호출이면 {"gu": [...]} 또는 전체 gu를 다시 계산
+    records = event.get('Records') or []
+    if records:
+        gu_list = [gu for gu in (gu_from_key(r['s3']['object']['key']) for r in records if 's3' in r) if gu]
+        if not gu_list:
+            # places_*.json이 아닌 객체의 이벤트면 아무것도 다시 계산하지 않음
+            return {
+                'statusCode': 200,
+                'body': json.dumps({'computed': {}, 'failed': {}}, ensure_ascii=False)
+            }
+    else:
+        gu_list = event.get('gu') or list_gu()
+
+    results, failed = {}, {}
+    for gu in gu_list:
+        try:
+            results[gu] = precompute(gu)
+        except Exception as e:
+            print(f'{gu}: {e}')
+            failed[gu] = str(e)
+    # 스케줄 호출이라도 EMF의 Errors 지표가 맞게 잡히도록 statusCode를 함께 돌려줌
+    return {
+        'statusCode': 500 if failed and not results else 200,
+        'body': json.dumps({'computed': results, 'failed': failed}, ensure_ascii=False)
+    }
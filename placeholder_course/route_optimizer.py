@@ -0,0 +1,116 @@
+import itertools
+import math
+from placeholder_common import directions, tracing
+
+# 코스 장소 방문 순서 최적화
+# - 회원 출발지에서 시작해 모든 장소를 한 번씩 들르는 경로 중 총 이동 시간이 가장 짧은 순서를 고름
+# - 시간대 제약: 장소마다 혼잡도가 가장 낮은 시간대(slot, 12:00/15:00/18:00 순서의 번호)가 있으면
+#   그 시간대 순서를 지킴 (slot이 없는 장소는 어디에 두어도 됨)
+# - 이동 시간 행렬은 directions 캐시에 있는 Google 값을 쓰고, 없으면 직선거리로 추정함 (API를 새로 부르지 않음)
+# - 장소가 EXACT_LIMIT개 이하면 모든 순열을 확인하고, 그보다 많으면 최근접 이웃 + 2-opt로 근사
+EXACT_LIMIT = 7  # 7! = 5040
+TRANSIT_KMH = 15.0  # 도시 대중교통 평균 속도 (환승/대기 포함)
+DETOUR_FACTOR = 1.3  # 직선거리 대비 실제 경로 길이
+OVERHEAD_MINUTES = 5.0  # 정류장까지 걷기 등 고정 시간
+EARTH_RADIUS_KM = 6371.0
+
+def distance_km(start, end):
+    (x1, y1), (x2, y2) = start, end
+    lat1, lat2 = math.radians(y1), math.radians(y2)
+    dlat, dlng = lat2 - lat1, math.radians(x2 - x1)
+    a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlng / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+def estimate_minutes(start, end):
+    if start == end:
+        return 0.0
+    return OVERHEAD_MINUTES + distance_km(start, end) * DETOUR_FACTOR / TRANSIT_KMH * 60
+
+def travel_minutes(start, end):
+    # 최근 Google 응답(오래된 값 포함)이 캐시에 있으면 그 값, 없으면 추정치
+    cached = directions.cached_duration(directions.cache_key(*start, *end), directions.STALE_TTL)
+    tracing.cache('travel_matrix', cached is not None)
+    if cached is not None:
+        try:
+            return float(cached)
+        except (TypeError, ValueError):
+            pass
+    return estimate_minutes(start, end)
+
+def travel_matrix(start, points):
+    # 0번은 출발지 (출발지를 모르면 출발지에서의 이동 시간은 모두 0)
+    nodes = [start] + points
+    size = len(nodes)
+    matrix = [[0.0] * size for _ in range(size)]
+    for i in range(size):
+        for j in range(1, size):
+            if i != j and nodes[i] is not None:
+                matrix[i][j] = travel_minutes(nodes[i], nodes[j])
+    return matrix
+
+def feasible(order, slots):
+    last = -1
+    for index in order:
+        slot = slots[index]
+        if slot is None:
+            continue
+        if slot < last:
+            return False
+        last = slot
+    return True
+
+def route_cost(order, matrix):
+    cost, previous = 0.0, 0
+    for index in order:
+        cost += matrix[previous][index + 1]
+        previous = index + 1
+    return cost
+
+def exact_order(matrix, slots):
+    # 순열은 원래 순서부터 나오므로 비용이 같으면 원래 순서를 유지
+    best, best_cost = None, math.inf
+    for order in itertools.permutations(range(len(slots))):
+        if not feasible(order, slots):
+            continue
+        cost = route_cost(order, matrix)
+        if cost < best_cost:
+            best, best_cost = list(order), cost
+    return best
+
+def heuristic_order(matrix, slots):
+    # 최근접 이웃: 아직 남은 장소 중 시간대 순서를 어기지 않는 가장 가까운 곳으로 이동
+    remaining = list(range(len(slots)))
+    order, previous = [], 0
+    while remaining:
+        earliest = min((slots[i] for i in remaining if slots[i] is not None), default=None)
+        allowed = [i for i in remaining if slots[i] is None or slots[i] == earliest]
+        nearest = min(allowed, key=lambda i: matrix[previous][i + 1])
+        order.append(nearest)
+        remaining.remove(nearest)
+        previous = nearest + 1
+    # 2-opt: 구간을 뒤집어 더 짧아지고 제약도 지키면 바꿈
+    improved = True
+    while improved:
+        improved = False
+        for i in range(len(order) - 1):
+            for j in range(i + 1, len(order)):
+                candidate = order[:i] + order[i:j + 1][::-1] + order[j + 1:]
+                if feasible(candidate, slots) and route_cost(candidate, matrix) < route_cost(order, matrix) - 1e-9:
+                    order, improved = candidate, True
+    return order
+
+def optimize(start, points, slots=None):
+    """start: 출발지 (x, y) 또는 None, points: 장소 좌표 목록, slots: 장소별 시간대 번호(또는 None) 목록
+
+    총 이동 시간이 가장 짧은 방문 순서(points의 인덱스 목록)를 돌려줌.
+    좌표가 없는 장소가 있으면 순서를 바꾸지 않음.
+    """
+    slots = list(slots) if slots is not None else [None] * len(points)
+    if len(points) < 2 or any(p is None or None in p for p in points):
+        return list(range(len(points)))
+    points = [(float(x), float(y)) for x, y in points]
+    start = (float(start[0]), float(start[1])) if start is not None and None not in start else None
+    matrix = travel_matrix(start, points)
+    if len(points) <= EXACT_LIMIT:
+        return exact_order(matrix, slots)
+    return heuristic_order(matrix, slots)
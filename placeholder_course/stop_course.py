@@ -1,63 +1,149 @@
-import boto3
 import json
 import os
-from decimal import Decimal
-from boto3.dynamodb.conditions import Key, Attr
+from placeholder_common import idempotency, runtime, serialization, tracing
+from placeholder_common.course_ids import legacy_active_course_keys
 
-dynamodb = boto3.resource('dynamodb')
-member_table = dynamodb.Table('MEMBER')
+member_table = runtime.lazy_table('MEMBER')
 
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, o):
-        if isinstance(o, Decimal):
-            return float(o)
-        return super(DecimalEncoder, self).default(o)
+TRANSACT_MAX_ITEMS = 100  # TransactWriteItems 한 번에 넣을 수 있는 최대 항목 수
+PAUSE_ATTEMPTS = 3  # 동시에 들어온 요청과 겹쳤을 때 다시 조회해서 시도하는 횟수
 
-def handler(event, context):
-    try:
-        headers = {
-           'Access-Control-Allow-Origin': '*',
-           'Access-Control-Allow-Methods': 'GET,POST,OPTIONS',
-           'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token'
-        }
+def member_info_key(memberId):
+    return {
+        'member_partition_key': f'MEMBER#{memberId}',
+        'member_sort_key': f'INFO#{memberId}'
+    }
 
-        query_params = event.get('queryStringParameters', {})
-        memberId = query_params.get('memberId')
-    except KeyError:
-        return json.dumps({'message': 'Invalid request, missing path parameter memberId'}, cls=DecimalEncoder, ensure_ascii=False, indent=4)
+def get_active_course_keys(memberId):
+    # 활성 코스는 INFO 항목의 active_course 포인터가 가리키는 하나뿐 (create_course_id가 포인터를 옮길 때 이전 코스를 중지함)
+    member_info = member_table.get_item(
+        Key=member_info_key(memberId),
+        ProjectionExpression='member_sort_key, active_course',
+        ConsistentRead=True  # 포인터 값이 TransactWriteItems 조건에 쓰이므로 최신 값을 읽음
+    ).get('Item')
+    if member_info and 'active_course' in member_info:
+        active_course = member_info['active_course']
+        return member_info, [active_course] if active_course else []
 
-    try:
-        # 'now' 속성이 'TRUE'인 아이템을 찾기 위한 쿼리
-        response = member_table.query(
-            KeyConditionExpression=Key('member_partition_key').eq(f'MEMBER#{memberId}') & Key('member_sort_key').begins_with(f'COURSE#'),
-            FilterExpression=Attr('now').eq('TRUE')
-        )
-        items = response.get('Items', [])
-        
-        if not items:
-            return json.dumps({'message': 'No items found with now=TRUE'}, cls=DecimalEncoder, ensure_ascii=False, indent=4)
-
-        # 각 아이템의 'now' 속성을 'FALSE'로 업데이트
-        for item in items:
-            member_table.update_item(
-                Key={
-                    'member_partition_key': item['member_partition_key'],
-                    'member_sort_key': item['member_sort_key']
+    # 포인터가 아직 없는 회원은 now=TRUE로 남은 이전 코스를 모두 중지하고 포인터를 만듦
+    return member_info, legacy_active_course_keys(memberId)
+
+def build_pause_items(memberId, member_info, course_keys):
+    # 각 코스는 now가 아직 TRUE일 때만 FALSE로 바꿔 동시에 들어온 중지 요청 중 하나만 반영되도록 함
+    transact_items = [
+        {
+            'Update': {
+                'TableName': member_table.name,
+                'Key': {
+                    'member_partition_key': f'MEMBER#{memberId}',
+                    'member_sort_key': course_key
                 },
-                UpdateExpression="SET #now = :new_val",
-                ExpressionAttributeNames={
+                'UpdateExpression': "SET #now = :false",
+                'ConditionExpression': "#now = :true",
+                'ExpressionAttributeNames': {
                     '#now': 'now'
                 },
-                ExpressionAttributeValues={
-                    ':new_val': 'FALSE'
+                'ExpressionAttributeValues': {
+                    ':true': 'TRUE',
+                    ':false': 'FALSE'
                 }
-            )
+            }
+        }
+        for course_key in course_keys
+    ]
+
+    if member_info is None:
+        return transact_items
+
+    # 활성 코스 포인터를 비움 (속성이 없으면 이전 데이터로 간주하므로 NULL로 남김)
+    info_update = {
+        'TableName': member_table.name,
+        'Key': member_info_key(memberId),
+        'UpdateExpression': "SET active_course = :none",
+        'ExpressionAttributeValues': {
+            ':none': None
+        }
+    }
+    if 'active_course' in member_info:
+        info_update['ConditionExpression'] = "active_course = :course"
+        info_update['ExpressionAttributeValues'][':course'] = course_keys[0]
+    else:
+        info_update['ConditionExpression'] = "attribute_not_exists(active_course)"
+    transact_items.append({'Update': info_update})
+    return transact_items
+
+def is_conditional_cancel(error):
+    reasons = error.response.get('CancellationReasons', [])
+    return bool(reasons) and all(reason.get('Code') in ('None', 'ConditionalCheckFailed') for reason in reasons)
+
+def pause_courses(memberId, member_info, course_keys):
+    # 코스 중지와 포인터 정리를 TransactWriteItems로 한 번에 처리
+    # 이전 데이터가 많아 나눠서 처리할 때는 포인터를 만드는 INFO Update가 마지막 묶음에 들어가므로
+    # 중간 묶음이 취소되어도 회원은 포인터가 없는 상태로 남고, 다시 조회하면 아직 TRUE인 코스만 나와 이어서 중지됨
+    # 조건이 맞지 않는 묶음이 있으면 TransactionCanceledException을 그대로 던짐
+    transact_items = build_pause_items(memberId, member_info, course_keys)
+    for i in range(0, len(transact_items), TRANSACT_MAX_ITEMS):
+        member_table.meta.client.transact_write_items(
+            TransactItems=transact_items[i:i + TRANSACT_MAX_ITEMS]
+        )
 
+@tracing.traced
+@idempotency.idempotent
+def handler(event, context):
+    headers = {
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'GET,POST,OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,Idempotency-Key'
+    }
+
+    try:
+        query_params = event.get('queryStringParameters') or {}
+        memberId = query_params.get('memberId')
+        if not memberId:
+            raise ValueError("Missing required query parameter: memberId")
+    except (KeyError, ValueError) as e:
+        return {
+            'statusCode': 400,
+            'headers': headers,
+            'body': json.dumps({'message': f'Invalid request, missing parameter: {str(e)}'})
+        }
+
+    try:
+        already_paused = False
+        for attempt in range(PAUSE_ATTEMPTS):
+            member_info, course_keys = get_active_course_keys(memberId)
+
+            if not course_keys:
+                if attempt == 0:
+                    return {
+                        'statusCode': 404,
+                        'headers': headers,
+                        'body': json.dumps({'message': 'No items found with now=TRUE'})
+                    }
+                # 다시 조회해 보니 다른 요청이 모두 중지했음
+                already_paused = True
+                break
+
+            try:
+                pause_courses(memberId, member_info, course_keys)
+                break
+            except member_table.meta.client.exceptions.TransactionCanceledException as e:
+                if not is_conditional_cancel(e):
+                    raise
+                # 다른 요청과 겹쳐 일부가 취소되었으면 아직 TRUE인 코스를 다시 조회해 중지
+        else:
+            raise RuntimeError('Active courses kept changing while pausing')
+
+        message = 'Course already paused' if already_paused else 'Updated items successfully'
         return {
             'statusCode': 200,
             'headers': headers,  
-            'body' : json.dumps({'message': 'Updated items successfully'}, cls=DecimalEncoder, ensure_ascii=False, indent=4)
+            'body' : serialization.dumps({'message': message})
         }
     except Exception as e:
         print(e)
-        return json.dumps({'message': 'Could not retrieve Member'}, cls=DecimalEncoder, ensure_ascii=False, indent=4)
+        return {
+            'statusCode': 500,
+            'headers': headers,
+            'body': json.dumps({'message': 'Could not pause member course'})
+        }
@@ -1,17 +1,11 @@
-import boto3
 import json
-from decimal import Decimal
-from boto3.dynamodb.conditions import Key
+from placeholder_common import dynamo, serialization, tracing
 
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table('HOTPLACE')  # DynamoDB 테이블 이름 직접 설정
-
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, o):
-        if isinstance(o, Decimal):
-            return float(o)
-        return super(DecimalEncoder, self).default(o)
+TABLE_NAME = 'HOTPLACE'  # DynamoDB 테이블 이름 직접 설정
+# 응답에 쓰는 속성만 가져옴
+HOTPLACE_ATTRIBUTES = ['hotplace_partition_key', 'hotplace_sort_key', 'congestion', 'kakaoname', 'mapx', 'name', 'mapy']
 
+@tracing.traced
 def handler(event, context):
     headers = {
         'Access-Control-Allow-Origin': '*',
@@ -32,10 +26,12 @@ def handler(event, context):
         }
 
     try:
-        response = table.query(
-            KeyConditionExpression=Key('hotplace_partition_key').eq(hotplace_partition_key) & Key('hotplace_sort_key').begins_with('Hotplace#')
+        items = dynamo.query(
+            TABLE_NAME,
+            "hotplace_partition_key = :gu AND begins_with(hotplace_sort_key, :prefix)",
+            {':gu': hotplace_partition_key, ':prefix': 'Hotplace#'},
+            attributes=HOTPLACE_ATTRIBUTES
         )
-        items = response.get('Items', [])
         if not items:
             return {
                 'statusCode': 404,
@@ -59,7 +55,7 @@ def handler(event, context):
         return {
             'statusCode': 200,
             'headers': headers,
-            'body': json.dumps(transformed_items, cls=DecimalEncoder, ensure_ascii=False, indent=4)
+            'body': serialization.dumps(transformed_items)
         }
     except Exception as e:
         print(e)
@@ -0,0 +1,95 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from placeholder_common import dynamo, serialization, tracing
+
+TABLE_NAME = 'HOTPLACE'  # DynamoDB 테이블 이름 직접 설정
+# 응답에 쓰는 속성만 가져옴 (파티션 키는 응답에서 gu 키로 묶이므로 제외)
+HOTPLACE_ATTRIBUTES = ['hotplace_sort_key', 'congestion', 'kakaoname', 'mapx', 'name', 'mapy']
+SEOUL_GU = [
+    '강남구', '강동구', '강북구', '강서구', '관악구', '광진구', '구로구', '금천구', '노원구', '도봉구', '동대문구', '동작구', '마포구',
+    '서대문구', '서초구', '성동구', '성북구', '송파구', '양천구', '영등포구', '용산구', '은평구', '종로구', '중구', '중랑구'
+]
+MAX_GU = len(SEOUL_GU)
+MAX_WORKERS = 8  # 저수준 클라이언트의 커넥션 풀(기본 10개)을 넘지 않게 제한
+
+def parse_gu_list(value):
+    # "all" 또는 쉼표로 구분한 gu 목록 (중복은 순서를 유지하며 제거)
+    if not value:
+        raise ValueError("Missing required query parameter: gu")
+    if value.strip().lower() == 'all':
+        return list(SEOUL_GU)
+    gu_list = list(dict.fromkeys(gu.strip() for gu in value.split(',') if gu.strip()))
+    if not gu_list:
+        raise ValueError("Missing required query parameter: gu")
+    if len(gu_list) > MAX_GU:
+        raise ValueError(f"At most {MAX_GU} gu can be requested at once")
+    return gu_list
+
+def query_hotplaces(gu):
+    items = dynamo.query(
+        TABLE_NAME,
+        "hotplace_partition_key = :gu AND begins_with(hotplace_sort_key, :prefix)",
+        {':gu': gu, ':prefix': 'Hotplace#'},
+        attributes=HOTPLACE_ATTRIBUTES
+    )
+    return [
+        {
+            'hotplaceSortKey': item['hotplace_sort_key'],
+            'congestion': item.get('congestion'),
+            'kakaoname': item.get('kakaoname'),
+            'mapx': item.get('mapx'),
+            'name': item.get('name'),
+            'mapy': item.get('mapy')
+        }
+        for item in items
+    ]
+
+def query_all(gu_list):
+    # gu마다 파티션 하나를 병렬로 조회하고, 실패한 gu는 따로 모아 나머지 결과는 그대로 돌려줌
+    results, failed = {}, {}
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(gu_list))) as executor:
+        futures = {gu: executor.submit(query_hotplaces, gu) for gu in gu_list}
+    for gu, future in futures.items():
+        try:
+            results[gu] = future.result()
+        except Exception as e:
+            print(f'{gu}: {e}')
+            failed[gu] = 'Could not retrieve hotplace'
+    return results, failed
+
+@tracing.traced
+def handler(event, context):
+    headers = {
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'GET,POST,OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token'
+    }
+
+    try:
+        query_params = event.get('queryStringParameters') or {}
+        gu_list = parse_gu_list(query_params.get('gu'))
+    except ValueError as e:
+        return {
+            'statusCode': 400,
+            'headers': headers,
+            'body': json.dumps({'message': str(e)})
+        }
+
+    results, failed = query_all(gu_list)
+    if not results:
+        return {
+            'statusCode': 500,
+            'headers': headers,
+            'body': serialization.dumps({'message': 'Could not retrieve hotplace', 'failed': failed})
+        }
+
+    # 요청한 순서대로 gu -> 핫플레이스 목록, 실패한 gu는 failed에 사유와 함께 표시
+    return {
+        'statusCode': 200,
+        'headers': headers,
+        'body': serialization.dumps({
+            'gu': {gu: results[gu] for gu in gu_list if gu in results},
+            'failed': failed,
+            'count': sum(len(items) for items in results.values())
+        })
+    }
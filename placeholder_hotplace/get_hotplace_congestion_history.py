@@ -0,0 +1,57 @@
+import json
+from placeholder_common import congestion_history, serialization, tracing
+
+@tracing.traced
+def handler(event, context):
+    headers = {
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'GET,POST,OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token'
+    }
+
+    # view=recent (기본): 최근 hours시간 기록, view=typical: 같은 요일 weeks주치 평소 곡선
+    try:
+        query_params = event.get('queryStringParameters') or {}
+        gu = query_params.get('gu')
+        area_cd = query_params.get('areaCd')
+        if not gu or not area_cd:
+            raise ValueError("Missing required query parameter: gu, areaCd")
+        view = query_params.get('view', 'recent')
+        if view == 'recent':
+            hours = int(query_params.get('hours', 24))
+            if not 0 < hours <= congestion_history.MAX_HOURS:
+                raise ValueError(f"hours must be between 1 and {congestion_history.MAX_HOURS}")
+        elif view == 'typical':
+            weeks = int(query_params.get('weeks', 4))
+            if not 0 < weeks <= congestion_history.MAX_WEEKS:
+                raise ValueError(f"weeks must be between 1 and {congestion_history.MAX_WEEKS}")
+            weekday = query_params.get('weekday')
+            weekday = int(weekday) if weekday not in (None, '') else None
+            if weekday is not None and not 0 <= weekday <= 6:
+                raise ValueError("weekday must be between 0 (Monday) and 6 (Sunday)")
+        else:
+            raise ValueError("view must be 'recent' or 'typical'")
+    except ValueError as e:
+        return {
+            'statusCode': 400,
+            'headers': headers,
+            'body': json.dumps({'message': str(e)})
+        }
+
+    try:
+        if view == 'recent':
+            body = {'gu': gu, 'areaCd': area_cd, 'hours': hours, 'readings': congestion_history.last_hours(gu, area_cd, hours)}
+        else:
+            body = dict(congestion_history.typical_curve(gu, area_cd, weekday, weeks), gu=gu, areaCd=area_cd)
+        return {
+            'statusCode': 200,
+            'headers': headers,
+            'body': serialization.dumps(body)
+        }
+    except Exception as e:
+        print(e)
+        return {
+            'statusCode': 500,
+            'headers': headers,
+            'body': json.dumps({'message': 'Could not retrieve congestion history'})
+        }
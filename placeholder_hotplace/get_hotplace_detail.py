@@ -1,17 +1,14 @@
-import boto3
 import json
-from decimal import Decimal
-from boto3.dynamodb.conditions import Key, Attr
+from placeholder_common import dynamo, serialization, tracing
 
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table('HOTPLACE')  # DynamoDB 테이블 이름 직접 설정
-
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, o):
-        if isinstance(o, Decimal):
-            return float(o)
-        return super(DecimalEncoder, self).default(o)
+TABLE_NAME = 'HOTPLACE'  # DynamoDB 테이블 이름 직접 설정
+# 응답에 쓰는 속성만 가져옴
+PLACE_ATTRIBUTES = [
+    'hotplace_partition_key', 'hotplace_sort_key', 'name', 'area_cd', 'mapx', 'mapy',
+    'category_group_name', 'address_name', 'rating', 'imageurl', 'placeurl', 'menu', 'keyword'
+]
 
+@tracing.traced
 def handler(event, context):
     try:
         headers = {
@@ -33,11 +30,13 @@ def handler(event, context):
         }
 
     try:
-        response = table.query(
-            KeyConditionExpression=Key('hotplace_partition_key').eq(hotplace_partition_key) 
-            & Key('hotplace_sort_key').begins_with('Place#' +hotplace_sort_key)
+        items = dynamo.query(
+            TABLE_NAME,
+            "hotplace_partition_key = :gu AND begins_with(hotplace_sort_key, :prefix)",
+            {':gu': hotplace_partition_key, ':prefix': 'Place#' + hotplace_sort_key},
+            attributes=PLACE_ATTRIBUTES,
+            number=str
         )
-        items = response.get('Items', [])
 
         # 반환되는 항목의 키 값을 변경
         transformed_items = [
@@ -46,11 +45,11 @@ def handler(event, context):
                 'hotplaceSortKey': item.get('hotplace_sort_key'),
                 'name': item.get('name'),
                 'areaCd': item.get('area_cd'),
-                'mapX': str(item.get('mapx', '')),
-                'mapY': str(item.get('mapy', '')),
+                'mapX': item.get('mapx', ''),
+                'mapY': item.get('mapy', ''),
                 'category': item.get('category_group_name'),
                 'address': item.get('address_name'),
-                'rating': str(item.get('rating', '')),
+                'rating': item.get('rating', ''),
                 'imageUrl': item.get('imageurl'),
                 'placeUrl': item.get('placeurl'),
                 'menus': item.get('menu', []),
@@ -69,7 +68,7 @@ def handler(event, context):
         return {
             'statusCode': 200,  
             'headers': headers,
-            'body' : json.dumps(transformed_items[0], cls=DecimalEncoder, ensure_ascii=False, indent=4) 
+            'body' : serialization.dumps(transformed_items[0]) 
         }
     except Exception as e:
         print(e)
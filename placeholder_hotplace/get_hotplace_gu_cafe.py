@@ -1,17 +1,14 @@
-import boto3
 import json
-from decimal import Decimal
-from boto3.dynamodb.conditions import Key, Attr
+from placeholder_common import dynamo, serialization, tracing
 
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table('HOTPLACE')  # DynamoDB 테이블 이름 직접 설정
-
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, o):
-        if isinstance(o, Decimal):
-            return float(o)
-        return super(DecimalEncoder, self).default(o)
+TABLE_NAME = 'HOTPLACE'  # DynamoDB 테이블 이름 직접 설정
+# 응답에 쓰는 속성만 가져옴
+PLACE_ATTRIBUTES = [
+    'hotplace_partition_key', 'hotplace_sort_key', 'name', 'area_cd', 'mapx', 'mapy',
+    'category_group_name', 'address_name', 'rating', 'imageurl', 'placeurl', 'menu', 'keyword'
+]
 
+@tracing.traced
 def handler(event, context):
     headers = {
         'Access-Control-Allow-Origin': '*',
@@ -32,11 +29,15 @@ def handler(event, context):
         }
 
     try:
-        response = table.query(
-            KeyConditionExpression=Key('hotplace_partition_key').eq(hotplace_partition_key) & Key('hotplace_sort_key').begins_with('Place#'),
-            FilterExpression=Attr('category_group_name').eq('카페')
+        # 숫자(mapx, mapy, rating)는 저장된 문자열 그대로 받아 Decimal -> str 변환을 생략
+        items = dynamo.query(
+            TABLE_NAME,
+            "hotplace_partition_key = :gu AND begins_with(hotplace_sort_key, :prefix)",
+            {':gu': hotplace_partition_key, ':prefix': 'Place#', ':category': '카페'},
+            filter_expression="category_group_name = :category",
+            attributes=PLACE_ATTRIBUTES,
+            number=str
         )
-        items = response.get('Items', [])
         if not items:
             return {
                 'statusCode': 404,
@@ -51,11 +52,11 @@ def handler(event, context):
                 'hotplaceSortKey': item.get('hotplace_sort_key'),
                 'name': item.get('name'),
                 'areaCd': item.get('area_cd'),
-                'mapX': str(item.get('mapx', '')),
-                'mapY': str(item.get('mapy', '')),
+                'mapX': item.get('mapx', ''),
+                'mapY': item.get('mapy', ''),
                 'category': item.get('category_group_name'),
                 'address': item.get('address_name'),
-                'rating': str(item.get('rating', '')),
+                'rating': item.get('rating', ''),
                 'imageUrl': item.get('imageurl'),
                 'placeUrl': item.get('placeurl'),
                 'menus': item.get('menu', []),
@@ -67,7 +68,7 @@ def handler(event, context):
         return {
             'statusCode': 200,
             'headers': headers,
-            'body': json.dumps(transformed_items, cls=DecimalEncoder, ensure_ascii=False, indent=4)
+            'body': serialization.dumps(transformed_items)
         }
     except Exception as e:
         print(e)
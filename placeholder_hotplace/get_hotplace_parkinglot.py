@@ -1,23 +1,22 @@
 import json
-import boto3
-from boto3.dynamodb.conditions import Key
+from placeholder_common import dynamo, serialization, tracing
 
-# DynamoDB 리소스 초기화
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table('HOTPLACE')  # DynamoDB 테이블 이름 직접 설정
+TABLE_NAME = 'HOTPLACE'  # DynamoDB 테이블 이름 직접 설정
 
 def query_parking_lots_by_gu(gu: str) -> list:
-    response = table.query(
-        KeyConditionExpression=Key('hotplace_partition_key').eq(gu) & Key('hotplace_sort_key').begins_with('Parkinglot#')
+    # capacity, curParking은 숫자(N)면 int/float로, 문자열(S)로 저장된 값이면 그대로 옴 ("12.0" 등)
+    parking_lots = dynamo.query(
+        TABLE_NAME,
+        "hotplace_partition_key = :gu AND begins_with(hotplace_sort_key, :prefix)",
+        {':gu': gu, ':prefix': 'Parkinglot#'}
     )
-    
-    parking_lots = response.get('Items', [])
     for lot in parking_lots:
         lot['capacity'] = str(int(float(lot['capacity'])))
         lot['curParking'] = str(int(float(lot['curParking'])))
     
     return parking_lots
 
+@tracing.traced
 def handler(event, context):
     headers = {
         'Access-Control-Allow-Origin': '*',
@@ -40,7 +39,7 @@ def handler(event, context):
         return {
             "statusCode": 200,
             "headers": headers,
-            "body": json.dumps(parking_lots, ensure_ascii=False, indent=4)
+            "body": serialization.dumps(parking_lots)
         }
     except Exception as e:
         return {
@@ -0,0 +1,55 @@
+import datetime
+import json
+from concurrent.futures import ThreadPoolExecutor
+from placeholder_common import congestion_history, dynamo, tracing
+from placeholder_hotplace.get_hotplace_all_gu_batch import SEOUL_GU
+
+# 10분마다 Hotplace# 항목의 현재 혼잡도를 읽어 이력 저장소에 쌓음 (Hotplace# 항목 자체는 그대로 덮어쓰는 방식 유지)
+TABLE_NAME = 'HOTPLACE'
+HOTPLACE_ATTRIBUTES = ['hotplace_sort_key', 'congestion', 'min_pop']
+MAX_WORKERS = 8
+
+def record_gu(gu, at):
+    items = dynamo.query(
+        TABLE_NAME,
+        "hotplace_partition_key = :gu AND begins_with(hotplace_sort_key, :prefix)",
+        {':gu': gu, ':prefix': 'Hotplace#'},
+        attributes=HOTPLACE_ATTRIBUTES
+    )
+    readings = [item for item in items if item.get('congestion')]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {}
+        for item in readings:
+            area_cd = item['hotplace_sort_key'].split('#', 1)[1]
+            futures[area_cd] = executor.submit(congestion_history.record, gu, area_cd, item['congestion'], item.get('min_pop'), at)
+    # 지역 하나가 실패해도 나머지 지역의 기록은 그대로 두고 실패한 수만 셈
+    recorded, failed = 0, 0
+    for area_cd, future in futures.items():
+        try:
+            future.result()
+            recorded += 1
+        except Exception as e:
+            print(f'{gu} {area_cd}: {e}')
+            failed += 1
+    if failed:
+        tracing.count('congestion_history.failed', failed)
+    return recorded, failed
+
+@tracing.traced
+def handler(event, context):
+    # 스케줄 호출은 서울 전체, 수동 호출은 {"gu": [...]}로 일부만
+    at = datetime.datetime.now(congestion_history.KST)
+    recorded, failed, failed_areas = {}, {}, {}
+    for gu in event.get('gu') or SEOUL_GU:
+        try:
+            recorded[gu], failed_count = record_gu(gu, at)
+        except Exception as e:
+            print(f'{gu}: {e}')
+            failed[gu] = str(e)
+            continue
+        if failed_count:
+            failed_areas[gu] = failed_count
+    return {
+        'statusCode': 500 if failed and not recorded else 200,
+        'body': json.dumps({'recorded': recorded, 'failed': failed, 'failedAreas': failed_areas}, ensure_ascii=False)
+    }
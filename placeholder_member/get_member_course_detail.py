@@ -1,32 +1,62 @@
-import boto3
 import json
-from decimal import Decimal
+import time
 from boto3.dynamodb.conditions import Key, Attr
+from placeholder_common import course_ids, runtime, serialization, tracing
 
-dynamodb = boto3.resource('dynamodb')
-member_table = dynamodb.Table('MEMBER')
-hotplace_table = dynamodb.Table('HOTPLACE')
+dynamodb = runtime.lazy_resource('dynamodb')
+member_table = runtime.lazy_table('MEMBER')
+hotplace_table = runtime.lazy_table('HOTPLACE')
 
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, o):
-        if isinstance(o, Decimal):
-            return float(o)
-        return super(DecimalEncoder, self).default(o)
+BATCH_GET_MAX_KEYS = 100  # BatchGetItem 한 번에 요청할 수 있는 최대 키 수
+BATCH_GET_MAX_RETRIES = 5
 
-def get_hotplace_details(gu, course):
-    response = hotplace_table.get_item(
-        Key={
+def batch_get_hotplace_details(place_keys):
+    # (gu, 장소 id) 목록을 100개씩 BatchGetItem으로 조회하고 처리되지 않은 키는 재시도
+    details = {}
+    keys = [
+        {
             'hotplace_partition_key': gu,
-            'hotplace_sort_key': f'Place#{course}'
+            'hotplace_sort_key': f'Place#{place_id}'
         }
-    )
-    return response.get('Item', None)
+        for gu, place_id in place_keys
+    ]
+    for i in range(0, len(keys), BATCH_GET_MAX_KEYS):
+        request_items = {hotplace_table.name: {'Keys': keys[i:i + BATCH_GET_MAX_KEYS]}}
+        for attempt in range(BATCH_GET_MAX_RETRIES):
+            response = dynamodb.batch_get_item(RequestItems=request_items)
+            for item in response.get('Responses', {}).get(hotplace_table.name, []):
+                place_id = item['hotplace_sort_key'].split('#', 1)[1]
+                details[(item['hotplace_partition_key'], place_id)] = item
+            request_items = response.get('UnprocessedKeys')
+            if not request_items:
+                break
+            time.sleep(0.05 * (2 ** attempt))
+        else:
+            raise RuntimeError('Could not resolve all hotplace details')
+    return details
+
+def course_place_ids(item):
+    return [str(item.get(f'course{i}')) for i in range(1, 6) if item.get(f'course{i}')]
+
+def query_member_courses(memberId, latest=None, courseId=None):
+    if courseId:
+        # 이력 목록에서 고른 코스 하나만 상세 조회
+        item = member_table.get_item(
+            Key={
+                'member_partition_key': f'MEMBER#{memberId}',
+                'member_sort_key': f'COURSE#{courseId}'
+            }
+        ).get('Item')
+        return [item] if item else []
+
+    return course_ids.query_member_courses(memberId, latest)
 
 def convert_to_list(data):
     if isinstance(data, set):
         return list(data)
     return data
 
+@tracing.traced
 def handler(event, context):
     try:
         headers = {
@@ -38,49 +68,67 @@ def handler(event, context):
 
         query_params = event.get('queryStringParameters', {})
         memberId = query_params.get('memberId')
+        latest = course_ids.parse_latest(query_params)
+        courseId = query_params.get('courseId')
     except KeyError:
-        return json.dumps({'message': 'Invalid request, missing path parameter memberId'}, cls=DecimalEncoder, ensure_ascii=False, indent=4)
+        return {
+            'statusCode': 400,
+            'headers': headers,
+            'body': json.dumps({'message': 'Invalid request, missing path parameter memberId'})
+        }
+    except ValueError as e:
+        return {
+            'statusCode': 400,
+            'headers': headers,
+            'body': json.dumps({'message': f'Invalid request: {str(e)}'})
+        }
 
     try:
-        response = member_table.query(
-            KeyConditionExpression=Key('member_partition_key').eq(f'MEMBER#{memberId}') & Key('member_sort_key').begins_with('COURSE#')
-        )
-        items = response.get('Items', [])
-        
+        items = query_member_courses(memberId, latest, courseId)
         if not items:
-            return json.dumps({'message': 'Member not found'}, cls=DecimalEncoder, ensure_ascii=False, indent=4)
+            return {
+                'statusCode': 404,
+                'headers': headers,
+                'body': json.dumps({'message': 'Member not found'})
+            }
+
+        # 모든 코스에 등장하는 장소를 중복 없이 모아 한 번에 조회한 뒤 각 코스에 다시 채움
+        place_keys = {(item['gu'], place_id) for item in items for place_id in course_place_ids(item)}
+        hotplace_details = batch_get_hotplace_details(place_keys)
 
         member_details = []
         for item in items:
             gu = item['gu']
-            courses = [item.get(f'course{i}') for i in range(1, 6)]
             course_details = []
-            for course in courses:
-                if course:
-                    details = get_hotplace_details(gu, course)
-                    if details:
-                        course_details.append({
-                            'hotplacePartitionKey': details.get('hotplace_partition_key'),
-                            'hotplaceSortKey': details.get('hotplace_sort_key'),
-                            'name': details.get('name'),
-                            'areaCd': details.get('area_cd'),
-                            'mapX': details.get('mapx'),
-                            'mapY': details.get('mapy'),
-                            'category': details.get('category_group_name'),
-                            'address': details.get('address_name'),
-                            'rating': details.get('rating'),
-                            'imageUrl': details.get('imageurl'),
-                            'placeUrl': details.get('placeurl'),
-                            'menus': details.get('menu', []),
-                            'keywords': details.get('keyword', [])
-                        })
+            for course in course_place_ids(item):
+                details = hotplace_details.get((gu, course))
+                if details:
+                    course_details.append({
+                        'hotplacePartitionKey': details.get('hotplace_partition_key'),
+                        'hotplaceSortKey': details.get('hotplace_sort_key'),
+                        'name': details.get('name'),
+                        'areaCd': details.get('area_cd'),
+                        'mapX': details.get('mapx'),
+                        'mapY': details.get('mapy'),
+                        'category': details.get('category_group_name'),
+                        'address': details.get('address_name'),
+                        'rating': details.get('rating'),
+                        'imageUrl': details.get('imageurl'),
+                        'placeUrl': details.get('placeurl'),
+                        'menus': details.get('menu', []),
+                        'keywords': details.get('keyword', [])
+                    })
             member_details.append(course_details)
 
         return {
             'statusCode': 200,
             'headers': headers, 
-            'body' : json.dumps(member_details, cls=DecimalEncoder, ensure_ascii=False, indent=4)
+            'body' : serialization.dumps(member_details)
         }
     except Exception as e:
         print(e)
-        return json.dumps({'message': 'Could not retrieve Member'}, cls=DecimalEncoder, ensure_ascii=False, indent=4)
+        return {
+            'statusCode': 500,
+            'headers': headers,
+            'body': json.dumps({'message': 'Could not retrieve Member'})
+        }
@@ -0,0 +1,157 @@
+import json
+import base64
+from datetime import datetime, timedelta
+from boto3.dynamodb.conditions import Key
+from placeholder_common import runtime, serialization, tracing
+from placeholder_common.course_ids import KST, LEGACY_COURSE_END, LEGACY_COURSE_START, NEW_COURSE_PREFIX, created_at, encode_time
+
+table = runtime.lazy_table('MEMBER')
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+MAX_CURSOR_KEY_LENGTH = 64
+
+# 목록 화면에 필요한 속성만 읽음 (장소 상세는 get_member_course_detail에서 courseId로 조회)
+SUMMARY_PROJECTION = 'member_sort_key, gu, course1, course2, course3, course4, course5'
+
+def parse_date(value, end=False):
+    # YYYY-MM-DD(KST)를 밀리초로 변환, end이면 그 날의 마지막 밀리초
+    day = datetime.strptime(value, '%Y-%m-%d').replace(tzinfo=KST)
+    if end:
+        day += timedelta(days=1)
+    return int(day.timestamp() * 1000) - (1 if end else 0)
+
+def encode_cursor(cursor):
+    return base64.urlsafe_b64encode(json.dumps(cursor).encode('utf-8')).decode('ascii')
+
+def decode_cursor(value):
+    try:
+        cursor = json.loads(base64.urlsafe_b64decode(value.encode('ascii')))
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(cursor, dict) or cursor.get('phase') not in ('new', 'legacy'):
+        raise ValueError("Invalid cursor")
+    # key는 그대로 ExclusiveStartKey가 되므로 단계에 맞는 코스 정렬 키인지 확인
+    key = cursor.get('key')
+    if key is not None:
+        if not isinstance(key, str) or len(key) > MAX_CURSOR_KEY_LENGTH:
+            raise ValueError("Invalid cursor")
+        if cursor['phase'] == 'new' and not key.startswith(NEW_COURSE_PREFIX):
+            raise ValueError("Invalid cursor")
+        if cursor['phase'] == 'legacy' and not LEGACY_COURSE_START <= key <= LEGACY_COURSE_END:
+            raise ValueError("Invalid cursor")
+    return cursor
+
+def parse_params(query_params):
+    memberId = query_params.get('memberId')
+    if not memberId:
+        raise ValueError("Missing required query parameter: memberId")
+
+    limit = query_params.get('limit', str(DEFAULT_LIMIT))
+    if not limit.isdigit() or not 1 <= int(limit) <= MAX_LIMIT:
+        raise ValueError(f"limit must be an integer between 1 and {MAX_LIMIT}")
+
+    date_from, date_to = query_params.get('from'), query_params.get('to')
+    start = parse_date(date_from) if date_from else None
+    end = parse_date(date_to, end=True) if date_to else None
+
+    cursor = decode_cursor(query_params['cursor']) if query_params.get('cursor') else {'phase': 'new'}
+    if cursor['phase'] == 'new' and cursor.get('key') is not None and (start is not None or end is not None):
+        # 조회 범위 밖의 시작 키는 DynamoDB가 거부하므로 먼저 확인
+        lower, upper = new_course_range(start, end)
+        if not lower <= cursor['key'] <= upper:
+            raise ValueError("Invalid cursor")
+    return memberId, int(limit), start, end, cursor
+
+def new_course_range(start, end):
+    # 생성 시각 범위(밀리초)에 해당하는 시간순 id 정렬 키 범위
+    lower = f"COURSE#{encode_time(start or 0)}{'0' * 16}"
+    upper = f"COURSE#{encode_time(end if end is not None else 2 ** 48 - 1)}{'Z' * 16}"
+    return lower, upper
+
+def query_page(memberId, key_condition, limit, start_key=None):
+    kwargs = {
+        'KeyConditionExpression': Key('member_partition_key').eq(f'MEMBER#{memberId}') & key_condition,
+        'ProjectionExpression': SUMMARY_PROJECTION,
+        'ScanIndexForward': False,
+        'Limit': limit
+    }
+    if start_key:
+        kwargs['ExclusiveStartKey'] = {
+            'member_partition_key': f'MEMBER#{memberId}',
+            'member_sort_key': start_key
+        }
+    response = table.query(**kwargs)
+    last_key = response.get('LastEvaluatedKey')
+    return response.get('Items', []), last_key['member_sort_key'] if last_key else None
+
+def query_history(memberId, limit, start, end, cursor):
+    # 최신순: 시간순 id 범위를 먼저 읽고, 날짜 조건이 없으면 이어서 이전 숫자 id 범위를 읽음
+    items = []
+    phase, start_key = cursor['phase'], cursor.get('key')
+
+    if phase == 'new':
+        if start is None and end is None:
+            key_condition = Key('member_sort_key').begins_with(NEW_COURSE_PREFIX)
+        else:
+            lower, upper = new_course_range(start, end)
+            key_condition = Key('member_sort_key').between(lower, upper)
+        items, last_key = query_page(memberId, key_condition, limit, start_key)
+        if last_key:
+            return items, {'phase': 'new', 'key': last_key}
+        if start is not None or end is not None:
+            return items, None
+        phase, start_key = 'legacy', None
+        if len(items) == limit:
+            return items, {'phase': 'legacy'}
+
+    key_condition = Key('member_sort_key').between(LEGACY_COURSE_START, LEGACY_COURSE_END)
+    legacy_items, last_key = query_page(memberId, key_condition, limit - len(items), start_key)
+    items += legacy_items
+    return items, {'phase': 'legacy', 'key': last_key} if last_key else None
+
+def summarize(item):
+    course_id = item['member_sort_key'].split('#', 1)[1]
+    return {
+        'courseId': course_id,
+        'gu': item.get('gu'),
+        'createdAt': created_at(course_id),
+        'placeIds': [str(item.get(f'course{i}')) for i in range(1, 6) if item.get(f'course{i}')]
+    }
+
+@tracing.traced
+def handler(event, context):
+    headers = {
+        'Access-Control-Allow-Origin': '*',
+        'Access-Control-Allow-Methods': 'GET,POST,OPTIONS',
+        'Access-Control-Allow-Headers': 'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token'
+    }
+
+    try:
+        query_params = event.get('queryStringParameters') or {}
+        memberId, limit, start, end, cursor = parse_params(query_params)
+    except (KeyError, ValueError) as e:
+        return {
+            'statusCode': 400,
+            'headers': headers,
+            'body': json.dumps({'message': f'Invalid request: {str(e)}'})
+        }
+
+    try:
+        items, next_cursor = query_history(memberId, limit, start, end, cursor)
+
+        return {
+            'statusCode': 200,
+            'headers': headers,
+            'body': serialization.dumps({
+                'courses': [summarize(item) for item in items],
+                'nextCursor': encode_cursor(next_cursor) if next_cursor else None
+            })
+        }
+    except Exception as e:
+        print(e)
+        return {
+            'statusCode': 500,
+            'headers': headers,
+            'body': json.dumps({'message': 'Could not retrieve member course history'})
+        }
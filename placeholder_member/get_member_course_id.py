@@ -1,17 +1,9 @@
-import boto3
 import json
-from decimal import Decimal
 from boto3.dynamodb.conditions import Key, Attr
+from placeholder_common import runtime, serialization, tracing
+from placeholder_common.course_ids import parse_latest, query_member_courses
 
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table('MEMBER')
-
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, o):
-        if isinstance(o, Decimal):
-            return float(o)
-        return super(DecimalEncoder, self).default(o)
-
+@tracing.traced
 def handler(event, context):
     try:
         headers = {
@@ -23,6 +15,7 @@ def handler(event, context):
 
         query_params = event.get('queryStringParameters', {})
         memberId = query_params.get('memberId')
+        latest = parse_latest(query_params)
 
     except KeyError:
         return {
@@ -30,13 +23,15 @@ def handler(event, context):
             'headers': headers,
             'body': json.dumps({'message': 'Invalid request, missing path parameter memberId'})
         }
+    except ValueError as e:
+        return {
+            'statusCode': 400,
+            'headers': headers,
+            'body': json.dumps({'message': f'Invalid request: {str(e)}'})
+        }
 
     try:
-        response = table.query(
-            KeyConditionExpression=Key('member_partition_key').eq("MEMBER#" + memberId) 
-            & Key('member_sort_key').begins_with('COURSE#')
-        )
-        items = response.get('Items', [])
+        items = query_member_courses(memberId, latest)
         if not items:
             return {
                 'statusCode': 404,
@@ -47,7 +42,7 @@ def handler(event, context):
         return {
             'statusCode': 200,
             'headers': headers,
-            'body' : json.dumps(items, cls=DecimalEncoder, ensure_ascii=False, indent=4) 
+            'body' : serialization.dumps(items) 
         }
     except Exception as e:
         print(e)
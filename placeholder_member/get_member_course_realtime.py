@@ -1,20 +1,11 @@
-import boto3
 import json
 import os
-from decimal import Decimal
 from boto3.dynamodb.conditions import Key, Attr
-import requests
+from placeholder_common import runtime, serialization, tracing
+from placeholder_common.directions import get_duration
 
-dynamodb = boto3.resource('dynamodb')
-member_table = dynamodb.Table('MEMBER')
-hotplace_table = dynamodb.Table('HOTPLACE')
-google_api_key = os.environ['GOOGLE_API_KEY']
-
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, o):
-        if isinstance(o, Decimal):
-            return float(o)
-        return super(DecimalEncoder, self).default(o)
+member_table = runtime.lazy_table('MEMBER')
+hotplace_table = runtime.lazy_table('HOTPLACE')
 
 def get_hotplace_details(gu, course):
     response = hotplace_table.get_item(
@@ -34,19 +25,28 @@ def get_congestion(gu, area_cd):
         return items[0].get('congestion')
     return None
 
-def get_duration(startX, startY, endX, endY):
-    api_url = f"https://maps.googleapis.com/maps/api/directions/json?origin={startY},{startX}&destination={endY},{endX}&mode=transit&key={google_api_key}"
-    response = requests.get(api_url)
-    if response.status_code != 200:
-        return None
-    data = response.json()
-    try:
-        duration_text = data['routes'][0]['legs'][0]['duration']['text']
-        duration_minutes = duration_text.split()[0]  
-        return duration_minutes
-    except (IndexError, KeyError):
-        return None
+def get_active_courses(memberId, member_info):
+    # INFO 항목의 active_course 포인터가 있으면 해당 코스 하나만 키로 조회
+    if 'active_course' in member_info:
+        active_course = member_info['active_course']
+        if not active_course:
+            return []
+        item = member_table.get_item(
+            Key={
+                'member_partition_key': f'MEMBER#{memberId}',
+                'member_sort_key': active_course
+            }
+        ).get('Item')
+        return [item] if item else []
 
+    # 포인터가 생기기 전에 만든 코스는 기존 방식으로 조회
+    response = member_table.query(
+        KeyConditionExpression=Key('member_partition_key').eq(f'MEMBER#{memberId}') & Key('member_sort_key').begins_with(f'COURSE#'),
+        FilterExpression=Attr('now').eq('TRUE')
+    )
+    return response.get('Items', [])
+
+@tracing.traced
 def handler(event, context):
     headers = {
         'Access-Control-Allow-Origin': '*',
@@ -67,11 +67,14 @@ def handler(event, context):
         }
 
     try:
-        response = member_table.query(
-            KeyConditionExpression=Key('member_partition_key').eq(f'MEMBER#{memberId}') & Key('member_sort_key').begins_with(f'COURSE#'),
-            FilterExpression=Attr('now').eq('TRUE')
-        )
-        items = response.get('Items', [])
+        member_info = member_table.get_item(
+            Key={
+                'member_partition_key': f'MEMBER#{memberId}',
+                'member_sort_key': f'INFO#{memberId}'
+            }
+        ).get('Item', {})
+
+        items = get_active_courses(memberId, member_info)
         
         if not items:
             return {
@@ -80,13 +83,6 @@ def handler(event, context):
                 'body': json.dumps({'message': 'Member not found'})
             }
 
-        member_info = member_table.get_item(
-            Key={
-                'member_partition_key': f'MEMBER#{memberId}',
-                'member_sort_key': f'INFO#{memberId}'
-            }
-        ).get('Item', {})
-
         startX = member_info.get('mapx')
         startY = member_info.get('mapy')
         
@@ -119,7 +115,7 @@ def handler(event, context):
         return {
             'statusCode': 200,
             'headers': headers,
-            'body': json.dumps(course_details, cls=DecimalEncoder, ensure_ascii=False, indent=4)
+            'body': serialization.dumps(course_details)
         }
     except Exception as e:
         print(e)
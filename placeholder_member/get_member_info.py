@@ -1,17 +1,10 @@
-import boto3
 import json
-from decimal import Decimal
 from boto3.dynamodb.conditions import Key
+from placeholder_common import runtime, serialization, tracing
 
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table('MEMBER')  # DynamoDB 테이블 이름 직접 설정
-
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, o):
-        if isinstance(o, Decimal):
-            return float(o)
-        return super(DecimalEncoder, self).default(o)
+table = runtime.lazy_table('MEMBER')  # DynamoDB 테이블 이름 직접 설정
 
+@tracing.traced
 def handler(event, context):
     try:
         headers = {
@@ -45,6 +38,8 @@ def handler(event, context):
             }
 
         item = items[0]
+        # 활성 코스 포인터는 내부용이라 응답에 넣지 않음
+        item.pop('active_course', None)
         if 'mapx' in item:
             item['mapx'] = str(item['mapx'])
         if 'mapy' in item:
@@ -53,7 +48,7 @@ def handler(event, context):
         return {
             'statusCode': 200,
             'headers': headers,
-            'body': json.dumps(item, cls=DecimalEncoder, ensure_ascii=False, indent=4)
+            'body': serialization.dumps(item)
         }
     except Exception as e:
         print(e)
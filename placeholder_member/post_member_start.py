@@ -1,39 +1,117 @@
-import boto3
 import json
 from decimal import Decimal
 import requests
 import os
-from boto3.dynamodb.conditions import Key
+import time
+import unicodedata
+from collections import OrderedDict
+from placeholder_common import http_client, runtime, serialization, tracing
+from placeholder_common.upstream_guard import UpstreamUnavailable
 
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table('MEMBER')  # DynamoDB 테이블 이름 직접 설정
+table = runtime.lazy_table('MEMBER')  # DynamoDB 테이블 이름 직접 설정
+cache_table = runtime.lazy_cache_table()  # 주소 좌표 캐시 (expires_at이 지난 항목은 TTL이 지움)
 
-class DecimalEncoder(json.JSONEncoder):
-    def default(self, o):
-        if isinstance(o, Decimal):
-            return float(o)
-        return super(DecimalEncoder, self).default(o)
+KAKAO_TIMEOUT = (3, 5)  # (connect, read) 초
+GEOCODE_CACHE_SIZE = 512
+GEOCODE_TTL = 30 * 24 * 60 * 60  # 좌표를 찾은 주소는 30일 보관
+GEOCODE_NEGATIVE_TTL = 24 * 60 * 60  # 'Address not found'는 하루만 보관
+ADDRESS_NOT_FOUND = 'Address not found'
+
+# 컨테이너 단위 LRU 캐시: 정규화된 주소 -> ((mapx, mapy) 또는 None, 만료 시각)
+geocode_cache = OrderedDict()
 
 def get_coordinates_from_kakao(address, kakao_key):
-    api_url = f"https://dapi.kakao.com/v2/local/search/address.json?query={address}&analyze_type=exact"
+    api_url = "https://dapi.kakao.com/v2/local/search/address.json"
+    params = {
+        'query': address,
+        'analyze_type': 'exact'
+    }
     headers = {
         "accept": "application/json",
         "content-type": "application/json",
         "Authorization": f"KakaoAK {kakao_key}"
     }
 
-    response = requests.get(api_url, headers=headers)
+    response = http_client.get('kakao_address', api_url, params=params, headers=headers, timeout=KAKAO_TIMEOUT)
     response.raise_for_status()
     data = response.json()
 
     if not data['documents']:
-        raise ValueError('Address not found')
+        raise ValueError(ADDRESS_NOT_FOUND)
     
     mapx = data['documents'][0]['x']
     mapy = data['documents'][0]['y']
     
     return mapx, mapy
 
+def normalize_address(address):
+    # 유니코드 정규화 후 공백을 하나로 합쳐 같은 주소가 같은 키가 되도록 함
+    return ' '.join(unicodedata.normalize('NFC', address).split())
+
+def geocode_key(normalized):
+    return runtime.cache_key(f'GEOCODE#{normalized}', 'GEOCODE')
+
+def get_cached_coordinates(normalized):
+    # 1단계: 컨테이너 메모리 캐시
+    entry = geocode_cache.get(normalized)
+    if entry is not None:
+        coordinates, expires_at = entry
+        if expires_at > time.time():
+            geocode_cache.move_to_end(normalized)
+            return True, coordinates
+        del geocode_cache[normalized]
+
+    # 2단계: DynamoDB 캐시 테이블 (TTL 삭제는 늦을 수 있어 expires_at도 직접 확인)
+    try:
+        item = cache_table.get_item(Key=geocode_key(normalized)).get('Item')
+    except Exception as e:
+        print(e)
+        return False, None
+    if not item or int(item.get('expires_at', 0)) <= time.time():
+        return False, None
+
+    coordinates = (item['mapx'], item['mapy']) if item.get('found') else None
+    remember_coordinates(normalized, coordinates, int(item['expires_at']), persist=False)
+    return True, coordinates
+
+def remember_coordinates(normalized, coordinates, expires_at, persist=True):
+    geocode_cache[normalized] = (coordinates, expires_at)
+    geocode_cache.move_to_end(normalized)
+    while len(geocode_cache) > GEOCODE_CACHE_SIZE:
+        geocode_cache.popitem(last=False)
+
+    if not persist:
+        return
+    item = dict(geocode_key(normalized), found=coordinates is not None, expires_at=expires_at)
+    if coordinates is not None:
+        item['mapx'], item['mapy'] = coordinates
+    try:
+        cache_table.put_item(Item=item)
+    except Exception as e:
+        # 캐시 저장 실패는 위치 업데이트를 막지 않음
+        print(e)
+
+def get_coordinates(address, kakao_key):
+    normalized = normalize_address(address)
+    hit, coordinates = get_cached_coordinates(normalized)
+    tracing.cache('geocode', hit)
+    if not hit:
+        try:
+            coordinates = get_coordinates_from_kakao(normalized, kakao_key)
+            expires_at = int(time.time()) + GEOCODE_TTL
+        except json.JSONDecodeError:
+            # 응답 본문이 깨진 일시적인 오류는 '주소 없음'으로 캐시하지 않음
+            raise
+        except ValueError:
+            coordinates = None
+            expires_at = int(time.time()) + GEOCODE_NEGATIVE_TTL
+        remember_coordinates(normalized, coordinates, expires_at)
+
+    if coordinates is None:
+        raise ValueError(ADDRESS_NOT_FOUND)
+    return coordinates
+
+@tracing.traced
 def handler(event, context):
     headers = {
         'Access-Control-Allow-Origin': '*',
@@ -57,8 +135,15 @@ def handler(event, context):
         }
 
     try:
-        # Kakao API를 사용하여 좌표 얻기
-        mapx, mapy = get_coordinates_from_kakao(address, kakao_key)
+        # 캐시를 먼저 확인하고 없으면 Kakao API를 사용하여 좌표 얻기
+        mapx, mapy = get_coordinates(address, kakao_key)
+    except UpstreamUnavailable as e:
+        # Kakao API 서킷이 열렸거나 쿼터를 넘은 경우 기다리지 않고 바로 응답
+        return {
+            'statusCode': 503,
+            'headers': headers,
+            'body': json.dumps({'message': f'Error fetching coordinates: {str(e)}'})
+        }
     except (requests.RequestException, ValueError) as e:
         return {
             'statusCode': 500,
@@ -67,42 +152,33 @@ def handler(event, context):
         }
 
     try:
-        # MEMBER 항목 조회
-        response = table.query(
-            KeyConditionExpression=Key('member_partition_key').eq("MEMBER#" + memberId) 
-            & Key('member_sort_key').begins_with('INFO#' + memberId)
-        )
-        items = response.get('Items', [])
-        if not items:
-            return {
-                'statusCode': 404,
-                'headers': headers,
-                'body': json.dumps({'message': 'Member not found'})
-            }
-        
-        item = items[0]  # 첫 번째 항목 선택
-
-        # mapX와 mapY 업데이트
+        # 회원 존재 확인과 좌표 업데이트를 조건부 update_item 한 번으로 처리
         table.update_item(
             Key={
-                'member_partition_key': item['member_partition_key'],
-                'member_sort_key': item['member_sort_key']
+                'member_partition_key': f'MEMBER#{memberId}',
+                'member_sort_key': f'INFO#{memberId}'
             },
             UpdateExpression="set mapx = :x, mapy = :y",
+            ConditionExpression="attribute_exists(member_partition_key)",
             ExpressionAttributeValues={
                 ':x': Decimal(mapx),
                 ':y': Decimal(mapy)
-            },
-            ReturnValues="UPDATED_NEW"
+            }
         )
 
         return {
             'statusCode': 200,
             'headers': headers,
-            'body': json.dumps({
+            'body': serialization.dumps({
                 'mapX': str(mapx),
                 'mapY': str(mapy)
-            }, cls=DecimalEncoder, ensure_ascii=False, indent=4)
+            })
+        }
+    except table.meta.client.exceptions.ConditionalCheckFailedException:
+        return {
+            'statusCode': 404,
+            'headers': headers,
+            'body': json.dumps({'message': 'Member not found'})
         }
     except Exception as e:
         print(e)
@@ -0,0 +1,461 @@
+import hashlib
+import io
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 오프라인 벤치마크용 프로세스 내부 가짜 백엔드
+# - DynamoDB/S3: moto (요청/응답 형식과 조건식을 실제 서비스처럼 검사)
+# - Bedrock, Google Directions, Kakao 주소 검색: 지연 시간을 주입할 수 있는 가짜 구현
+# - botocore 이벤트 훅으로 DynamoDB/S3 호출 수와 RCU/WCU 추정치를 셈
+REGION = 'ap-northeast-2'
+BUCKET = 'place-data-for-recording'
+GU = '강남구'
+READER_ID = '115926934351365764927'  # 코스 기록이 쌓여 있는 회원 (조회 핸들러용)
+WRITER_ID = '106286071111087157389'  # 코스를 만들고 멈추는 회원 (쓰기 핸들러용)
+STARTER_ID = '100000000000000000001'  # 출발지를 바꾸는 회원
+CATEGORIES = ['음식점', '카페', '놀거리']
+CONGESTION_LEVELS = ['여유', '보통', '약간 붐빔', '붐빔']
+PLACES_PER_CATEGORY = 150
+PLACES_FILE_PER_CATEGORY = 30
+AREAS = 60
+PARKING_LOTS = 40
+READER_COURSES = 20
+READER_LEGACY_COURSES = 5
+
+def item_size(item):
+    # DynamoDB 항목 크기 규칙을 근사 (속성 이름 + 값, 저수준 형식 입력)
+    return sum(len(name.encode('utf-8')) + value_size(value) for name, value in item.items())
+
+def value_size(value):
+    (tag, data), = value.items()
+    if tag == 'S':
+        return len(data.encode('utf-8'))
+    if tag == 'N':
+        digits = len(data.lstrip('-').replace('.', '').lstrip('0')) or 1
+        return math.ceil(digits / 2) + 1
+    if tag == 'B':
+        return len(data)
+    if tag in ('BOOL', 'NULL'):
+        return 1
+    if tag == 'L':
+        return 3 + sum(1 + value_size(v) for v in data)
+    if tag == 'M':
+        return 3 + sum(1 + len(k.encode('utf-8')) + value_size(v) for k, v in data.items())
+    if tag == 'SS':
+        return sum(len(v.encode('utf-8')) for v in data)
+    if tag == 'NS':
+        return sum(value_size({'N': v}) for v in data)
+    return sum(len(v) for v in data)
+
+class CapacityMeter:
+    """DynamoDB/S3 호출 수와 읽기/쓰기 용량 단위 추정치를 모음
+
+    RCU는 4KB, WCU는 1KB 단위로 올림하고 eventually consistent 읽기는 절반으로 계산함.
+    Query는 ProjectionExpression과 관계없이 전체 항목 크기로 과금되므로 시드 데이터로 만든
+    크기 색인을 쓰고, FilterExpression으로 버려진 항목은 ScannedCount 비율로 보정함.
+    """
+
+    def __init__(self, key_names):
+        self.key_names = key_names  # 테이블 -> (파티션 키, 정렬 키)
+        self.sizes = {}
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls = {}
+            self.rcu = 0.0
+            self.wcu = 0.0
+
+    def snapshot(self):
+        with self._lock:
+            return {'calls': dict(self.calls), 'rcu': self.rcu, 'wcu': self.wcu}
+
+    def item_key(self, table, item):
+        pk, sk = self.key_names[table]
+        if pk not in item or sk not in item:
+            return None
+        return (table, json.dumps(item[pk], sort_keys=True), json.dumps(item[sk], sort_keys=True))
+
+    def remember(self, table, item):
+        key = self.item_key(table, item)
+        if key is not None:
+            self.sizes[key] = item_size(item)
+
+    def full_size(self, table, item):
+        key = self.item_key(table, item)
+        return self.sizes.get(key) or item_size(item)
+
+    def average_size(self, table):
+        sizes = [size for key, size in self.sizes.items() if key[0] == table]
+        return sum(sizes) / len(sizes) if sizes else 1024
+
+    def install(self, session):
+        session.events.register('before-call.dynamodb', self.before_call)
+        session.events.register('after-call.dynamodb', self.after_call)
+        session.events.register('after-call.s3', self.after_s3_call)
+
+    def before_call(self, model, params, context, **kwargs):
+        body = params.get('body') or b'{}'
+        context['benchmark_request'] = json.loads(body.decode('utf-8') if isinstance(body, bytes) else body)
+
+    def after_s3_call(self, model, **kwargs):
+        with self._lock:
+            name = f's3:{model.name}'
+            self.calls[name] = self.calls.get(name, 0) + 1
+
+    def after_call(self, http_response, model, context, **kwargs):
+        request = context.get('benchmark_request', {})
+        response = json.loads(http_response.content or b'{}')
+        rcu, wcu = self.capacity(model.name, request, response, http_response.status_code)
+        with self._lock:
+            self.calls[model.name] = self.calls.get(model.name, 0) + 1
+            self.rcu += rcu
+            self.wcu += wcu
+
+    def read_units(self, size, consistent):
+        return max(1, math.ceil(size / 4096)) * (1.0 if consistent else 0.5)
+
+    def capacity(self, operation, request, response, status):
+        consistent = request.get('ConsistentRead', False)
+        table = request.get('TableName')
+        if operation == 'GetItem':
+            item = response.get('Item')
+            return self.read_units(self.full_size(table, item) if item else 0, consistent), 0
+        if operation in ('Query', 'Scan'):
+            items = response.get('Items', [])
+            total = sum(self.full_size(table, item) for item in items)
+            count, scanned = response.get('Count', len(items)), response.get('ScannedCount', len(items))
+            if count:
+                total *= scanned / count
+            elif scanned:
+                total = scanned * self.average_size(table)
+            return self.read_units(total, consistent), 0
+        if operation == 'BatchGetItem':
+            rcu = 0.0
+            for name, items in response.get('Responses', {}).items():
+                consistent = request['RequestItems'][name].get('ConsistentRead', False)
+                rcu += sum(self.read_units(self.full_size(name, item), consistent) for item in items)
+            return rcu, 0
+        if operation == 'PutItem':
+            self.remember(table, request['Item'])
+            return 0, max(1, math.ceil(item_size(request['Item']) / 1024))
+        if operation in ('UpdateItem', 'DeleteItem'):
+            return 0, max(1, math.ceil(self.full_size(table, request['Key']) / 1024))
+        if operation == 'TransactWriteItems':
+            # 트랜잭션 쓰기는 항목마다 2배로 과금
+            wcu = 0
+            for entry in request.get('TransactItems', []):
+                (kind, spec), = entry.items()
+                if kind == 'Put':
+                    self.remember(spec['TableName'], spec['Item'])
+                    wcu += 2 * max(1, math.ceil(item_size(spec['Item']) / 1024))
+                else:
+                    wcu += 2 * max(1, math.ceil(self.full_size(spec['TableName'], spec['Key']) / 1024))
+            return 0, wcu
+        return 0, 0
+
+class FakeBody:
+    def __init__(self, payload):
+        self._stream = io.BytesIO(payload)
+
+    def read(self):
+        return self._stream.read()
+
+class FakeBedrock:
+    """invoke_model만 흉내 냄: 프롬프트의 장소 데이터로 키워드 규칙에 맞는 코스를 만들어 돌려줌
+
+    - 빠른 모델(haiku)은 큰 모델 지연 시간의 FAST_LATENCY_RATIO만큼만 걸림
+    - 빠른 모델은 fast_error_every번째 호출마다 없는 id를 섞어 돌려줌 (상위 모델로 넘기는 경로 확인용)
+    """
+    FAST_LATENCY_RATIO = 0.25
+
+    def __init__(self, latency_ms=0, fast_error_every=5):
+        self.latency_ms = latency_ms
+        self.fast_error_every = fast_error_every
+        self.calls = 0
+        self.calls_by_model = {}
+        self._lock = threading.Lock()
+
+    def invoke_model(self, modelId, body, **kwargs):
+        from placeholder_course import precompute_courses
+        fast = 'haiku' in modelId
+        with self._lock:
+            self.calls += 1
+            calls = self.calls_by_model[modelId] = self.calls_by_model.get(modelId, 0) + 1
+        time.sleep(self.latency_ms * (self.FAST_LATENCY_RATIO if fast else 1) / 1000)
+        prompt = json.loads(body)['messages'][-1]['content']
+        if isinstance(prompt, list):
+            prompt = ''.join(part.get('text', '') for part in prompt)
+        places = json.loads(prompt.split('데이터입니다:\n', 1)[1].split('\n첫째', 1)[0])
+        scored = precompute_courses.score_places(places)
+        keywords = re.findall(r'"([^"]+)": \["id"', prompt)
+        courses = {}
+        for keyword in keywords:
+            slots = precompute_courses.KEYWORD_SLOTS.get(keyword, [precompute_courses.ANY] * 3)
+            candidates = precompute_courses.build_candidates(scored, slots, 1)
+            courses[keyword] = candidates[0][1] if candidates else []
+        if fast and self.fast_error_every and calls % self.fast_error_every == 0 and keywords:
+            courses[keywords[0]] = courses[keywords[0]][:2] + ['999999999']
+        text = json.dumps({'courses': courses}, ensure_ascii=False)
+        payload = {'content': [{'type': 'text', 'text': text}], 'model': modelId}
+        return {'body': FakeBody(json.dumps(payload).encode('utf-8'))}
+
+class FakeResponse:
+    def __init__(self, status_code, payload, headers=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+        self.content = json.dumps(payload).encode('utf-8')
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            import requests
+            raise requests.HTTPError(f'{self.status_code} Error', response=self)
+
+class FakeMapSession:
+    """http_client에 주입하는 requests.Session 대용 (Google Directions, Kakao 주소 검색)"""
+
+    def __init__(self, google_latency_ms=0, kakao_latency_ms=0):
+        self.latency_ms = {'maps.googleapis.com': google_latency_ms, 'dapi.kakao.com': kakao_latency_ms}
+        self.calls = {}
+        self._lock = threading.Lock()
+
+    def reset(self):
+        with self._lock:
+            self.calls = {}
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.calls)
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        host = url.split('/')[2]
+        with self._lock:
+            self.calls[host] = self.calls.get(host, 0) + 1
+        time.sleep(self.latency_ms.get(host, 0) / 1000)
+        if host == 'maps.googleapis.com':
+            return FakeResponse(200, self.directions(params))
+        if host == 'dapi.kakao.com':
+            return FakeResponse(200, self.address(params))
+        return FakeResponse(404, {})
+
+    def directions(self, params):
+        (y1, x1), (y2, x2) = (map(float, params[k].split(',')) for k in ('origin', 'destination'))
+        km = math.hypot((x2 - x1) * 88.2, (y2 - y1) * 111.0)
+        minutes = max(3, round(km * 4 + 5))
+        return {'routes': [{'legs': [{'duration': {'text': f'{minutes} mins', 'value': minutes * 60}}]}], 'status': 'OK'}
+
+    def address(self, params):
+        digest = hashlib.sha256(params['query'].encode('utf-8')).digest()
+        x = 127.0 + digest[0] / 2560
+        y = 37.45 + digest[1] / 2560
+        return {'documents': [{'address_name': params['query'], 'x': f'{x:.7f}', 'y': f'{y:.7f}'}], 'meta': {'total_count': 1}}
+
+def ulid_at(millis, rng):
+    from placeholder_common.course_ids import CROCKFORD_BASE32
+    value = (millis << 80) | rng.getrandbits(80)
+    return ''.join(CROCKFORD_BASE32[(value >> shift) & 31] for shift in range(125, -1, -5))
+
+def seed_items(seed=0):
+    """HOTPLACE/MEMBER 테이블과 S3 장소 파일에 넣을 데이터 (강남구 하나, 조회/쓰기용 회원 셋)"""
+    rng = random.Random(seed)
+    hotplace, member = [], []
+    area_codes = [f'POI{i:03d}' for i in range(1, AREAS + 1)]
+    for area_cd in area_codes:
+        hotplace.append({
+            'hotplace_partition_key': GU,
+            'hotplace_sort_key': f'Hotplace#{area_cd}',
+            'name': f'{GU} 핫플레이스 {area_cd}',
+            'kakaoname': f'{GU} {area_cd}',
+            'congestion': rng.choice(CONGESTION_LEVELS),
+            'mapx': Decimal(f'127.{rng.randint(10000000, 99999999)}'),
+            'mapy': Decimal(f'37.{rng.randint(48000000, 53000000)}')
+        })
+    place_ids = []
+    for category in CATEGORIES:
+        for _ in range(PLACES_PER_CATEGORY):
+            place_id = str(rng.randint(10000000, 2000000000))
+            place_ids.append(place_id)
+            hotplace.append({
+                'hotplace_partition_key': GU,
+                'hotplace_sort_key': f'Place#{place_id}',
+                'name': f'{category} {place_id}',
+                'area_cd': rng.choice(area_codes),
+                'mapx': Decimal(f'127.{rng.randint(10000000, 99999999)}'),
+                'mapy': Decimal(f'37.{rng.randint(48000000, 53000000)}'),
+                'category_group_name': category,
+                'address_name': f'서울 {GU} 역삼동 {rng.randint(1, 999)}-{rng.randint(1, 99)}',
+                'rating': Decimal(f'{rng.randint(25, 50) / 10}'),
+                'imageurl': f'https://img1.kakaocdn.net/cthumb/local/R0x420/{place_id}.jpg',
+                'placeurl': f'http://place.map.kakao.com/{place_id}',
+                'menu': [f'메뉴 {j} {rng.randint(5, 40) * 1000}원' for j in range(rng.randint(0, 8))],
+                'keyword': rng.sample(['데이트', '분위기', '조용한', '단체', '주차', '반려동물', '야경', '뷰맛집'], rng.randint(0, 4)),
+                'review': [f'리뷰 {j} ' + '좋아요 ' * rng.randint(5, 30) for j in range(rng.randint(0, 5))]
+            })
+    for i in range(PARKING_LOTS):
+        hotplace.append({
+            'hotplace_partition_key': GU,
+            'hotplace_sort_key': f'Parkinglot#{i:04d}',
+            'name': f'{GU} 공영주차장 {i}',
+            'address': f'서울 {GU} 테헤란로 {rng.randint(1, 500)}',
+            'capacity': Decimal(rng.randint(20, 400)),
+            'curParking': Decimal(rng.randint(0, 20)),
+            'lat': Decimal(f'37.{rng.randint(48000000, 53000000)}'),
+            'lng': Decimal(f'127.{rng.randint(10000000, 99999999)}')
+        })
+
+    start = int(time.time() * 1000) - READER_COURSES * 86400000
+    reader_courses = [f'COURSE#{ulid_at(start + i * 86400000, rng)}' for i in range(READER_COURSES)]
+    legacy_courses = [f'COURSE#{100000 + i}' for i in range(READER_LEGACY_COURSES)]
+    for sort_key in legacy_courses + reader_courses:
+        item = {
+            'member_partition_key': f'MEMBER#{READER_ID}',
+            'member_sort_key': sort_key,
+            'gu': GU,
+            'now': 'TRUE' if sort_key == reader_courses[-1] else 'FALSE'
+        }
+        for j, place_id in enumerate(rng.sample(place_ids, 5), start=1):
+            item[f'course{j}'] = place_id
+        member.append(item)
+    for member_id, active in ((READER_ID, reader_courses[-1]), (WRITER_ID, None), (STARTER_ID, None)):
+        member.append({
+            'member_partition_key': f'MEMBER#{member_id}',
+            'member_sort_key': f'INFO#{member_id}',
+            'name': f'회원 {member_id[-4:]}',
+            'email': f'{member_id}@example.com',
+            'mapx': Decimal('127.0276368'),
+            'mapy': Decimal('37.4979502'),
+            'active_course': active
+        })
+
+    # 정제된 장소 파일은 카테고리마다 일부만 담음 (코스 구성에 세 카테고리가 모두 필요)
+    places_file = [
+        {
+            'id': item['hotplace_sort_key'].split('#')[1],
+            'name': item['name'],
+            'category_group_name': item['category_group_name'],
+            'rating': float(item['rating']),
+            'congestion': {t: rng.choice(CONGESTION_LEVELS) for t in ('12:00', '15:00', '18:00')},
+            'min_pop': {t: rng.randint(1000, 30000) for t in ('12:00', '15:00', '18:00')}
+        }
+        for category in CATEGORIES
+        for item in [i for i in hotplace if i.get('category_group_name') == category][:PLACES_FILE_PER_CATEGORY]
+    ]
+    return hotplace, member, places_file, place_ids
+
+class OfflineBackend:
+    """moto와 가짜 클라이언트를 켜고 placeholder_common에 주입함"""
+
+    def __init__(self, bedrock_latency_ms=0, google_latency_ms=0, kakao_latency_ms=0, seed=0):
+        self.bedrock_latency_ms = bedrock_latency_ms
+        self.google_latency_ms = google_latency_ms
+        self.kakao_latency_ms = kakao_latency_ms
+        self.seed = seed
+        self.mock = None
+
+    def __enter__(self):
+        os.environ.update({
+            'AWS_DEFAULT_REGION': REGION,
+            'AWS_ACCESS_KEY_ID': 'benchmark',
+            'AWS_SECRET_ACCESS_KEY': 'benchmark',
+            'GOOGLE_API_KEY': 'benchmark',
+            'KAKAO_API_KEY': 'benchmark',
+        })
+        from moto import mock_aws
+        from placeholder_common import http_client, runtime, upstream_guard
+        self.mock = mock_aws()
+        self.mock.start()
+        runtime.reset()
+        upstream_guard.reset()
+
+        self.meter = CapacityMeter({
+            'HOTPLACE': ('hotplace_partition_key', 'hotplace_sort_key'),
+            'MEMBER': ('member_partition_key', 'member_sort_key'),
+            runtime.CACHE_TABLE: ('cache_partition_key', 'cache_sort_key')
+        })
+        self.create_tables(runtime.get_client('dynamodb'))
+        self.seed_data(runtime)
+        # 훅은 새로 만드는 클라이언트에만 붙으므로 시드에 쓴 클라이언트는 버림
+        runtime.reset()
+        self.meter.install(runtime.get_session())
+
+        self.bedrock = FakeBedrock(self.bedrock_latency_ms)
+        runtime.set_client('bedrock-runtime', self.bedrock, region_name='us-west-2')
+        self.maps = FakeMapSession(self.google_latency_ms, self.kakao_latency_ms)
+        http_client.set_session(self.maps)
+        http_client.reset_histograms()
+        return self
+
+    def __exit__(self, *exc):
+        from placeholder_common import http_client, runtime, upstream_guard
+        http_client.set_session(None)
+        runtime.reset()
+        upstream_guard.reset()
+        self.mock.stop()
+        return False
+
+    def create_tables(self, client):
+        from placeholder_common import runtime
+        tables = (
+            ('HOTPLACE', 'hotplace_partition_key', 'hotplace_sort_key'),
+            ('MEMBER', 'member_partition_key', 'member_sort_key'),
+            (runtime.CACHE_TABLE, 'cache_partition_key', 'cache_sort_key')
+        )
+        for name, pk, sk in tables:
+            client.create_table(
+                TableName=name,
+                KeySchema=[{'AttributeName': pk, 'KeyType': 'HASH'}, {'AttributeName': sk, 'KeyType': 'RANGE'}],
+                AttributeDefinitions=[{'AttributeName': pk, 'AttributeType': 'S'}, {'AttributeName': sk, 'AttributeType': 'S'}],
+                BillingMode='PAY_PER_REQUEST'
+            )
+        # template.yaml의 CacheTable처럼 expires_at TTL을 켬
+        client.update_time_to_live(
+            TableName=runtime.CACHE_TABLE,
+            TimeToLiveSpecification={'AttributeName': 'expires_at', 'Enabled': True}
+        )
+
+    def seed_data(self, runtime):
+        from boto3.dynamodb.types import TypeSerializer
+        serializer = TypeSerializer()
+        hotplace, member, places_file, self.place_ids = seed_items(self.seed)
+        for name, items in (('HOTPLACE', hotplace), ('MEMBER', member)):
+            with runtime.get_table(name).batch_writer() as batch:
+                for item in items:
+                    batch.put_item(Item=item)
+                    self.meter.remember(name, {k: serializer.serialize(v) for k, v in item.items()})
+        s3 = runtime.get_client('s3')
+        s3.create_bucket(Bucket=BUCKET, CreateBucketConfiguration={'LocationConstraint': REGION})
+        s3.put_object(
+            Bucket=BUCKET,
+            Key=f'refine_json_for_bedrock/today/places_{GU}.json',
+            Body=json.dumps(places_file, ensure_ascii=False).encode('utf-8')
+        )
+
+    def reset_counters(self):
+        self.meter.reset()
+        self.maps.reset()
+        self.bedrock.calls = 0
+
+    def counters(self):
+        snapshot = self.meter.snapshot()
+        return {
+            'dynamodb': {k: v for k, v in snapshot['calls'].items() if not k.startswith('s3:')},
+            's3': sum(v for k, v in snapshot['calls'].items() if k.startswith('s3:')),
+            'rcu': snapshot['rcu'],
+            'wcu': snapshot['wcu'],
+            'bedrock': self.bedrock.calls,
+            'http': self.maps.snapshot()
+        }
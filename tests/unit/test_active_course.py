@@ -0,0 +1,124 @@
+import json
+import unittest
+from boto3.dynamodb.conditions import Key
+from placeholder_common import runtime
+from placeholder_course import create_course_id, stop_course
+from tests import fakes
+
+class TestActiveCourse(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.backend = fakes.OfflineBackend().__enter__()
+        cls.table = runtime.get_table('MEMBER')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.backend.__exit__(None, None, None)
+
+    def setUp(self):
+        # 테스트마다 다른 회원을 씀
+        self.member_id = self.id().rsplit('.', 1)[-1]
+
+    def add_member(self, **attributes):
+        self.table.put_item(Item=dict(
+            {'member_partition_key': f'MEMBER#{self.member_id}', 'member_sort_key': f'INFO#{self.member_id}'},
+            **attributes
+        ))
+
+    def add_legacy_course(self, course_id, now='TRUE'):
+        # active_course 포인터가 생기기 전에 만든 코스
+        self.table.put_item(Item={
+            'member_partition_key': f'MEMBER#{self.member_id}',
+            'member_sort_key': f'COURSE#{course_id}',
+            'gu': fakes.GU,
+            'now': now
+        })
+
+    def create(self):
+        body = {'memberId': self.member_id, 'gu': fakes.GU}
+        body.update({f'course{i}': self.backend.place_ids[i] for i in range(1, 6)})
+        response = create_course_id.handler({'body': json.dumps(body, ensure_ascii=False)}, None)
+        self.assertEqual(response['statusCode'], 200)
+        return f"COURSE#{json.loads(response['body'])['courseId']}"
+
+    def active_courses(self):
+        items = self.table.query(
+            KeyConditionExpression=Key('member_partition_key').eq(f'MEMBER#{self.member_id}') & Key('member_sort_key').begins_with('COURSE#')
+        )['Items']
+        return [item['member_sort_key'] for item in items if item.get('now') == 'TRUE']
+
+    def pointer(self):
+        item = self.table.get_item(
+            Key={'member_partition_key': f'MEMBER#{self.member_id}', 'member_sort_key': f'INFO#{self.member_id}'}
+        )['Item']
+        # 포인터가 없으면(이전 데이터) KeyError, 중지되었으면 None
+        return item['active_course']
+
+    def test_two_creates_leave_one_active_course(self):
+        self.add_member()
+        first = self.create()
+        second = self.create()
+        self.assertNotEqual(first, second)
+        self.assertEqual(self.active_courses(), [second])
+        self.assertEqual(self.pointer(), second)
+
+    def test_create_after_pause_sets_pointer(self):
+        # 중지되어 포인터가 NULL인 회원
+        self.add_member(active_course=None)
+        course = self.create()
+        self.assertEqual(self.active_courses(), [course])
+        self.assertEqual(self.pointer(), course)
+
+    def test_create_pauses_legacy_courses(self):
+        self.add_member()
+        self.add_legacy_course('100001')
+        self.add_legacy_course('100002')
+        self.add_legacy_course('100003', now='FALSE')
+        course = self.create()
+        self.assertEqual(self.active_courses(), [course])
+        self.assertEqual(self.pointer(), course)
+
+    def stop(self):
+        return stop_course.handler({'queryStringParameters': {'memberId': self.member_id}}, None)
+
+    def test_stop_after_two_creates(self):
+        self.add_member()
+        self.create()
+        self.create()
+        self.assertEqual(self.stop()['statusCode'], 200)
+        self.assertEqual(self.active_courses(), [])
+        self.assertIsNone(self.pointer())
+        # 더 멈출 코스가 없음
+        self.assertEqual(self.stop()['statusCode'], 404)
+
+    def test_stop_pauses_legacy_courses(self):
+        self.add_member()
+        self.add_legacy_course('100001')
+        self.add_legacy_course('100002')
+        self.assertEqual(self.stop()['statusCode'], 200)
+        self.assertEqual(self.active_courses(), [])
+        # 포인터가 NULL로 만들어져 다음부터는 포인터만 봄
+        self.assertIsNone(self.pointer())
+        course = self.create()
+        self.assertEqual(self.active_courses(), [course])
+        self.assertEqual(self.stop()['statusCode'], 200)
+        self.assertEqual(self.active_courses(), [])
+
+    def test_stop_pauses_legacy_courses_across_transactions(self):
+        # 한 트랜잭션에 다 들어가지 않는 이전 코스 (마지막 묶음에서 포인터를 만듦)
+        self.add_member()
+        for i in range(stop_course.TRANSACT_MAX_ITEMS + 5):
+            self.add_legacy_course(str(100000 + i))
+        self.assertEqual(self.stop()['statusCode'], 200)
+        self.assertEqual(self.active_courses(), [])
+        self.assertIsNone(self.pointer())
+
+    def test_create_for_unknown_member(self):
+        body = {'memberId': self.member_id, 'gu': fakes.GU}
+        body.update({f'course{i}': str(i) for i in range(1, 6)})
+        response = create_course_id.handler({'body': json.dumps(body)}, None)
+        self.assertEqual(response['statusCode'], 404)
+        self.assertEqual(self.active_courses(), [])
+
+if __name__ == '__main__':
+    unittest.main()
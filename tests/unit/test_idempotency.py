@@ -0,0 +1,123 @@
+import json
+import time
+import unittest
+from unittest import mock
+from placeholder_common import idempotency
+from tests import fakes
+
+FUNCTION_NAME = __name__.rsplit('.', 1)[-1]
+
+class Context:
+    def __init__(self, remaining_ms):
+        self.remaining_ms = remaining_ms
+
+    def get_remaining_time_in_millis(self):
+        return self.remaining_ms
+
+def request(key, body):
+    return {'headers': {'Idempotency-Key': key}, 'body': json.dumps(body), 'queryStringParameters': None}
+
+class TestIdempotency(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # moto 테이블은 테스트마다 다른 키를 써서 한 번만 만듦
+        cls.backend = fakes.OfflineBackend().__enter__()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.backend.__exit__(None, None, None)
+
+    def setUp(self):
+        self.calls = []
+        self.responses = []
+        self.key = self.id().rsplit('.', 1)[-1]
+        patcher = mock.patch.multiple(idempotency, WAIT_SECONDS=0.3, POLL_INTERVAL=0.05)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        def handler(event, context):
+            self.calls.append(event)
+            response = self.responses.pop(0) if self.responses else {'statusCode': 200, 'headers': idempotency.HEADERS, 'body': event['body']}
+            if isinstance(response, Exception):
+                raise response
+            return response
+        handler.__module__ = __name__
+        self.handler = idempotency.idempotent(handler)
+
+    def record(self):
+        return idempotency.table.get_item(Key=idempotency.record_key(FUNCTION_NAME, self.key), ConsistentRead=True).get('Item')
+
+    def test_first_claim_then_replay(self):
+        event = request(self.key, {'memberId': '1'})
+        first = self.handler(event, Context(30000))
+        self.assertEqual(first['statusCode'], 200)
+        self.assertEqual(self.record()['status'], idempotency.COMPLETED)
+
+        second = self.handler(event, Context(30000))
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(second['statusCode'], 200)
+        self.assertEqual(second['body'], first['body'])
+        self.assertEqual(second['headers']['Idempotency-Replayed'], 'true')
+
+    def test_duplicate_while_in_progress(self):
+        event = request(self.key, {'memberId': '1'})
+        token, _ = idempotency.claim(FUNCTION_NAME, self.key, idempotency.request_hash(event), Context(60000))
+        self.assertIsNotNone(token)
+
+        response = self.handler(event, Context(30000))
+        self.assertEqual(response['statusCode'], 409)
+        self.assertEqual(response['headers']['Retry-After'], str(idempotency.RETRY_AFTER))
+        self.assertEqual(self.calls, [])
+
+    def test_same_key_different_body(self):
+        self.handler(request(self.key, {'memberId': '1'}), Context(30000))
+        response = self.handler(request(self.key, {'memberId': '2'}), Context(30000))
+        self.assertEqual(response['statusCode'], 422)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_server_error_releases_record(self):
+        event = request(self.key, {'memberId': '1'})
+        self.responses = [{'statusCode': 500, 'headers': idempotency.HEADERS, 'body': '{}'}]
+        self.assertEqual(self.handler(event, Context(30000))['statusCode'], 500)
+        self.assertIsNone(self.record())
+
+        # 재시도는 다시 실행됨
+        self.assertEqual(self.handler(event, Context(30000))['statusCode'], 200)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_exception_releases_record(self):
+        event = request(self.key, {'memberId': '1'})
+        self.responses = [RuntimeError('boom')]
+        with self.assertRaises(RuntimeError):
+            self.handler(event, Context(30000))
+        self.assertIsNone(self.record())
+
+        self.assertEqual(self.handler(event, Context(30000))['statusCode'], 200)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_expired_in_progress_is_reclaimed(self):
+        # 제한 시간으로 끝나 완료를 기록하지 못한 선점
+        event = request(self.key, {'memberId': '1'})
+        idempotency.table.put_item(Item=dict(
+            idempotency.record_key(FUNCTION_NAME, self.key),
+            status=idempotency.IN_PROGRESS,
+            request_hash=idempotency.request_hash(event),
+            token='stale',
+            expires_at=int(time.time()) - 10
+        ))
+
+        response = self.handler(event, Context(30000))
+        self.assertEqual(response['statusCode'], 200)
+        self.assertEqual(len(self.calls), 1)
+        record = self.record()
+        self.assertEqual(record['status'], idempotency.COMPLETED)
+        self.assertNotEqual(record['token'], 'stale')
+
+    def test_without_key_runs_handler(self):
+        event = {'headers': {}, 'body': '{}'}
+        self.handler(event, None)
+        self.handler(event, None)
+        self.assertEqual(len(self.calls), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from unittest import mock
+from placeholder_course import route_optimizer
+
+def line_matrix(positions):
+    # 출발지(0)와 장소들이 한 직선 위에 있을 때의 이동 시간 행렬
+    nodes = [0] + positions
+    return [[float(abs(a - b)) for b in nodes] for a in nodes]
+
+class TestRouteOptimizer(unittest.TestCase):
+    def test_exact_order_finds_shortest_route(self):
+        # 장소 위치 5, 1, 3 -> 가까운 순서(1, 3, 5)가 가장 짧음
+        matrix = line_matrix([5, 1, 3])
+        order = route_optimizer.exact_order(matrix, [None, None, None])
+        self.assertEqual(order, [1, 2, 0])
+        self.assertEqual(route_optimizer.route_cost(order, matrix), 5.0)
+
+    def test_exact_order_respects_slot_precedence(self):
+        # 가장 먼 장소가 첫 시간대라면 먼저 들러야 함
+        matrix = line_matrix([5, 1, 3])
+        slots = [0, 2, None]
+        order = route_optimizer.exact_order(matrix, slots)
+        self.assertTrue(route_optimizer.feasible(order, slots))
+        self.assertEqual(order, [0, 2, 1])
+
+    def test_feasible(self):
+        self.assertTrue(route_optimizer.feasible([0, 1, 2], [0, None, 1]))
+        self.assertFalse(route_optimizer.feasible([1, 0], [0, 1]))
+
+    def test_exact_order_keeps_original_order_on_ties(self):
+        # 모든 이동 시간이 같으면 원래 순서
+        matrix = [[1.0] * 4 for _ in range(4)]
+        self.assertEqual(route_optimizer.exact_order(matrix, [None, None, None]), [0, 1, 2])
+
+    def test_heuristic_order_improves_nearest_neighbour_with_2opt(self):
+        # 최근접 이웃은 -1, -2, 1, -6 순서(12분)로 가지만 2-opt로 1, -1, -2, -6(8분)이 됨
+        matrix = line_matrix([-1, -2, -6, 1])
+        order = route_optimizer.heuristic_order(matrix, [None] * 4)
+        self.assertEqual(order, [3, 0, 1, 2])
+        self.assertEqual(route_optimizer.route_cost(order, matrix), 8.0)
+
+    def test_optimize_uses_heuristic_above_exact_limit(self):
+        count = route_optimizer.EXACT_LIMIT + 1
+        positions = [-1, -2, -6, 1, 4, -9, 7, 3][:count]
+        points = [(float(x), 37.5) for x in positions]
+        slots = [None] * count
+        matrix = line_matrix(positions)
+        with mock.patch.object(route_optimizer, 'travel_matrix', return_value=matrix), \
+                mock.patch.object(route_optimizer, 'exact_order', side_effect=AssertionError('exact search above limit')):
+            order = route_optimizer.optimize((0.0, 37.5), points, slots)
+        self.assertEqual(sorted(order), list(range(count)))
+        self.assertEqual(order, route_optimizer.heuristic_order(matrix, slots))
+
+    def test_optimize_keeps_order_when_coordinates_missing(self):
+        points = [(127.03, 37.5), (None, 37.49), (127.01, 37.52)]
+        with mock.patch.object(route_optimizer, 'travel_matrix', side_effect=AssertionError('matrix not needed')):
+            self.assertEqual(route_optimizer.optimize((127.0, 37.5), points), [0, 1, 2])
+            self.assertEqual(route_optimizer.optimize((127.0, 37.5), [points[0], None]), [0, 1])
+            self.assertEqual(route_optimizer.optimize((127.0, 37.5), points[:1]), [0])
+
+if __name__ == '__main__':
+    unittest.main()
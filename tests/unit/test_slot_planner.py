@@ -0,0 +1,47 @@
+import unittest
+from placeholder_course import slot_planner
+
+class TestSlotPlanner(unittest.TestCase):
+    def test_plan_picks_minimum_score_sum(self):
+        # 첫 장소는 15:00, 두 번째 장소는 18:00이 가장 한가함
+        rows = [[3.0, 1.0, 2.0], [3.0, 2.0, 0.0]]
+        slots, arrivals = slot_planner.plan(rows, [0, 20])
+        self.assertEqual(slots, [1, 2])
+        self.assertEqual(arrivals, [900, 1080])
+
+    def test_plan_slots_never_decrease(self):
+        # 두 번째 장소는 12:00이 가장 한가하지만 첫 장소보다 이른 시간대는 고를 수 없음
+        rows = [[5.0, 0.0, 5.0], [0.0, 4.0, 3.0], None]
+        slots, arrivals = slot_planner.plan(rows, [0, 10, 10])
+        self.assertEqual(slots, sorted(slots))
+        self.assertEqual(slots[:2], [1, 2])
+        self.assertEqual(arrivals, sorted(arrivals))
+
+    def test_travel_time_makes_slot_infeasible(self):
+        # 12:00에 도착해 60분 머문 뒤 150분 이동하면 15:00 시간대(15:00~18:00)에 들어오지 못함
+        self.assertIsNone(slot_planner.schedule([0, 0], [0, 150]))
+        self.assertEqual(slot_planner.schedule([0, 1], [0, 150]), [720, 930])
+        # 두 번째 장소는 12:00가 가장 한가하지만 이동 시간 때문에 15:00로 밀림
+        slots, arrivals = slot_planner.plan([[0.0, 5.0, 5.0], [0.0, 1.0, 5.0]], [0, 150])
+        self.assertEqual(slots, [0, 1])
+        self.assertEqual(arrivals, [720, 930])
+
+    def test_plan_falls_back_when_nothing_fits(self):
+        # 이동 시간이 너무 길어 어떤 배정도 맞지 않으면 12:00부터 이어서 방문
+        travel = [0, 400, 400]
+        self.assertEqual(slot_planner.plan([None, None, None], travel), slot_planner.fallback(travel))
+        slots, arrivals = slot_planner.fallback(travel)
+        self.assertEqual(arrivals, [720, 1180, 1640])
+        self.assertEqual(slots, [0, 2, 2])
+
+    def test_plan_empty(self):
+        self.assertEqual(slot_planner.plan([], []), ([], []))
+
+    def test_clock(self):
+        self.assertEqual(slot_planner.clock(720), '12:00')
+        self.assertEqual(slot_planner.clock(905), '15:05')
+        self.assertEqual(slot_planner.clock(1640), '03:20')
+        self.assertEqual(slot_planner.clock(930.4), '15:30')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+import argparse
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# template.yaml 하나에서 배포 프로필 템플릿을 만듦 (직접 고치지 말고 template.yaml을 고친 뒤 다시 실행)
+# - template-router.yaml: API 함수들을 RouterFunction 하나로 합침 (SEPARATE_FUNCTIONS는 따로 둠)
+#   경로/메서드, 환경 변수, 레이어, 제한 시간은 합친 함수들의 값에서 가져옴
+# - template-warm.yaml: API 함수마다 {"warmup": true} Schedule 이벤트를 붙임
+# SAM은 같은 API에 같은 경로/메서드를 조건별로 두 번 정의할 수 없어 Conditions 대신 파일을 만들어 씀
+# 예) python tools/render_templates.py          (다시 만들기)
+#     python tools/render_templates.py --check  (template.yaml과 어긋났으면 실패)
+SOURCE = 'template.yaml'
+ROUTER = 'template-router.yaml'
+WARM = 'template-warm.yaml'
+SEPARATE_FUNCTIONS = {'PostMemberCourseCreateFunction'}  # Bedrock 호출로 제한 시간이 길어 라우터에 넣지 않음
+ROUTER_MIN_TIMEOUT = 30
+GENERATED = '# 이 파일은 tools/render_templates.py가 template.yaml에서 만듦. 직접 고치지 말 것\n'
+
+ROUTER_DESCRIPTION = """Description: >
+  Router profile. One RouterFunction serves every API route except course
+  creation, so warm containers, HTTP connection pools and in-memory caches
+  are shared across endpoints. Course creation keeps its own function
+  because Bedrock calls need the long timeout. Deploy with
+  `sam build -t template-router.yaml && sam deploy` (or --config-env router).
+"""
+WARM_DESCRIPTION = """Description: >
+  Warm-up profile. Same functions as template.yaml, plus a Schedule event on
+  every API function that invokes it with {"warmup": true} every 5 minutes.
+  The handlers then create their clients, open pooled connections and
+  prefetch the WARMUP_GU data into per-container caches without serving a
+  request. Deploy with `sam build -t template-warm.yaml && sam deploy`
+  (or --config-env warm).
+"""
+WARM_EVENT = """        # warm-up: 5분마다 클라이언트/커넥션을 준비하고 자주 요청되는 gu 데이터를 미리 읽어 둠
+        Warmup:
+          Type: Schedule
+          Properties:
+            Schedule: rate(5 minutes)
+            Input: '{"warmup": true}'
+"""
+
+def split_resources(text):
+    """(Resources: 앞부분, [(논리 ID, 블록)], Resources 뒷부분(Outputs 등))"""
+    head, rest = text.split('Resources:\n', 1)
+    match = re.search(r'(?m)^\S', rest)
+    body, tail = (rest[:match.start()], rest[match.start():]) if match else (rest, '')
+    blocks = re.split(r'(?m)^(?=  [A-Za-z0-9]+:\n)', body)
+    resources = [(re.match(r'  ([A-Za-z0-9]+):', block).group(1), block) for block in blocks if block.strip()]
+    return head + 'Resources:\n', resources, tail
+
+def is_api_function(block):
+    return 'Type: AWS::Serverless::Function\n' in block and re.search(r'(?m)^          Type: Api$', block) is not None
+
+def section(block, name, indent):
+    # 블록 안에서 name: 아래로 indent보다 깊게 들여 쓴 줄들
+    match = re.search(rf'(?m)^{" " * indent}{name}:\n((?:{" " * (indent + 2)}.*\n|\s*\n)*)', block)
+    return match.group(1) if match else ''
+
+def api_events(block):
+    # Events 아래 Type: Api 이벤트의 Properties 부분 (주석 포함 원문 그대로)
+    events = []
+    for match in re.finditer(r'(?m)^        ([A-Za-z0-9]+):\n((?:          .*\n)+)', section(block, 'Events', 6)):
+        if re.search(r'(?m)^          Type: Api$', match.group(2)):
+            events.append(match.group(2))
+    return events
+
+def event_name(logical_id):
+    return logical_id[:-len('Function')] if logical_id.endswith('Function') else logical_id
+
+def router_function(functions):
+    variables, layers, timeout = {}, [], ROUTER_MIN_TIMEOUT
+    events = []
+    for logical_id, block in functions:
+        for line in section(block, 'Variables', 8).splitlines():
+            name, _, value = line.strip().partition(':')
+            if name and name != 'TABLE_NAME':  # 라우터는 테이블 이름을 코드에서 정함
+                variables.setdefault(name, value.strip())
+        for line in section(block, 'Layers', 6).splitlines():
+            if line.strip() and line.strip() not in layers:
+                layers.append(line.strip())
+        match = re.search(r'(?m)^      Timeout: (\d+)', block)
+        if match:
+            timeout = max(timeout, int(match.group(1)))
+        for properties in api_events(block):
+            events.append(f'        {event_name(logical_id)}:\n{properties}')
+
+    lines = [
+        '  RouterFunction:\n',
+        '    Type: AWS::Serverless::Function\n',
+        '    Properties:\n',
+        '      Handler: placeholder_common.router.handler\n',
+        '      Runtime: python3.12\n',
+        '      CodeUri: .\n',
+        '      Role: !GetAtt LambdaExecutionRole.Arn\n',
+    ]
+    if variables:
+        lines += ['      Environment:\n', '        Variables:\n']
+        lines += [f'          {name}: {value}\n' for name, value in variables.items()]
+    lines.append('      Events:\n')
+    lines += events
+    if layers:
+        lines.append('      Layers:\n')
+        lines += [f'        {layer}\n' for layer in layers]
+    lines += [f'      Timeout: {timeout}\n', '\n']
+    return ''.join(lines)
+
+def with_description(head, description):
+    return head.replace("Transform: 'AWS::Serverless-2016-10-31'\n", "Transform: 'AWS::Serverless-2016-10-31'\n" + description, 1)
+
+def render_router(text):
+    head, resources, tail = split_resources(text)
+    merged = [(i, b) for i, b in resources if is_api_function(b) and i not in SEPARATE_FUNCTIONS]
+    body, inserted = [], False
+    for logical_id, block in resources:
+        if (logical_id, block) in merged:
+            if not inserted:
+                # 첫 API 함수 자리에 RouterFunction을 둠
+                body.append(router_function(merged))
+                inserted = True
+            continue
+        body.append(block)
+    return GENERATED + with_description(head, ROUTER_DESCRIPTION) + ''.join(body) + tail
+
+def render_warm(text):
+    head, resources, tail = split_resources(text)
+    body = [block.replace('      Events:\n', '      Events:\n' + WARM_EVENT, 1) if is_api_function(block) else block for _, block in resources]
+    return GENERATED + with_description(head, WARM_DESCRIPTION) + ''.join(body) + tail
+
+def routes(text):
+    # 템플릿의 (메서드, 경로) 목록 (router.ROUTES와 같은 형식)
+    found = set()
+    for match in re.finditer(r'(?m)^            Path: (\S+)\n            Method: (\S+)$', text):
+        path, method = match.groups()
+        found.add((method.upper(), '/' + path.strip('/')))
+    return found
+
+def read(name):
+    with open(os.path.join(ROOT, name), encoding='utf-8', newline='') as f:
+        return f.read().replace('\r\n', '\n')
+
+def write(name, text):
+    with open(os.path.join(ROOT, name), 'w', encoding='utf-8', newline='') as f:
+        f.write(text.replace('\n', '\r\n'))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render template-router.yaml and template-warm.yaml from template.yaml.')
+    parser.add_argument('--check', action='store_true', help='fail if the rendered files differ from the committed ones')
+    args = parser.parse_args(argv)
+
+    source = read(SOURCE)
+    rendered = {ROUTER: render_router(source), WARM: render_warm(source)}
+
+    # 라우터가 처리하는 경로는 placeholder_common.router.ROUTES와 같아야 함
+    from placeholder_common import router
+    missing = routes(source) - set(router.ROUTES)
+    if missing:
+        raise SystemExit(f'routes in {SOURCE} missing from placeholder_common.router.ROUTES: {sorted(missing)}')
+
+    stale = []
+    for name, text in rendered.items():
+        if args.check:
+            if not os.path.exists(os.path.join(ROOT, name)) or read(name) != text:
+                stale.append(name)
+        else:
+            write(name, text)
+    if stale:
+        raise SystemExit(f'{", ".join(stale)} out of date with {SOURCE}; run python tools/render_templates.py')
+
+if __name__ == '__main__':
+    main()
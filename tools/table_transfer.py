@@ -0,0 +1,372 @@
+import argparse
+import base64
+import concurrent.futures
+import gzip
+import json
+import multiprocessing
+import os
+import queue
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# HOTPLACE/MEMBER 테이블 통째로 내보내기/불러오기 (키 구조 변경, GSI 채우기, 로컬 테스트 데이터 준비용)
+# - export: Scan을 Segment/TotalSegments로 나눠 프로세스 풀에서 동시에 읽고,
+#   세그먼트마다 gzip 압축한 줄 단위 JSON 파일 하나로 씀 (로컬 디렉터리 또는 s3://버킷/접두사)
+# - 한 줄은 DynamoDB S3 내보내기와 같은 {"Item": {속성: {타입: 값}}} 형식이라 숫자 정밀도/집합/바이너리가 그대로 보존됨
+#   (바이너리는 base64 문자열)
+# - import: manifest.json의 파일마다 batch_writer로 다시 씀
+#   클라이언트는 adaptive 재시도 모드(스로틀링이면 보내는 속도를 줄임)를 쓰고,
+#   BatchWriteItem이 처리하지 못한 항목을 돌려주면 지수 백오프로 기다렸다가 다시 보냄
+# - 진행 상황(항목 수, 크기, 초당 처리량, 끝난 세그먼트/파일 수)은 stderr에 주기적으로 출력
+# 예) python tools/table_transfer.py export HOTPLACE s3://place-data-for-recording/exports/hotplace --segments 16
+#     python tools/table_transfer.py import s3://place-data-for-recording/exports/hotplace --table HOTPLACE_V2
+MANIFEST = 'manifest.json'
+PROGRESS_INTERVAL = 2.0
+MAX_ATTEMPTS = 10  # adaptive 재시도 모드의 최대 시도 횟수
+BACKOFF_BASE = 0.05
+BACKOFF_MAX = 5.0
+
+def client_config():
+    from botocore.config import Config
+    return Config(retries={'mode': 'adaptive', 'max_attempts': MAX_ATTEMPTS}, max_pool_connections=25)
+
+def new_session():
+    # 프로세스마다 세션을 새로 만듦 (boto3 세션은 프로세스 사이에 나눠 쓸 수 없음)
+    import boto3
+    return boto3.session.Session()
+
+# --- 저장 위치 (로컬 디렉터리 또는 s3://버킷/접두사) ---
+
+# 임시 파일은 0600으로 만들어지므로 옮긴 뒤 일반 파일처럼 umask를 적용한 권한으로 바꿈
+# (os.umask는 읽으면서 값을 바꾸므로 스레드를 띄우기 전인 import 시점에 한 번만 읽음)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+FILE_MODE = 0o666 & ~_UMASK
+
+def split_s3(location):
+    bucket, _, prefix = location[len('s3://'):].partition('/')
+    return bucket, prefix.strip('/')
+
+def temp_file(location, suffix, mode='w+b', encoding=None):
+    # 로컬 저장이면 저장 디렉터리 안에 만들어 write_file의 os.replace가 같은 파일 시스템 안에서 끝나게 함
+    # (/tmp와 다른 디바이스면 os.replace가 EXDEV로 실패함)
+    directory = None
+    if not location.startswith('s3://'):
+        os.makedirs(location, exist_ok=True)
+        directory = location
+    return tempfile.NamedTemporaryFile(mode, suffix=suffix, prefix='.tmp-', dir=directory, delete=False, encoding=encoding)
+
+def write_file(session, location, name, local_path):
+    # local_path는 temp_file(location, ...)로 만든 파일 (호출한 쪽에서 남은 임시 파일을 지움)
+    if location.startswith('s3://'):
+        bucket, prefix = split_s3(location)
+        session.client('s3').upload_file(local_path, bucket, f'{prefix}/{name}' if prefix else name)
+    else:
+        path = os.path.join(location, name)
+        os.replace(local_path, path)
+        os.chmod(path, FILE_MODE)
+
+def remove_temp(path):
+    if os.path.exists(path):
+        os.remove(path)
+
+def open_file(session, location, name):
+    # 압축을 풀면서 스트림으로 읽음 (S3 객체도 내려받아 두지 않음)
+    if location.startswith('s3://'):
+        bucket, prefix = split_s3(location)
+        return session.client('s3').get_object(Bucket=bucket, Key=f'{prefix}/{name}' if prefix else name)['Body']
+    return open(os.path.join(location, name), 'rb')
+
+def write_manifest(session, location, manifest):
+    f = temp_file(location, '.json', mode='w', encoding='utf-8')
+    try:
+        with f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        write_file(session, location, MANIFEST, f.name)
+    finally:
+        remove_temp(f.name)
+
+def read_manifest(session, location):
+    with open_file(session, location, MANIFEST) as f:
+        return json.loads(f.read().decode('utf-8'))
+
+# --- 항목 형식 변환 ---
+
+def encode_value(value):
+    # 저수준 클라이언트가 bytes로 돌려주는 B/BS만 base64로 바꾸면 나머지는 그대로 JSON
+    (tag, data), = value.items()
+    if tag == 'B':
+        return {'B': base64.b64encode(data).decode('ascii')}
+    if tag == 'BS':
+        return {'BS': [base64.b64encode(v).decode('ascii') for v in data]}
+    if tag == 'L':
+        return {'L': [encode_value(v) for v in data]}
+    if tag == 'M':
+        return {'M': {k: encode_value(v) for k, v in data.items()}}
+    return value
+
+def decode_value(value):
+    (tag, data), = value.items()
+    if tag == 'B':
+        return {'B': base64.b64decode(data)}
+    if tag == 'BS':
+        return {'BS': [base64.b64decode(v) for v in data]}
+    if tag == 'L':
+        return {'L': [decode_value(v) for v in data]}
+    if tag == 'M':
+        return {'M': {k: decode_value(v) for k, v in data.items()}}
+    return value
+
+def encode_item(item):
+    return json.dumps({'Item': {k: encode_value(v) for k, v in item.items()}}, ensure_ascii=False, separators=(',', ':'))
+
+def decode_item(line, deserializer):
+    item = json.loads(line)['Item']
+    return {k: deserializer.deserialize(decode_value(v)) for k, v in item.items()}
+
+# --- 진행 상황 ---
+
+class Progress:
+    """워커가 보낸 (항목 수, 바이트 수) 증가분을 모아 주기적으로 한 줄씩 출력"""
+
+    def __init__(self, label, total_parts, interval=PROGRESS_INTERVAL, stream=None):
+        self.label = label
+        self.total_parts = total_parts
+        self.interval = interval
+        self.stream = stream or sys.stderr
+        self.items = 0
+        self.bytes = 0
+        self.parts = 0
+        self.start = time.monotonic()
+        self.printed = self.start
+
+    def add(self, items, size):
+        self.items += items
+        self.bytes += size
+
+    def finish_part(self):
+        self.parts += 1
+
+    def line(self):
+        elapsed = max(time.monotonic() - self.start, 1e-9)
+        return (f'{self.label}: {self.items:,} items  {self.bytes / 1e6:,.1f} MB  '
+                f'{self.items / elapsed:,.0f} items/s  {self.bytes / 1e6 / elapsed:,.2f} MB/s  '
+                f'{self.parts}/{self.total_parts} done  {elapsed:,.1f}s')
+
+    def tick(self, force=False):
+        now = time.monotonic()
+        if force or now - self.printed >= self.interval:
+            self.printed = now
+            print(self.line(), file=self.stream, flush=True)
+
+    def summary(self):
+        elapsed = time.monotonic() - self.start
+        return {
+            'items': self.items,
+            'bytes': self.bytes,
+            'seconds': round(elapsed, 3),
+            'items_per_second': round(self.items / elapsed, 1) if elapsed else None
+        }
+
+def run_parts(worker, jobs, workers, executor, progress):
+    """jobs를 풀에서 돌리며 워커가 큐로 보내는 진행 상황을 모음. 각 job의 결과 목록을 돌려줌"""
+    if executor == 'process':
+        # fork한 자식은 부모의 boto3 연결/잠금을 물려받으므로 spawn으로 새 인터프리터를 띄움
+        context = multiprocessing.get_context('spawn')
+        manager = context.Manager()
+        updates = manager.Queue()
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=context)
+    else:
+        # 같은 프로세스 안에서 실행 (로컬 DynamoDB/moto 확인용)
+        manager = None
+        updates = queue.Queue()
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [pool.submit(worker, job, updates) for job in jobs]
+        pending = set(futures)
+        while pending:
+            done, pending = concurrent.futures.wait(pending, timeout=0.2)
+            for _ in done:
+                progress.finish_part()
+            while True:
+                try:
+                    items, size = updates.get_nowait()
+                except queue.Empty:
+                    break
+                progress.add(items, size)
+            progress.tick()
+        # 실패한 세그먼트/파일이 있으면 여기서 예외가 남
+        results = [future.result() for future in futures]
+        while not updates.empty():
+            progress.add(*updates.get_nowait())
+        progress.tick(force=True)
+        return results
+    finally:
+        pool.shutdown(cancel_futures=True)
+        if manager is not None:
+            manager.shutdown()
+
+# --- export ---
+
+def segment_name(table, segment, total_segments):
+    return f'{table}-{segment:05d}-of-{total_segments:05d}.json.gz'
+
+def export_segment(job, updates):
+    """Scan 세그먼트 하나를 gzip 줄 단위 JSON 파일로 쓰고 (파일 이름, 항목 수)를 돌려줌"""
+    table, segment, total_segments, location, page_size = job
+    session = new_session()
+    client = session.client('dynamodb', config=client_config())
+    name = segment_name(table, segment, total_segments)
+    params = {'TableName': table, 'Segment': segment, 'TotalSegments': total_segments}
+    if page_size:
+        params['Limit'] = page_size
+    count = 0
+    raw = temp_file(location, '.json.gz')
+    try:
+        with raw, gzip.GzipFile(fileobj=raw, mode='wb') as out:
+            while True:
+                response = client.scan(**params)
+                size = 0
+                for item in response.get('Items', []):
+                    line = (encode_item(item) + '\n').encode('utf-8')
+                    out.write(line)
+                    size += len(line)
+                count += len(response.get('Items', []))
+                updates.put((len(response.get('Items', [])), size))
+                if 'LastEvaluatedKey' not in response:
+                    break
+                params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        write_file(session, location, name, raw.name)
+    finally:
+        # 업로드했거나 실패해 남은 임시 파일을 지움 (로컬로 옮겼으면 이미 없음)
+        remove_temp(raw.name)
+    return name, count
+
+def export_table(table, location, segments, workers, executor='process', page_size=None):
+    progress = Progress(f'export {table}', segments)
+    jobs = [(table, segment, segments, location, page_size) for segment in range(segments)]
+    results = run_parts(export_segment, jobs, workers, executor, progress)
+    session = new_session()
+    key_schema = session.client('dynamodb').describe_table(TableName=table)['Table']['KeySchema']
+    manifest = {
+        'table': table,
+        'format': 'DYNAMODB_JSON',
+        'compression': 'GZIP',
+        'keys': [key['AttributeName'] for key in key_schema],
+        'totalSegments': segments,
+        'exportedAt': int(time.time()),
+        'files': [{'name': name, 'items': count} for name, count in results],
+        'summary': progress.summary()
+    }
+    write_manifest(session, location, manifest)
+    return manifest
+
+# --- import ---
+
+class ThrottleBackoff:
+    """BatchWriteItem이 처리하지 못한 항목을 돌려주면 다음 요청 전에 기다림
+
+    batch_writer는 UnprocessedItems를 다음 배치에 섞어 바로 다시 보내므로, 클라이언트 after-call 훅에서
+    연속으로 남은 횟수만큼 지수적으로(최대 BACKOFF_MAX초) 쉬고, 모두 처리되면 대기를 초기화함.
+    요청 자체가 ProvisionedThroughputExceeded로 실패하면 adaptive 재시도 모드가 보내는 속도를 줄임.
+    """
+
+    def __init__(self, base=BACKOFF_BASE, maximum=BACKOFF_MAX):
+        self.base = base
+        self.maximum = maximum
+        self.streak = 0
+        self.unprocessed = 0
+        self.waited = 0.0
+
+    def install(self, client):
+        client.meta.events.register('after-call.dynamodb.BatchWriteItem', self.after_call)
+
+    def after_call(self, parsed, **kwargs):
+        left = sum(len(requests) for requests in (parsed.get('UnprocessedItems') or {}).values())
+        if not left:
+            self.streak = 0
+            return
+        self.unprocessed += left
+        self.streak += 1
+        delay = min(self.maximum, self.base * 2 ** (self.streak - 1))
+        self.waited += delay
+        time.sleep(delay)
+
+def import_file(job, updates):
+    """내보낸 파일 하나를 batch_writer로 테이블에 쓰고 (파일 이름, 항목 수, 재전송 항목 수, 대기 초)를 돌려줌"""
+    name, location, table, keys = job
+    from boto3.dynamodb.types import TypeDeserializer
+    session = new_session()
+    resource = session.resource('dynamodb', config=client_config())
+    backoff = ThrottleBackoff()
+    backoff.install(resource.meta.client)
+    deserializer = TypeDeserializer()
+    count = 0
+    # 같은 키가 한 배치에 두 번 들어가면 BatchWriteItem이 거부하므로 키로 중복을 없앰
+    with open_file(session, location, name) as raw, resource.Table(table).batch_writer(overwrite_by_pkeys=keys) as batch:
+        pending, size = 0, 0
+        for line in gzip.GzipFile(fileobj=raw, mode='rb'):
+            if not line.strip():
+                continue
+            batch.put_item(Item=decode_item(line, deserializer))
+            count += 1
+            pending += 1
+            size += len(line)
+            if pending >= 100:
+                updates.put((pending, size))
+                pending, size = 0, 0
+        updates.put((pending, size))
+    return name, count, backoff.unprocessed, round(backoff.waited, 3)
+
+def import_table(location, table=None, workers=4, executor='process'):
+    session = new_session()
+    manifest = read_manifest(session, location)
+    table = table or manifest['table']
+    progress = Progress(f'import {table}', len(manifest['files']))
+    jobs = [(entry['name'], location, table, manifest['keys']) for entry in manifest['files']]
+    results = run_parts(import_file, jobs, workers, executor, progress)
+    expected = sum(entry['items'] for entry in manifest['files'])
+    written = sum(count for _, count, _, _ in results)
+    if written != expected:
+        raise RuntimeError(f'imported {written} items but manifest lists {expected}')
+    return dict(
+        progress.summary(),
+        table=table,
+        files=len(results),
+        retried=sum(retried for _, _, retried, _ in results),
+        backoffSeconds=round(sum(waited for _, _, _, waited in results), 3)
+    )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export a DynamoDB table with a parallel segmented Scan to gzip NDJSON files, or load such an export back.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4, help='parallel worker processes')
+    parser.add_argument('--executor', choices=('process', 'thread'), default='process', help='use threads to run against an in-process fake')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export = commands.add_parser('export', help='scan a table into DEST (a directory or s3://bucket/prefix)')
+    export.add_argument('table', help='table name, e.g. HOTPLACE or MEMBER')
+    export.add_argument('dest')
+    export.add_argument('--segments', type=int, help='Scan TotalSegments (default: 2 x workers)')
+    export.add_argument('--page-size', type=int, help='Scan Limit per page, to spread read capacity')
+
+    load = commands.add_parser('import', help='write an export in SOURCE back into a table')
+    load.add_argument('source')
+    load.add_argument('--table', help='target table (default: the exported table)')
+    args = parser.parse_args(argv)
+
+    if args.command == 'export':
+        segments = args.segments or 2 * args.workers
+        if not 1 <= segments <= 1000000:
+            parser.error('--segments must be between 1 and 1000000')
+        result = export_table(args.table, args.dest, segments, min(args.workers, segments), args.executor, args.page_size)
+        result = dict(result['summary'], table=result['table'], files=len(result['files']))
+    else:
+        result = import_table(args.source, args.table, args.workers, args.executor)
+    print(json.dumps(result, ensure_ascii=False))
+
+if __name__ == '__main__':
+    main()